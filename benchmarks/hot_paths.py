@@ -0,0 +1,162 @@
+#!/bin/usr/python3
+"""
+Time the parsing, serializing and checksum paths on synthetic save files of increasing item counts.
+
+Game.to_bytes writes an unchanged game, which returns the bytes it was read from, and Game.to_bytes dirty writes
+every section again from its values.
+
+The results are written as JSON, so two commits can be compared:
+    python benchmarks/hot_paths.py -o before.json
+    python benchmarks/hot_paths.py -o after.json --compare before.json
+"""
+
+# standard imports
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from io import BytesIO
+
+# module imports
+base_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(base_dir, "..")))
+from pyd2s.Attributes import Attributes
+from pyd2s.BitIO import BitIO, BitWriter
+from pyd2s.Game import Game, create_checksum
+from pyd2s.Items import Items, Verification, VERIFY_OFF
+from pyd2s.MagicalProperties import MagicalProperties
+from pyd2s.decorators import Main
+from pyd2s.synthetic import synthetic_game_bytes
+
+
+def benchmarks(data):
+    """Return the name and function of each benchmark, for the bytes of a save file."""
+    game = Game(verification=Verification(VERIFY_OFF))
+    game.from_bytes(data)
+    items = list(game.items)
+
+    # a game whose sections are all written again from their values, as after changing every one of them
+    dirty_game = Game(verification=Verification(VERIFY_OFF))
+    dirty_game.from_bytes(data)
+    for item in list(dirty_game.items) + list(dirty_game.corpse) + list(dirty_game.merc_items):
+        item.dirty = True
+    dirty_game.attributes.original_values = {}
+    dirty_game.original_values = None
+    items_binary = game.items.to_bytes()
+    attributes_binary = game.attributes.to_bytes()
+
+    # every list of magical properties of the items, written on their own
+    property_binaries = []
+    for item in items:
+        if item.magical_props is not None:
+            writer = BitWriter()
+            item.magical_props.to_bitwriter(writer)
+            property_binaries.append(writer.to_bytes())
+
+    def bitio_read():
+        bitio = BitIO(BytesIO(items_binary), rread=True, rvalues=True)
+        for _ in range(len(items_binary) * 8 // 9):
+            bitio.read(9, "bits")
+
+    def item_from_handle():
+        Items(BytesIO(items_binary), verification=Verification(VERIFY_OFF))
+
+    def item_to_bytes():
+        for item in items:
+            item.encode()
+
+    def attributes():
+        Attributes(BytesIO(attributes_binary)).encode()
+
+    def magical_properties():
+        for binary in property_binaries:
+            MagicalProperties(BitIO(BytesIO(binary), rread=True, rvalues=True))
+
+    def checksum():
+        create_checksum(data)
+
+    def game_from_bytes():
+        Game(verification=Verification(VERIFY_OFF)).from_bytes(data)
+
+    def game_to_bytes():
+        game.to_bytes()
+
+    def game_to_bytes_dirty():
+        dirty_game.to_bytes()
+
+    return [
+        ("BitIO.read", bitio_read),
+        ("Item.from_handle", item_from_handle),
+        ("Item.to_bytes", item_to_bytes),
+        ("Attributes", attributes),
+        ("MagicalProperties", magical_properties),
+        ("create_checksum", checksum),
+        ("Game.from_bytes", game_from_bytes),
+        ("Game.to_bytes", game_to_bytes),
+        ("Game.to_bytes dirty", game_to_bytes_dirty),
+    ]
+
+
+def run(counts, repeat, seed):
+    """Time every benchmark for each item count, returning one result per pair."""
+    results = []
+    for count in counts:
+        data = synthetic_game_bytes(seed, count)
+        for name, function in benchmarks(data):
+            # as many calls per measurement as take roughly 0.05 seconds
+            number, _ = timeit.Timer(function).autorange()
+            number = max(1, number // 4)
+            times = [time / number for time in timeit.repeat(function, number=number, repeat=repeat)]
+            results.append(
+                dict(benchmark=name, items=count, bytes=len(data), best=min(times), median=statistics.median(times))
+            )
+    return results
+
+
+def git_commit():
+    try:
+        process = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=base_dir, capture_output=True, text=True)
+        return process.stdout.strip() or None
+    except OSError:
+        return None
+
+
+@Main(
+    (
+        ["-c", "--counts"],
+        dict(default="0,10,100,1000,5000", help="The item counts of the save files, comma separated."),
+    ),
+    (["-r", "--repeat"], dict(default=5, type=int, help="The number of measurements of each benchmark.")),
+    (["-s", "--seed"], dict(default=0, type=int, help="The seed of the synthetic save files.")),
+    (["-o", "--output"], dict(default=None, help="The JSON file to write the results to.")),
+    (["--compare"], dict(default=None, help="A JSON file of earlier results to compare against.")),
+)
+def main(args):
+    counts = [int(count) for count in args.counts.split(",")]
+    report = dict(
+        commit=git_commit(),
+        python=platform.python_version(),
+        machine=platform.machine(),
+        seed=args.seed,
+        results=run(counts, args.repeat, args.seed),
+    )
+
+    earlier = {}
+    if args.compare is not None:
+        with open(args.compare) as f:
+            earlier = {(result["benchmark"], result["items"]): result for result in json.load(f)["results"]}
+
+    print(f'{"benchmark":<20} {"items":>6} {"best":>12} {"per item":>12}  change')
+    for result in report["results"]:
+        per_item = f'{result["best"] / result["items"] * 1e6:9.2f} us' if result["items"] else ""
+        before = earlier.get((result["benchmark"], result["items"]))
+        change = f'{result["best"] / before["best"]:.2f}x' if before else ""
+        print(f'{result["benchmark"]:<20} {result["items"]:>6} {result["best"] * 1e3:9.3f} ms {per_item:>12}  {change}')
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
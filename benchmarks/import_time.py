@@ -0,0 +1,62 @@
+#!/bin/usr/python3
+"""
+Measure how long importing a pyd2s module takes in a fresh interpreter.
+
+Give several source trees to compare them, for example a worktree of an older commit:
+    git worktree add /tmp/pyd2s-before <commit>
+    python benchmarks/import_time.py /tmp/pyd2s-before .
+"""
+
+# standard imports
+import os
+import statistics
+import subprocess
+import sys
+
+# module imports
+base_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(base_dir, "..")))
+from pyd2s.decorators import Main
+
+
+def import_times(tree, module, repeat):
+    """Import the module from the given source tree 'repeat' times, returning the -X importtime reports."""
+    # the working directory comes first on the path of 'python -c', so run from within the tree
+    tree = os.path.abspath(tree)
+    env = dict(os.environ, PYTHONPATH=tree)
+    reports = []
+    for _ in range(repeat):
+        command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+        process = subprocess.run(command, cwd=tree, env=env, capture_output=True, text=True)
+        process.check_returncode()
+
+        # each line: "import time: <self us> | <cumulative us> | <indented name>"
+        report = {}
+        for line in process.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            report[name.strip()] = (int(self_us), int(cumulative_us))
+        reports.append(report)
+    return reports
+
+
+@Main(
+    (["trees"], dict(nargs="*", default=["."], help="The source trees to import from.")),
+    (["-m", "--module"], dict(default="pyd2s.Game", help="The module to import.")),
+    (["-r", "--repeat"], dict(default=15, type=int, help="The number of fresh interpreters per tree.")),
+    (["-t", "--top"], dict(default=8, type=int, help="The number of slowest imports to list.")),
+)
+def main(args):
+    for tree in args.trees:
+        reports = import_times(tree, args.module, args.repeat)
+        totals = [report[args.module][1] / 1000 for report in reports]
+        print(f"{os.path.abspath(tree)}: import {args.module}")
+        print(f"  median {statistics.median(totals):.1f} ms, best {min(totals):.1f} ms ({args.repeat} runs)")
+
+        # the cumulative time of the slowest imports, in the run closest to the median
+        report = sorted(reports, key=lambda report: report[args.module][1])[len(reports) // 2]
+        for name, (_, cumulative) in sorted(report.items(), key=lambda item: -item[1][1])[: args.top]:
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+        print()
+    return 0
@@ -0,0 +1,73 @@
+#!/bin/usr/python3
+"""
+Measure how much memory the parsed items of a synthetic storage file take in a fresh interpreter.
+
+The storage file is written with this tree and parsed with each tree given, so an older commit can be compared:
+    git worktree add /tmp/pyd2s-before <commit>
+    python benchmarks/item_memory.py --items 10000 --trees /tmp/pyd2s-before .
+"""
+
+# standard imports
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# module imports
+base_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(base_dir, "..")))
+from pyd2s.decorators import Main
+from pyd2s.synthetic import synthetic_storage
+
+# parses the storage file 'copies' times while tracing allocations, printing the totals as JSON
+MEASURE = """
+import gc, json, sys, tracemalloc
+from io import BytesIO
+from pyd2s.Items import Items
+
+path, copies = sys.argv[1], int(sys.argv[2])
+with open(path, "rb") as f:
+    data = f.read()
+
+def count(items):
+    return sum(1 + count([socket for socket in item.sockets if socket is not None]) for item in items)
+
+gc.collect()
+tracemalloc.start()
+lists = [Items(BytesIO(data)) for _ in range(copies)]
+gc.collect()
+size, peak = tracemalloc.get_traced_memory()
+items = sum(count(items) for items in lists)
+print(json.dumps(dict(lists=len(lists), items=items, size=size, peak=peak)))
+"""
+
+
+def measure(tree, path, copies):
+    """Parse the storage file with the pyd2s of the given source tree, returning the memory used."""
+    # the working directory comes first on the path of 'python -c', so run from within the tree
+    tree = os.path.abspath(tree)
+    env = dict(os.environ, PYTHONPATH=tree)
+    command = [sys.executable, "-c", MEASURE, os.path.abspath(path), str(copies)]
+    process = subprocess.run(command, cwd=tree, env=env, capture_output=True, text=True)
+    if process.returncode:
+        raise RuntimeError(f"measuring {tree} failed:\n{process.stderr}")
+    return json.loads(process.stdout)
+
+
+@Main(
+    (["-i", "--items"], dict(default=1000, type=int, help="The number of items in the storage file.")),
+    (["-s", "--seed"], dict(default=0, type=int, help="The seed of the synthetic storage file.")),
+    (["-t", "--trees"], dict(nargs="*", default=["."], help="The source trees to parse with.")),
+    (["-c", "--copies"], dict(default=10, type=int, help="The number of times the storage file is kept parsed.")),
+)
+def main(args):
+    with tempfile.TemporaryDirectory() as directory:
+        path = synthetic_storage(os.path.join(directory, "storage.d2i"), args.seed, args.items).file_path
+        for tree in args.trees:
+            result = measure(tree, path, args.copies)
+            print(f"{os.path.abspath(tree)}: {result['lists']} lists, {result['items']} items")
+            print(f"  {result['size'] / 1e6:.2f} MB retained, {result['peak'] / 1e6:.2f} MB peak")
+            print(f"  {result['size'] / max(result['items'], 1):.0f} bytes per item")
+            print()
+    return 0
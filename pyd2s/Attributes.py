@@ -4,11 +4,52 @@ import os
 from io import BytesIO
 
 # module imports
-from pyd2s.BitIO import BitIO
+from pyd2s.BitIO import BitIO, BitWriter
+from pyd2s.Metrics import metrics
+from pyd2s.decorators import Timed
 from pyd2s.utilities import bytes2hexstrs
 
 
+# the flag that ends the attributes
+END_FLAG = 0x1FF
+
+
+class UnknownAttributeError(ValueError):
+    """An attribute flag that is not in the specification was read, usually from a corrupt or misaligned file."""
+
+    def __init__(self, flag, position):
+        self.flag = flag
+        self.position = position
+        super(UnknownAttributeError, self).__init__(f"Unknown attribute flag {flag} at bit {position}")
+
+
+def compile_decoders(specification):
+    """Return the (name, bit length) of each attribute, indexed by its 9 bit flag (None for unknown flags)."""
+    decoders = [None] * (END_FLAG + 1)
+    for flag, name, length, _ in specification:
+        decoders[flag] = (name, length)
+    return decoders
+
+
+def fixed_point(name, divisor):
+    """Return a property viewing an attribute stored in fixed point, in 1/divisor units, as a float."""
+
+    def get(self):
+        return self[name] / divisor
+
+    def set(self, value):
+        self[name] = round(value * divisor)
+
+    return property(get, set, doc=f"The {name.replace('_', ' ')} as shown in game, from the exact self[{name!r}].")
+
+
 class Attributes(dict):
+    """
+    The attributes of a character, keyed by name.
+
+    Every value is kept as the exact integer stored in the save file: life, mana and stamina are in 1/256 units,
+    with properties of the same names viewing them as floats (attributes.life_max == attributes["life_max"] / 256).
+    """
 
     MAGIC = b"gf"
     MAGIC_LENGTH = 2
@@ -32,6 +73,10 @@ class Attributes(dict):
         (15, "gold_stash", 25, None),
     ]
 
+    DECODERS = compile_decoders(SPECIFICATION)
+    DIVISORS = {name: divisor for _, name, _, divisor in SPECIFICATION if divisor is not None}
+
+    @Timed("parse.attributes")
     def __init__(self, handle):
 
         start = handle.tell()
@@ -42,59 +87,66 @@ class Attributes(dict):
         for _, flag_string, _, _ in self.SPECIFICATION:
             self[flag_string] = 0
 
+        # each flag is followed by the value of the attribute it is the index of in the decoders
         self.bitio = BitIO(handle, rread=True, rvalues=True)
-        while True:
-
-            flag = self.bitio.read(9, "bits")
-            if flag == 0x1FF:
-                break
-
-            for flag_int, flag_string, length, divisor in self.SPECIFICATION:
-                if flag != flag_int:
-                    continue
-                value = self.bitio.read(length, "bits")
-                if divisor is not None:
-                    value /= divisor
-                self[flag_string] = value
+        read = self.bitio.read_lsb
+        decoders = self.DECODERS
+        flag = read(9)
+        while flag != END_FLAG:
+            decoder = decoders[flag]
+            if decoder is None:
+                raise UnknownAttributeError(flag, self.bitio.consumed - 9)
+            flag_string, length = decoder
+            self[flag_string] = read(length)
+            flag = read(9)
 
         end = handle.tell()
         handle.seek(start)
         self.original = handle.read(end - start)
-        assert self.original == self.to_bytes()
-
+        self.original_values = dict(self)
+        if metrics.enabled:
+            metrics.count("bits_read", 8 * (end - start))
+        assert self.original == self.encode()
+
+    def view(self, key):
+        """Return the value of an attribute as shown in game, with values stored in fixed point as floats."""
+        divisor = self.DIVISORS.get(key)
+        return self[key] if divisor is None else self[key] / divisor
+
+    def views(self):
+        """Return the value of every attribute as shown in game."""
+        return {key: self.view(key) for key in self}
+
+    @property
+    def is_dirty(self):
+        """Whether any of the attributes has changed since they were read."""
+        return self != self.original_values
+
+    @Timed("encode.attributes")
     def to_bytes(self):
+        # attributes that have not been changed are written back as they were read
+        if not self.is_dirty:
+            return self.original
+        return self.encode()
 
-        handle = BytesIO()
-        for flag_int, flag_string, bit_length, divisor in self.SPECIFICATION:
+    def encode(self):
+
+        writer = BitWriter(self.MAGIC)
+        for flag_int, flag_string, bit_length, _ in self.SPECIFICATION:
 
             # skip empty values
-            if self[flag_string] == 0:
+            value = self[flag_string]
+            if value == 0:
                 continue
 
-            handle.write("{:b}".format(flag_int).rjust(9, "0")[::-1].encode())
+            writer.write(flag_int, 9)
+            writer.write(int(value), bit_length)
 
-            value = self[flag_string]
-            if divisor is not None:
-                value *= divisor
+        # exit flag
+        writer.write(END_FLAG, 9)
+        return writer.to_bytes()
 
-            handle.write("{:b}".format(int(value)).rjust(bit_length, "0")[::-1].encode())
 
-        # exit flag
-        handle.write(b"1" * 9)
-
-        # pad the ending
-        _, remainder = divmod(handle.tell(), 8)
-        if remainder != 0:
-            handle.write(b"0" * (8 - remainder))
-        handle.seek(0)
-
-        bio = BytesIO()
-        bio.write(self.MAGIC)
-
-        # write each reversed 'byte' to bio and return the result
-        data = handle.read(8)
-        while len(data) != 0:
-            bio.write(int(data[::-1], 2).to_bytes(1, "little"))
-            data = handle.read(8)
-        bio.seek(0)
-        return bio.read()
+# a property of the same name viewing each attribute stored in fixed point, such as attributes.life_max
+for name, divisor in Attributes.DIVISORS.items():
+    setattr(Attributes, name, fixed_point(name, divisor))
@@ -1,9 +1,5 @@
-# standard imports
-from io import BytesIO
-
 # module imports
-from pyd2s.decorators import debug
-from pyd2s.utilities import binstring, rbits
+from pyd2s.utilities import REVERSED_BYTES, reverse_bits
 
 
 UNIT_LENGTHS = {
@@ -19,74 +15,104 @@ UNIT_LENGTHS = {
     "longs": 32,
 }
 
+BYTE_UNITS = ("byte", "bytes", "char", "chars")
+
 
 class BitIO(object):
+    """
+    Read and write values that are not aligned to byte boundaries.
+
+    Bits are held in python integers in stream order: the next bit of the stream is always bit 0 of the
+    pending buffer. When 'rread' is set, the bits of each byte in the handle are taken least significant first,
+    otherwise most significant first. When 'rvalues' is set, the first bit taken from the stream is the least
+    significant bit of the resulting value, otherwise it is the most significant bit.
+    """
+
     def __init__(self, handle=None, rread=False, rvalues=False):
 
         self.handle = handle
         self.rread = rread
         self.rvalues = rvalues
-        self.binio = BytesIO()
+
+        # bits pulled from the handle that have not been read yet
+        self.buffer = 0
         self.remaining = 0
 
-    def _require(self, count):
+        # every byte pulled from the handle and the number of bits consumed from them
+        self.pulled = bytearray()
+        self.consumed = 0
 
-        ph = self.binio.tell()
-        self.binio.seek(ph + self.remaining)
-        while self.remaining < count:
-            bs = binstring(self.handle.read(1), 1)
-            self.binio.write(bs[::-1] if self.rread else bs)
-            # s = '{:08b}'.format(ord(self.handle.read(1)))
-            # self.binio.write((s[::-1] if self.rread else s).encode())
-            self.remaining += 8
+        # bits given to 'write'
+        self.written = 0
+        self.written_length = 0
 
-        self.binio.seek(ph)
+    def _require(self, count):
+
+        # pull only the whole bytes needed, so the handle is left at the end of the last byte used
+        needed = count - self.remaining
+        if needed <= 0:
+            return
+
+        size = (needed + 7) >> 3
+        data = self.handle.read(size)
+        if len(data) != size:
+            raise EOFError("Unable to read %d bytes from the handle." % size)
+
+        self.pulled += data
+        if not self.rread:
+            data = data.translate(REVERSED_BYTES)
+        self.buffer |= int.from_bytes(data, "little") << self.remaining
+        self.remaining += size << 3
+
+    def _take(self, count):
+        """Remove the next 'count' bits from the pending buffer, returned with the first bit least significant."""
+        if self.remaining < count:
+            self._require(count)
+        value = self.buffer & ((1 << count) - 1)
+        self.buffer >>= count
+        self.remaining -= count
+        self.consumed += count
+        return value
 
     def end_byte(self):
 
+        # skip the bits left in the last byte pulled from the handle, which are written back as zeros
         if 0 < self.remaining:
-            self.binio.write(b"0" * self.remaining)
+            kept = 8 - self.remaining
+            self.pulled[-1] &= (1 << kept) - 1 if self.rread else (0xFF << self.remaining) & 0xFF
+            self.consumed += self.remaining
+            self.buffer = 0
             self.remaining = 0
 
     def read(self, count, unit):
 
         assert self.handle is not None, "This object requires a handle to read."
 
-        if unit not in UNIT_LENGTHS.keys():
+        if unit not in UNIT_LENGTHS:
             raise Exception("Invalid unit: %s" % unit)
 
         required = count * UNIT_LENGTHS[unit]
-        self._require(required)
-
-        self.remaining -= required
-        data = self.binio.read(required)
-
-        # convert to integer
-        if unit in ("bit", "bits", "short", "shorts", "long", "longs"):
-            result = int(data, 2)
-            if self.rvalues:
-                result = rbits(result, required)
+        value = self._take(required)
 
         # convert to bytes
-        elif unit in ("byte", "bytes", "char", "chars"):
+        if unit in BYTE_UNITS:
+            result = value.to_bytes(count, "little")
+            if not self.rvalues:
+                result = result.translate(REVERSED_BYTES)
+            return result
 
-            # result = data
-            if self.rvalues:
-                result = b"".join(int(data[i : i + 8][::-1], 2).to_bytes(1, "little") for i in range(0, len(data), 8))
-            else:
-                result = b"".join(int(data[i : i + 8], 2).to_bytes(1, "little") for i in range(0, len(data), 8))
+        # convert to integer
+        if self.rvalues:
+            return value
+        return reverse_bits(value, required)
 
-        # unknown
-        else:
-            raise Exception("Unrecognized unit: %s" % unit)
-
-        return result
+    def read_lsb(self, count):
+        """Read 'count' bits as an integer whose least significant bit is the first bit read, whatever 'rvalues' is."""
+        return self._take(count)
 
     def read_bits(self, count):
 
-        self._require(count)
-        self.remaining -= count
-        return int(self.binio.read(count), 2)
+        return reverse_bits(self._take(count), count)
 
     def read_bytes(self, count):
 
@@ -103,35 +129,61 @@ class BitIO(object):
 
     def to_bytes(self):
 
-        # set a placeholder and prepare to read through the end of the last byte
-        ph = self.binio.tell()
-        self.end_byte()
-        self.binio.seek(0)
-
-        # prepare a place to write the bytes
-        result = BytesIO()
-        data = self.binio.read(8)
-        while 0 < len(data):
-            if self.rread:
-                data = data[::-1]
-            dint = int(data, 2)
-            dbytes = dint.to_bytes(1, "little")
-            result.write(dbytes)
-            data = self.binio.read(8)
-
-        # return the bytes
-        self.binio.seek(ph)
-        result.seek(0)
-        return result.read()
+        # the bits consumed from the handle, followed by each of the written bits
+        consumed = int.from_bytes(self.pulled if self.rread else self.pulled.translate(REVERSED_BYTES), "little")
+        stream = (consumed & ((1 << self.consumed) - 1)) | (self.written << self.consumed)
+
+        # pad through the end of the last byte
+        length = max(len(self.pulled), (self.consumed + self.written_length + 7) >> 3)
+        result = stream.to_bytes(length, "little")
+        if not self.rread:
+            result = result.translate(REVERSED_BYTES)
+        return result
 
     def write(self, value, count, unit):
 
         # determine how long the information that we are supposed to write is
         length = count * UNIT_LENGTHS[unit]
 
-        # create a binary string of the specified length, given the value
-        bs = binstring(value, length)
-        if self.rvalues:
-            bs = bs[::-1]
-        self.binio.write(bs)
+        # values are placed into the stream least significant bit first when 'rvalues' is set
+        if isinstance(value, bytes):
+            value = int.from_bytes(value, "big")
+        value &= (1 << length) - 1
+        if not self.rvalues:
+            value = reverse_bits(value, length)
+        self.written |= value << self.written_length
+        self.written_length += length
         return length
+
+
+class BitWriter(object):
+    """
+    Write values least significant bit first, the way items and attributes are stored in save files.
+
+    The bits are gathered in a python integer and converted to bytes once, into a buffer allocated at its final
+    size, instead of building strings of ones and zeros.
+    """
+
+    def __init__(self, prefix=b""):
+
+        self.prefix = prefix
+        self.value = 0
+        self.length = 0
+
+    def write(self, value, length):
+        """Append the lowest 'length' bits of an integer value."""
+        self.value |= (value & ((1 << length) - 1)) << self.length
+        self.length += length
+
+    def to_binstring(self):
+        """Return the written bits as a string of ones and zeros, in stream order."""
+        return format(self.value, "0%db" % self.length)[::-1] if self.length else ""
+
+    def to_bytes(self):
+        """Return the prefix followed by the written bits, padded with zeros through the end of the last byte."""
+        start = len(self.prefix)
+        size = (self.length + 7) >> 3
+        result = bytearray(start + size)
+        result[:start] = self.prefix
+        result[start:] = self.value.to_bytes(size, "little")
+        return bytes(result)
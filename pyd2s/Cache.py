@@ -0,0 +1,170 @@
+# standard imports
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from io import BytesIO
+
+# module imports
+from pyd2s.Game import Game
+from pyd2s.Items import Items
+from pyd2s.utilities import cache_dir
+
+
+DEFAULT_CACHE_PATH = os.path.join(cache_dir, "parsed.sqlite3")
+
+# the most bytes of parsed objects kept before the least recently used ones are removed
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024
+
+# changed whenever the classes that are stored change, so entries stored by older versions are dropped
+CACHE_VERSION = 4
+
+# the kinds of objects a file can be parsed into
+CACHE_GAME = "game"
+CACHE_ITEMS = "items"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest BLOB NOT NULL,
+    kind TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used REAL NOT NULL,
+    PRIMARY KEY (digest, kind)
+);
+CREATE INDEX IF NOT EXISTS entries_used ON entries (used);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest BLOB NOT NULL,
+    PRIMARY KEY (path, kind)
+);
+"""
+
+
+def parse_game(data):
+    game = Game()
+    game.from_bytes(data)
+    return game
+
+
+def parse_items(data):
+    return Items(BytesIO(data))
+
+
+PARSERS = {CACHE_GAME: parse_game, CACHE_ITEMS: parse_items}
+
+
+class Cache(object):
+    """
+    The objects parsed from save and storage files, kept in an SQLite database so a file that has not changed is
+    loaded without being parsed again.
+
+    Entries are keyed by the blake2b digest of the bytes of a file, so a file that is copied or touched is still
+    found. The modification time and size of each path are remembered with the digest it last had, so an unchanged
+    file is not even read. The least recently used entries are removed once they take more than 'max_size' bytes.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_size=DEFAULT_CACHE_SIZE):
+
+        self.path = path
+        self.max_size = max_size
+        self.hits, self.misses = 0, 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self.connection = sqlite3.connect(path)
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            self.connection.executescript("DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS files;")
+            self.connection.execute(f"PRAGMA user_version = {CACHE_VERSION}")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type=None, exc_value=None, exc_traceback=None):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def load(self, path, kind):
+        """Return the object of the given kind parsed from a file, parsing it only when it is not in the cache."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        db = self.connection
+
+        # a path with the same modification time and size is assumed to have the same contents
+        row = db.execute(
+            "SELECT entries.digest, data FROM files JOIN entries USING (digest, kind) "
+            "WHERE path = ? AND kind = ? AND mtime = ? AND files.size = ?",
+            (path, kind, stat.st_mtime_ns, stat.st_size),
+        ).fetchone()
+
+        if row is None:
+            with open(path, "rb") as f:
+                data = f.read()
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            row = db.execute(
+                "SELECT digest, data FROM entries WHERE digest = ? AND kind = ?", (digest, kind)
+            ).fetchone()
+            db.execute(
+                "INSERT OR REPLACE INTO files (path, kind, mtime, size, digest) VALUES (?, ?, ?, ?, ?)",
+                (path, kind, stat.st_mtime_ns, stat.st_size, digest),
+            )
+
+            if row is None:
+                self.misses += 1
+                parsed = PARSERS[kind](data)
+                stored = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+                db.execute(
+                    "INSERT OR REPLACE INTO entries (digest, kind, data, size, used) VALUES (?, ?, ?, ?, ?)",
+                    (digest, kind, stored, len(stored), time.time()),
+                )
+                self.evict()
+                db.commit()
+                return parsed
+
+        self.hits += 1
+        db.execute("UPDATE entries SET used = ? WHERE digest = ? AND kind = ?", (time.time(), row[0], kind))
+        db.commit()
+        return pickle.loads(row[1])
+
+    def load_game(self, path):
+        """Return the Game parsed from a save file."""
+        return self.load(path, CACHE_GAME)
+
+    def load_items(self, path):
+        """Return the Items parsed from a storage file."""
+        return self.load(path, CACHE_ITEMS)
+
+    @property
+    def size(self):
+        """The number of bytes taken by the stored objects."""
+        return self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def evict(self):
+        """Remove the least recently used entries until the rest fit within the size limit."""
+        db = self.connection
+        total = self.size
+        if total <= self.max_size:
+            return
+
+        for digest, kind, size in db.execute("SELECT digest, kind, size FROM entries ORDER BY used").fetchall():
+            db.execute("DELETE FROM entries WHERE digest = ? AND kind = ?", (digest, kind))
+            total -= size
+            if total <= self.max_size:
+                break
+        db.execute("DELETE FROM files WHERE NOT EXISTS (SELECT 1 FROM entries WHERE digest = files.digest)")
+
+    def clear(self):
+        """Remove every entry from the cache."""
+        self.connection.execute("DELETE FROM entries")
+        self.connection.execute("DELETE FROM files")
+        self.connection.commit()
@@ -1,8 +1,9 @@
 # standard imports
 import binascii
 import logging
-import numpy
+import mmap
 import os
+import re
 import struct
 
 from io import BytesIO
@@ -11,8 +12,10 @@ from io import BytesIO
 # module imports
 from pyd2s.Attributes import Attributes
 from pyd2s.BitIO import BitIO
-from pyd2s.Items import Items
+from pyd2s.Items import Items, Verification
+from pyd2s.Metrics import metrics
 from pyd2s.constants import CLASS_STRINGS
+from pyd2s.decorators import Timed
 from pyd2s.utilities import get_character_files, bytes2hexstrs, get_character_save_file, peek
 
 
@@ -21,29 +24,99 @@ from pyd2s.utilities import get_character_files, bytes2hexstrs, get_character_sa
 #
 
 
+CHECKSUM_MASK = 0xFFFFFFFF
+
+# the number of bytes checksummed by each vectorized pass, and the number of bytes stepped one at a time
+# whenever a pass cannot be trusted (which keeps the running sums well within 64 bits)
+CHECKSUM_CHUNK = 4096
+CHECKSUM_FALLBACK = 64
+
+# the rotation and weight of each byte in a chunk, created with the first checksum so numpy is imported only then
+CHECKSUM_ROTATIONS = None
+CHECKSUM_WEIGHTS = None
+
+
+class ChecksumError(ValueError):
+    """The checksum stored in a save file does not match the checksum of its contents."""
+
+
+def checksum_step(data, value=0):
+    """Run the rotate-left-and-add checksum over each byte in data, one at a time."""
+    for byte in data:
+        value = (((value << 1) | (value >> 31)) + byte) & CHECKSUM_MASK
+    return value
+
+
+def checksum(data, value=0):
+    """
+    Return the unsigned 32 bit rotate-left-and-add checksum of data, starting from the given value.
+
+    Rotating a 32 bit value left by one is the same as doubling it modulo 2**32 - 1, so as long as no
+    addition carries out of the top bit, the running value before byte n of a chunk is
+    2**n * (value + sum(byte_i * 2**-(i + 1))) modulo 2**32 - 1. That is computed for the whole chunk at once,
+    and the chunk is only trusted up to the first byte whose addition carries or whose running value is
+    ambiguous (0 and 2**32 - 1 are the same modulo 2**32 - 1). From there, a few bytes are stepped exactly.
+    """
+    global CHECKSUM_ROTATIONS, CHECKSUM_WEIGHTS
+    import numpy
+
+    if CHECKSUM_ROTATIONS is None:
+        CHECKSUM_ROTATIONS = numpy.arange(CHECKSUM_CHUNK, dtype=numpy.uint64) % numpy.uint64(32)
+        CHECKSUM_WEIGHTS = numpy.left_shift(numpy.uint64(1), (numpy.uint64(31) - CHECKSUM_ROTATIONS) % numpy.uint64(32))
+
+    data = numpy.frombuffer(data, dtype=numpy.uint8)
+    position, length = 0, len(data)
+    while position < length:
+
+        chunk = data[position : position + CHECKSUM_CHUNK]
+        count = len(chunk)
+
+        # the running value (modulo 2**32 - 1) before each byte of the chunk is added
+        sums = numpy.zeros(count, dtype=numpy.uint64)
+        numpy.cumsum(chunk[:-1] * CHECKSUM_WEIGHTS[: count - 1], out=sums[1:])
+        sums = (sums % numpy.uint64(CHECKSUM_MASK) + numpy.uint64(value)) % numpy.uint64(CHECKSUM_MASK)
+        rotations = CHECKSUM_ROTATIONS[:count]
+        values = ((sums << rotations) | (sums >> (numpy.uint64(32) - rotations))) & numpy.uint64(CHECKSUM_MASK)
+        values[0] = value
+
+        # find the first byte where the closed form cannot be trusted
+        rotated = ((values << numpy.uint64(1)) | (values >> numpy.uint64(31))) & numpy.uint64(CHECKSUM_MASK)
+        unsafe = rotated + chunk > CHECKSUM_MASK
+        unsafe[1:] |= values[1:] == 0
+        first = int(numpy.argmax(unsafe))
+
+        if not unsafe[first]:
+            value = (int(rotated[-1]) + int(chunk[-1])) & CHECKSUM_MASK
+            position += count
+            continue
+
+        # an ambiguous value can be recomputed exactly from the byte before it
+        if first and values[first] == 0:
+            first -= 1
+
+        # the bytes stepped are taken from the data, so they continue past the end of the chunk
+        stepped = data[position + first : position + first + CHECKSUM_FALLBACK]
+        value = checksum_step(stepped.tolist(), int(values[first]))
+        position += first + len(stepped)
+
+    return value
+
+
+@Timed("checksum")
 def create_checksum(binary_data, offset=12):
     """
 	Given binary data (bytes), create a crc and inject it into the bytes,
 	returning the bytes with a fixed checksum.
 	"""
+    view = memoryview(binary_data)
 
-    def checksum(data, start_value=0):
-        acc = numpy.int32(start_value)
-        for value in data:
-            acc = numpy.int32((acc << 1) + value + (acc < 0))
-        return numpy.int32(acc)
-
-    # old: data = numpy.fromstring(binary_data, dtype=numpy.uint8)
-    data = numpy.frombuffer(binary_data, dtype=numpy.uint8)
-    checksum_byte_length = numpy.dtype("int32").itemsize
-    pre_data, post_data = data[:offset], data[offset + checksum_byte_length :]
-
-    # generate checksums
-    pre_checksum = checksum(pre_data, start_value=0)
-    on_checksum = checksum(numpy.zeros(checksum_byte_length, dtype=numpy.uint8), start_value=pre_checksum)
-    post_checksum = checksum(post_data, start_value=on_checksum)
+    # the checksum is calculated as if its own four bytes were zero
+    value = checksum(view[:offset])
+    value = checksum(bytes(4), value)
+    value = checksum(view[offset + 4 :], value)
 
-    return post_checksum
+    # return the signed form that the checksum is stored in
+    return value - 0x100000000 if value & 0x80000000 else value
 
 
 def create_checksum_bytes(binary_data, offset=12):
@@ -55,20 +128,140 @@ def patch_checksum(binary_data):
     return binary_data[:12] + checksum_bytes + binary_data[16:]
 
 
+def verify_checksum(binary_data, offset=12):
+    """Determine whether the checksum stored in the binary data matches its contents."""
+    return bytes(binary_data[offset : offset + 4]) == create_checksum_bytes(binary_data, offset)
+
+
+#
+# 	header
+#
+
+# the character information at the beginning of every save file
+CHARACTER_HEADER_FORMAT = (
+    "<"
+    # 4 byte magic, 4 byte file version, 4 byte file size, 4 byte checksum, 4 byte active weapon
+    "4sIIII"
+    # 16 byte name filled with null characters, 1 byte status, 1 byte progression
+    "16scc"
+    # 2 unk bytes, 1 byte class, 2 unk bytes (b'\x10\x1e'), 1 byte clvl
+    # (the level is only used for display when on the character loading screen, alter experience to change levels)
+    "2xb2xb"
+    # 4 unk bytes (\x00), last_played, 4 unk bytes (\xff)
+    "4xI4x"
+    # 64 bytes assigned skills, 16 bytes button skills
+    "64sIIII"
+    # 32 bytes appearance, 3 bytes difficulty, 4 bytes map id, 2 unknown
+    "32s3sI2x"
+    # mercenary: 2 bytes dead, 4 id, 2 bytes name, 2 bytes type, 4 bytes experience
+    "HIHHI"
+)
+CHARACTER_HEADER = struct.Struct(CHARACTER_HEADER_FORMAT)
+
+# the fixed size header at the beginning of every save file, decoded at once
+# (144 bytes (\x00), 298 bytes (quests), 81 bytes (waypoints), 51 bytes (npc intros))
+HEADER = struct.Struct(CHARACTER_HEADER_FORMAT + "144x298s81s51s")
+
+# char_status bits:
+# 	7: ?
+# 	6: ladder
+# 	5: expansion
+# 	4: ?
+# 	3: died (present when a character has died at least once)
+# 	2: hardcore
+# 	1: ?
+# 	0: ?
+# char_progress value: (classic: standard, hardcore) -- (expansion: standard, hardcore)
+# 	0-3: -
+# 	4-7: sir/dame, count/countess -- slayer, destroyer
+# 	8-11: lord/lady, duke/duchess -- champion, conqueror
+# 	12: baron/baroness, king/queen -- guardian
+HEADER_FIELDS = (
+    "magic",
+    "file_version",
+    "file_size",
+    "file_checksum",
+    "active_weapon",
+    "char_name",
+    "char_status",
+    "char_progression",
+    "char_class",
+    "char_level",
+    "last_played",
+    "assigned_skills",
+    "lmb_skill",
+    "rmb_skill",
+    "lmb_skill_swp",
+    "rmb_skill_swp",
+    "char_menu_appearance",
+    "difficulty",
+    "map_id",
+    "merc_dead",
+    "merc_id",
+    "merc_name_id",
+    "merc_type",
+    "merc_exp",
+    "quests",
+    "waypoints",
+    "npc_intros",
+)
+
+
+def field_layout(layout, fields):
+    """Return the offset, size, and struct format of each named field of a struct, in the order they are packed."""
+    offsets = {}
+    names = iter(fields)
+    position = 0
+    for count, code in re.findall(r"(\d*)([a-zA-Z?])", layout.format):
+        count = int(count) if count else 1
+        size = struct.calcsize("<" + code)
+        if code == "x":
+            position += count
+        elif code == "s":
+            offsets[next(names)] = (position, count, f"<{count}s")
+            position += count
+        else:
+            for _ in range(count):
+                offsets[next(names)] = (position, size, "<" + code)
+                position += size
+    assert position == layout.size
+    return offsets
+
+
+# the offset, size, and format of each field in the header, for changing them in place
+HEADER_LAYOUT = field_layout(HEADER, HEADER_FIELDS)
+HEADER_OFFSETS = {name: (offset, size) for name, (offset, size, _) in HEADER_LAYOUT.items()}
+
+# the header fields that are managed by the save file itself
+MANAGED_FIELDS = frozenset(["magic", "file_size", "file_checksum"])
+
+
+def read_header(path):
+    """Read and decode only the character information at the beginning of a save file."""
+    with open(path, "rb") as f:
+        return Game.peek_header(f.read(CHARACTER_HEADER.size))
+
+
 class Game(object):
 
     MAGIC = b"\x55\xaa\x55\xaa"
     MERCENARY_MAGIC = b"jf"
     GOLEM_MAGIC = b"kf"
 
-    def __init__(self, character=None):
+    def __init__(self, character=None, verification=None):
 
         self.character = character
         self.file_path = None if character is None else get_character_save_file(character)
         self.original_binary = None
 
+        # the values read from the header and the sections that are stored as bytes
+        self.original_values = None
+
+        # the policy used to check that each item read can be written back, shared by all of the item lists
+        self.verification = Verification() if verification is None else verification
+
         self.merc_id = 0
-        self.merc_items = Items()
+        self.merc_items = Items(verification=self.verification)
 
         # the remaining, unknown part of the save file
         self.has_golem_suffix = False
@@ -84,97 +277,50 @@ class Game(object):
         if exc_type is None:
             self.to_file(self.file_path)
 
-    def from_file(self, path=None):
+    def from_file(self, path=None, verify=False, lazy=False, cache=None):
         if path is None:
             path = self.file_path
         assert path is not None, "A file path was not given and this object has no file_path."
-        with open(path, "rb") as f:
-            self.from_bytes(f.read())
-
-    def from_bytes(self, binary):
-
-        self.original_binary = binary
-        bio = BytesIO(binary)
-
-        magic = bio.read(4)
-        assert self.MAGIC == magic, 'Invalid Magic: "{}"'.format(magic.hex())
-
-        # 4 byte file version, 4 byte file size, 4 byte checksum, 4 byte active weapon
-        self.file_version, self.file_size, self.file_checksum, self.active_weapon = struct.unpack("<IIII", bio.read(16))
-
-        # 16 byte name filled with null characters, 1 byte status, 1 byte progression
-        name = bio.read(16)
-        self.char_name = name[: name.find(b"\x00")]
-        self.char_status = bio.read(1)
-        self.char_progression = bio.read(1)
-        # logging.debug('Character name: %s', self.char_name)
-        # char_status bits:
-        # 	7: ?
-        # 	6: ladder
-        # 	5: expansion
-        # 	4: ?
-        # 	3: died (present when a character has died at least once)
-        # 	2: hardcore
-        # 	1: ?
-        # 	0: ?
-        # logging.debug('Character status: %s', self.char_status)
-        # char_progress value: (classic: standard, hardcore) -- (expansion: standard, hardcore)
-        # 	0-3: -
-        # 	4-7: sir/dame, count/countess -- slayer, destroyer
-        # 	8-11: lord/lady, duke/duchess -- champion, conqueror
-        # 	12: baron/baroness, king/queen -- guardian
-        # logging.debug('Character progression: %s', self.char_progression)
-
-        # 2 unk bytes, 1 byte class, 2 unk bytes (b'\x10\x1e'), 1 byte clvl
-        # logging.debug('Unknown: %s', bio.read(2))
-        bio.read(2)
-        self.char_class = struct.unpack("<b", bio.read(1))[0]
-        # logging.debug('Unknown: %s', bio.read(2))
-        bio.read(2)
 
-        # this attribute is only used for display when on the character loading screen
-        # alter experience to change levels
-        self.char_level = struct.unpack("<b", bio.read(1))[0]
+        # a game parsed before is taken from the cache, keeping the character, path and policy of this one
+        if cache is not None and not lazy:
+            game = cache.load_game(path)
+            if verify:
+                self.check_checksum(game.original_binary)
+            for name in ("character", "file_path", "verification"):
+                del game.__dict__[name]
+            self.__dict__.update(game.__dict__)
+            return
 
-        # 4 unk bytes (\x00), last_played, 4 unk bytes (\xff)
-        # _, self.last_played, _ = struct.unpack('<III', bio.read(12))
-        # logging.debug('Unknown: %s', bio.read(4))
-        bio.read(4)
-        self.last_played = struct.unpack("<I", bio.read(4))[0]
-        # logging.debug('Unknown: %s', bio.read(4))
-        bio.read(4)
+        with open(path, "rb") as f:
+            self.from_bytes(f.read(), verify=verify, lazy=lazy)
 
-        # 64 bytes assigned skills
-        self.assigned_skills = bio.read(64)
+    @staticmethod
+    def check_checksum(binary):
+        """Raise a ChecksumError if the checksum stored in a save file does not match its contents."""
+        if not verify_checksum(binary):
+            expected = create_checksum_bytes(binary)
+            raise ChecksumError(f"Invalid checksum: {binary[12:16].hex()} (expected {expected.hex()})")
 
-        # 16 bytes button skills
-        self.lmb_skill, self.rmb_skill, self.lmb_skill_swp, self.rmb_skill_swp = struct.unpack("<IIII", bio.read(16))
+    @Timed("parse.game")
+    def from_bytes(self, binary, verify=False, lazy=False):
 
-        # 32 bytes appearance, 3 bytes difficulty, 4 bytes map id, 2 unknown
-        self.char_menu_appearance = bio.read(32)
-        self.difficulty = bio.read(3)
-        self.map_id = struct.unpack("<I", bio.read(4))[0]
-        # logging.debug('Unknown: %s', bio.read(2))
-        bio.read(2)
+        # reject corrupt files before any parsing is done
+        if verify:
+            self.check_checksum(binary)
 
-        # mercenary: 2 bytes dead, 4 id, 2 bytes name, 2 bytes type, 4 bytes experience
-        self.merc_dead, self.merc_id, self.merc_name_id, self.merc_type, self.merc_exp = struct.unpack(
-            "<HIHHI", bio.read(14)
-        )
-
-        # 144 bytes (\x00), 298 bytes (self.quests), 81 bytes (self.waypoints), 51 bytes (npc intros)
-        # logging.debug('Unknown: %s', bio.read(144))
-        bio.read(144)
-        self.quests = bio.read(298)
-        self.waypoints = bio.read(81)
-        self.npc_intros = bio.read(51)
+        self.original_binary = binary
+        header = self.peek_header(binary)
+        self.__dict__.update(header)
 
         # HEADER COMPLETE
+        bio = BytesIO(binary)
+        bio.seek(HEADER.size)
 
         self.attributes = Attributes(handle=bio)
         self.char_skills = bio.read(32)
-        self.items = Items(bio)
-        self.corpse = Items(bio)
+        self.items = Items(bio, lazy=lazy, verification=self.verification)
+        self.corpse = Items(bio, lazy=lazy, verification=self.verification)
 
         # if this character is an expansion character, they might also have a mercenary
         magic = bio.read(2)
@@ -182,7 +328,7 @@ class Game(object):
 
             if magic == self.MERCENARY_MAGIC:
                 if self.merc_id:
-                    self.merc_items = Items(bio)
+                    self.merc_items = Items(bio, lazy=lazy, verification=self.verification)
             elif magic == self.GOLEM_MAGIC:
                 self.has_golem_suffix = True
                 self.has_golem = bio.read(1)
@@ -194,6 +340,34 @@ class Game(object):
             print("END:")
             print(self.end)
 
+        header.update(
+            char_skills=self.char_skills, has_golem_suffix=self.has_golem_suffix, has_golem=self.has_golem, end=self.end
+        )
+        self.original_values = header
+
+    @classmethod
+    @Timed("parse.header")
+    def peek_header(cls, binary):
+        """
+        Decode only the fixed size header at the beginning of a save file, returning its fields.
+
+        When fewer bytes than the full header are given, only the character information is decoded.
+        """
+        layout = HEADER if len(binary) >= HEADER.size else CHARACTER_HEADER
+        header = dict(zip(HEADER_FIELDS, layout.unpack_from(binary)))
+
+        magic = header.pop("magic")
+        assert cls.MAGIC == magic, 'Invalid Magic: "{}"'.format(magic.hex())
+
+        name = header["char_name"]
+        header["char_name"] = name[: name.find(b"\x00")]
+        return header
+
+    @classmethod
+    def open_mmap(cls, path):
+        """Map a save file into memory, to change the fields of its header in place (see MappedGame)."""
+        return MappedGame(path)
+
     def to_file(self, path=None):
 
         # get the path to write to
@@ -205,9 +379,38 @@ class Game(object):
         data = self.to_bytes()
         with open(path, "wb") as f:
             f.write(data)
+        if metrics.enabled:
+            metrics.count("bytes_written", len(data))
         return len(data)
 
-    def to_bytes(self):
+    @property
+    def is_header_dirty(self):
+        """Whether any of the values in the fixed size header has changed since it was read."""
+        if self.original_values is None:
+            return True
+        return any(getattr(self, key) != self.original_values[key] for key in HEADER_FIELDS[1:])
+
+    @property
+    def is_dirty(self):
+        """Whether anything has changed since the save file was read."""
+        return (
+            self.is_header_dirty
+            or any(
+                getattr(self, key) != self.original_values[key]
+                for key in ("char_skills", "has_golem_suffix", "has_golem", "end")
+            )
+            or self.attributes.is_dirty
+            or self.items.is_dirty
+            or self.corpse.is_dirty
+            or bool(self.merc_id and self.merc_items.is_dirty)
+        )
+
+    @Timed("encode.header")
+    def header_to_bytes(self):
+        """Return the fixed size header at the beginning of the save file, before its size and checksum are set."""
+        # a header that has not been changed is written back as it was read
+        if not self.is_header_dirty:
+            return self.original_binary[: HEADER.size]
 
         bio = BytesIO()
         bio.write(self.MAGIC)
@@ -248,7 +451,14 @@ class Game(object):
         bio.write(self.quests)
         bio.write(self.waypoints)
         bio.write(self.npc_intros)
+        return bio.getvalue()
+
+    @Timed("encode.game")
+    def to_bytes(self):
 
+        # each section that has not been changed is written back as it was read
+        bio = BytesIO()
+        bio.write(self.header_to_bytes())
         bio.write(self.attributes.to_bytes())
         bio.write(self.char_skills)
         bio.write(self.items.to_bytes())
@@ -327,3 +537,104 @@ class Game(object):
                 + second_byte.to_bytes(1, "little")
                 + self.quests[byte_index + 2 :]
             )
+
+
+class MappedGame(object):
+    """
+    A save file mapped into memory, to change the fields of its fixed size header in place.
+
+    Each field of the header (named as in HEADER_FIELDS) is decoded from, and encoded into, the mapped file when
+    read or set as an attribute, and 'view' gives a writable memoryview of a field. 'flush' fixes the checksum and
+    writes back only the pages that changed. Only changes that keep the size of the file can be made this way.
+    """
+
+    # the patch tools only replace bytes of the header, so they apply unchanged
+    reset_akara = Game.reset_akara
+    reset_hephaesto = Game.reset_hephaesto
+
+    def __init__(self, path):
+
+        handle = open(path, "r+b")
+        try:
+            mapping = mmap.mmap(handle.fileno(), 0)
+        except Exception:
+            handle.close()
+            raise
+
+        self.__dict__.update(path=path, handle=handle, mapping=mapping, buffer=memoryview(mapping))
+        magic = bytes(self.buffer[: len(Game.MAGIC)])
+        if magic != Game.MAGIC:
+            self.close()
+            raise AssertionError(f'Invalid Magic: "{magic.hex()}"')
+
+        # the header as it was when mapped, to find what changed
+        self.__dict__["original"] = bytes(self.buffer[: HEADER.size])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type=None, exc_value=None, exc_traceback=None):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.revert()
+        self.close()
+
+    def __getattr__(self, name):
+        if name not in HEADER_LAYOUT:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+        offset, size, layout = HEADER_LAYOUT[name]
+        value = struct.unpack_from(layout, self.buffer, offset)[0]
+        if name == "char_name":
+            value = value[: value.find(b"\x00")]
+        return value
+
+    def __setattr__(self, name, value):
+        if name not in HEADER_LAYOUT or name in MANAGED_FIELDS:
+            raise AttributeError(f"The header field {name!r} cannot be set in place.")
+        offset, size, layout = HEADER_LAYOUT[name]
+        if name == "char_name":
+            assert len(value) < size, f"The character name is at most {size - 1} characters."
+        elif isinstance(value, (bytes, bytearray)):
+            assert len(value) == size, f"The header field {name!r} is {size} bytes."
+        struct.pack_into(layout, self.buffer, offset, value)
+
+    def view(self, name):
+        """Return a writable memoryview of the bytes of a header field."""
+        offset, size, _ = HEADER_LAYOUT[name]
+        return self.buffer[offset : offset + size]
+
+    def changed(self):
+        """Return the start and end of the bytes of the header that changed since it was mapped, or None."""
+        current = self.buffer[: HEADER.size]
+        if current == self.original:
+            return None
+        start = next(index for index in range(HEADER.size) if current[index] != self.original[index])
+        end = next(index for index in range(HEADER.size, 0, -1) if current[index - 1] != self.original[index - 1])
+        return start, end
+
+    def flush(self):
+        """Fix the checksum after any change, and write the pages that changed back to the file."""
+        span = self.changed()
+        if span is None:
+            return 0
+
+        offset, size = HEADER_OFFSETS["file_checksum"]
+        self.buffer[offset : offset + size] = create_checksum_bytes(self.buffer, offset)
+        start, end = min(span[0], offset), max(span[1], offset + size)
+
+        # only whole pages can be written back
+        start -= start % mmap.ALLOCATIONGRANULARITY
+        self.mapping.flush(start, end - start)
+        self.__dict__["original"] = bytes(self.buffer[: HEADER.size])
+        return end - start
+
+    def revert(self):
+        """Undo the changes made to the header since it was mapped, or last flushed."""
+        self.buffer[: HEADER.size] = self.original
+
+    def close(self):
+        """Release the mapping and close the file (any views of its fields must be released first)."""
+        self.buffer.release()
+        self.mapping.close()
+        self.handle.close()
@@ -0,0 +1,220 @@
+# standard imports
+from io import BytesIO
+
+# installed imports
+import numpy
+
+# module imports
+from pyd2s import constants
+from pyd2s.Items import Item, Items
+from pyd2s.MagicalProperties import MagicalProperty, MagicalProperties
+from pyd2s.constants import ITEM_SOCKETED
+
+# the item attributes kept as columns, with their types and the value stored when an item has none
+ITEM_COLUMNS = (
+    ("quality", numpy.uint8, None),
+    ("level", numpy.uint8, None),
+    ("parent", numpy.uint8, None),
+    ("equipped", numpy.uint8, None),
+    ("stored", numpy.uint8, None),
+    ("x", numpy.uint8, None),
+    ("y", numpy.uint8, None),
+    ("simple", numpy.bool_, None),
+    ("ethereal", numpy.bool_, None),
+    ("defense", numpy.int16, -1),
+    ("durability_max", numpy.int16, -1),
+    ("durability_current", numpy.int16, -1),
+    ("quantity", numpy.int16, -1),
+)
+
+# the list of magical properties each property row belongs to, the lists of a set item following the runeword one
+PROPERTIES_MAGICAL = 0
+PROPERTIES_RUNEWORD = 1
+PROPERTIES_SET = 2
+
+# the most values a single magical property has
+PROPERTY_VALUES = max(len(lengths) for lengths, _, _ in constants.MAGICAL_PROPERTIES.values())
+
+
+def code_id(code):
+    """Return the integer an item code is stored as in the 'code' column."""
+    return int.from_bytes(code.encode(), "little")
+
+
+def code_string(value):
+    """Return the item code of an integer from the 'code' column."""
+    return int(value).to_bytes(3, "little").decode()
+
+
+def property_lists(item):
+    """Yield the index and contents of each list of magical properties of an item that it has."""
+    if item.simple:
+        return
+    if item.magical_props is not None:
+        yield PROPERTIES_MAGICAL, item.magical_props
+    if item.runeword_props is not None:
+        yield PROPERTIES_RUNEWORD, item.runeword_props
+    for index, props in enumerate(item.set_props or ()):
+        yield PROPERTIES_SET + index, props
+
+
+class ItemTable(object):
+    """
+    The items of a collection as columns of numpy arrays, one row per item, so they can be filtered, counted and
+    grouped with vectorized operations.
+
+    Items held in sockets have rows of their own, after the item holding them, with the row of that item in the
+    'socket' column (-1 for items not in a socket). Magical properties are flattened into the 'property_*' arrays,
+    one row per property, with the row of the item it belongs to in 'property_item'. The bytes of each item not in a
+    socket are kept in 'binary', so a list of items can be created back from a table with 'to_items'.
+    """
+
+    def __init__(self, items=()):
+
+        rows = []
+        for item in items:
+            self._add_rows(rows, item, -1)
+
+        self.size = len(rows)
+        self.code = numpy.array([code_id(item.code) for item, _ in rows], dtype=numpy.uint32)
+        self.socket = numpy.array([holder for _, holder in rows], dtype=numpy.int32)
+        self.sockets = numpy.array([len(item.sockets) for item, _ in rows], dtype=numpy.uint8)
+        for name, dtype, missing in ITEM_COLUMNS:
+            values = (getattr(item, name) for item, _ in rows)
+            if missing is not None:
+                values = (missing if value is None else value for value in values)
+            setattr(self, name, numpy.fromiter(values, dtype=dtype, count=self.size))
+
+        # the properties of every item, flattened in the order of the items
+        property_rows = [
+            (row, index, prop.flag, prop.values)
+            for row, (item, _) in enumerate(rows)
+            for index, props in property_lists(item)
+            for prop in props
+        ]
+        self.property_item = numpy.array([row[0] for row in property_rows], dtype=numpy.int32)
+        self.property_list = numpy.array([row[1] for row in property_rows], dtype=numpy.uint8)
+        self.property_flag = numpy.array([row[2] for row in property_rows], dtype=numpy.uint16)
+        self.property_values = numpy.zeros((len(property_rows), PROPERTY_VALUES), dtype=numpy.int32)
+        for index, (_, _, _, values) in enumerate(property_rows):
+            self.property_values[index, : len(values)] = values
+
+        # the bytes of each item not in a socket, which include the items in its sockets
+        binaries = [item.to_bytes() if holder == -1 else b"" for item, holder in rows]
+        self.binary = numpy.frombuffer(b"".join(binaries), dtype=numpy.uint8)
+        self.binary_offsets = numpy.zeros(self.size + 1, dtype=numpy.int64)
+        numpy.cumsum([len(binary) for binary in binaries], out=self.binary_offsets[1:])
+
+        # the corpse header of the collection, if it has one
+        self.corpse_data = getattr(items, "corpse_data", None) if getattr(items, "corpse_items", False) else None
+
+    def __len__(self):
+        return self.size
+
+    @staticmethod
+    def _add_rows(rows, item, holder):
+        row = len(rows)
+        rows.append((item, holder))
+        for socket in item.sockets:
+            if socket is not None:
+                ItemTable._add_rows(rows, socket, row)
+
+    def codes(self):
+        """Return the item code of each row."""
+        return [code_string(value) for value in self.code]
+
+    def has_code(self, *codes):
+        """Return a mask of the rows of items with any of the given codes."""
+        return numpy.isin(self.code, [code_id(code) for code in codes])
+
+    def has_property(self, flag):
+        """Return a mask of the rows of items with at least one magical property of the given flag."""
+        mask = numpy.zeros(self.size, dtype=numpy.bool_)
+        mask[self.property_item[self.property_flag == flag]] = True
+        return mask
+
+    def item_binary(self, row):
+        """Return the bytes of the item in a row, which are empty for items in a socket."""
+        return self.binary[self.binary_offsets[row] : self.binary_offsets[row + 1]].tobytes()
+
+    def item_properties(self, row):
+        """Return the (list, flag, values) of each magical property of the item in a row."""
+        start, end = numpy.searchsorted(self.property_item, [row, row + 1])
+        return [
+            (int(self.property_list[index]), int(self.property_flag[index]), self.property_values[index])
+            for index in range(start, end)
+        ]
+
+    def apply(self, row, item):
+        """Set the values of the item in a row on an item, leaving those which are the same untouched."""
+        if item.code is None or code_id(item.code) != self.code[row]:
+            item.set_code(code_string(self.code[row]))
+
+        for name, dtype, missing in ITEM_COLUMNS:
+            value = getattr(self, name)[row].item()
+            if missing is not None and value == missing:
+                value = None
+            if getattr(item, name) != value:
+                setattr(item, name, value)
+
+        sockets = int(self.sockets[row])
+        if len(item.sockets) != sockets:
+            item.sockets = (item.sockets + [None] * sockets)[:sockets]
+
+        # the properties are only replaced when any of them differ
+        properties = [(index, prop.flag, list(prop.values)) for index, props in property_lists(item) for prop in props]
+        table_properties = []
+        for index, flag, values in self.item_properties(row):
+            lengths = constants.MAGICAL_PROPERTIES[flag][0]
+            table_properties.append((index, flag, [int(value) for value in values[: len(lengths)]]))
+        if properties != table_properties:
+            self._set_properties(item, table_properties)
+
+    @staticmethod
+    def _set_properties(item, properties):
+        lists = {}
+        for index, flag, values in properties:
+            prop = MagicalProperty(flag)
+            prop.values = values
+            lists.setdefault(index, []).append(prop)
+
+        def to_properties(props):
+            result = MagicalProperties()
+            result.extend(props)
+            return result
+
+        item.magical_props = to_properties(lists.get(PROPERTIES_MAGICAL, []))
+        if item.runeword or PROPERTIES_RUNEWORD in lists:
+            item.runeword_props = to_properties(lists.get(PROPERTIES_RUNEWORD, []))
+        set_indexes = sorted(index for index in lists if index >= PROPERTIES_SET)
+        if item.set_props is not None or set_indexes:
+            count = max(len(item.set_props or ()), len(set_indexes) and set_indexes[-1] - PROPERTIES_SET + 1)
+            item.set_props = [to_properties(lists.get(PROPERTIES_SET + index, [])) for index in range(count)]
+
+    def to_items(self, verification=None):
+        """Create the items of this table, starting from their bytes and applying the values in the columns."""
+        items = Items(verification=verification)
+        if self.corpse_data is not None:
+            items.corpse_items, items.corpse_data = True, self.corpse_data
+
+        row = 0
+        while row < self.size:
+            item = Item(BytesIO(self.item_binary(row)), verification=items.verification)
+            row = self._apply_rows(row, item)
+            items.append(item)
+        return items
+
+    def _apply_rows(self, row, item):
+        # apply the row of an item and then those of the items in its sockets, returning the row after them
+        self.apply(row, item)
+        holder, row = row, row + 1
+        for index in range(len(item.sockets)):
+            if row >= self.size or self.socket[row] != holder:
+                break
+            if item.sockets[index] is None:
+                socket = Item()
+                socket.parent = ITEM_SOCKETED
+                item.sockets[index] = socket
+                item.sockets_filled = index + 1
+            row = self._apply_rows(row, item.sockets[index])
+        return row
@@ -4,15 +4,41 @@ import struct
 from copy import deepcopy
 from io import BytesIO
 
-# installed imports
-import colored
-from colored import stylize
-
 # module imports
+from pyd2s import constants
 from pyd2s.BitIO import BitIO
-from pyd2s.MagicalProperties import MagicalProperties, MagicalProperty
-from pyd2s.constants import *
-from pyd2s.utilities import bin_diff, bytes2hexstrs
+from pyd2s.Metrics import metrics
+from pyd2s.TrackedList import TrackedList, is_changed
+from pyd2s.constants import (
+    EQUIPPED_LOCATIONS,
+    ITEM_EQUIPPED,
+    ITEM_SOCKETED,
+    ITEM_STORED,
+    QUALITY_CRAFTED,
+    QUALITY_HIGH,
+    QUALITY_LOW,
+    QUALITY_MAGIC,
+    QUALITY_RARE,
+    QUALITY_SET,
+    QUALITY_STRINGS,
+    QUALITY_UNIQUE,
+    STORED_CUBE,
+    STORED_INVENTORY,
+    STORED_STASH,
+    TYPE_ARMOR,
+    TYPE_SHIELD,
+    TYPE_WEAPON,
+    get_item_type,
+)
+from pyd2s.decorators import Timed
+from pyd2s.schema import details_decoder, encoder, header_decoder, item_key
+from pyd2s.utilities import bytes2hexstrs
+
+
+# policies for checking that each item read is written back to the same bytes
+VERIFY_OFF = 0
+VERIFY_SAMPLED = 1
+VERIFY_STRICT = 2
 
 
 # def create_item(code=None, type_string=None, defense=None, durability=None, sockets=None):
@@ -38,20 +64,202 @@ from pyd2s.utilities import bin_diff, bytes2hexstrs
 # 	return item
 
 
+class RecreationError(Exception):
+    """An item was not written back to the same bytes that it was read from."""
+
+    def __init__(self, item, result):
+        self.code = item.code
+        self.original = item.original_binary
+        self.result = result
+        super(RecreationError, self).__init__(
+            f"Item {self.code!r} was recreated as {len(result)} bytes instead of {len(self.original)}"
+            if len(result) != len(self.original)
+            else f"Item {self.code!r} was recreated with different bytes"
+        )
+
+
+class Verification(object):
+    """A policy for checking that items are written back to the bytes they were read from, and its results."""
+
+    def __init__(self, mode=VERIFY_SAMPLED, sample=1):
+        # when sampling, every 'sample'th item read is checked
+        self.mode = mode
+        self.sample = sample
+        self.counters = {"items": 0, "checked": 0, "passed": 0, "failed": 0}
+
+    def check(self, item):
+        """Write the item back to bytes, according to the policy, and count whether it matched what was read."""
+        self.counters["items"] += 1
+        if self.mode == VERIFY_OFF:
+            return True
+        if self.mode == VERIFY_SAMPLED and (self.counters["items"] - 1) % self.sample:
+            return True
+
+        self.counters["checked"] += 1
+        result = item.encode()
+        if result == item.original_binary:
+            self.counters["passed"] += 1
+            return True
+
+        self.counters["failed"] += 1
+        if self.mode == VERIFY_STRICT:
+            raise RecreationError(item, result)
+        logging.debug("Recreation failure: %s", item.code)
+        return False
+
+
+# the fixed width fields at the beginning of an item that are always decoded, even when loading lazily
+HEADER_ATTRIBUTES = (
+    "quest_item",
+    "identified",
+    "autofill",
+    "socketed",
+    "new",
+    "autoequip",
+    "ear",
+    "starter",
+    "simple",
+    "ethereal",
+    "personalized",
+    "runeword",
+    "unknown",
+    "parent",
+    "equipped",
+    "x",
+    "y",
+    "stored",
+    "code",
+    "sockets_filled",
+    "id",
+    "level",
+    "quality",
+)
+
+# the attributes of an item loaded lazily that are only decoded upon first access
+LAZY_ATTRIBUTES = frozenset(
+    [
+        "name",
+        "multipic",
+        "pic_id",
+        "class_specific",
+        "class_info",
+        "unusual_bit",
+        "quality_info",
+        "tome_info",
+        "name_id_first",
+        "name_id_last",
+        "magical_name_ids",
+        "magical_name_prefixes",
+        "magical_name_suffixes",
+        "personalized_name",
+        "defense",
+        "durability_max",
+        "durability_current",
+        "quantity",
+        "sockets",
+        "magical_props",
+        "set_props",
+        "runeword_props",
+        "runeword_id",
+        "runeword_name",
+    ]
+)
+
+
+# the attributes of an item that are not written to its binary, so changing them does not make it dirty
+UNWRITTEN_ATTRIBUTES = frozenset(
+    ["dirty", "original_binary", "lazy_header", "name", "runeword_name"]
+)
+
+
+def properties_changed(props):
+    """Whether a list of magical properties, or any of the properties in it, was changed since it was read."""
+    return is_changed(props) or any(is_changed(prop.values) for prop in props)
+
+
 class Item(object):
+    """
+    An item, read from and written to the binary format of save and storage files.
 
-    MAGIC = b"\x4a\x4d"
+    Setting an attribute that is written to the binary marks the item as dirty, and an item that is not dirty is
+    written back as the bytes it was read from. Changes made in place to the lists of an item, such as to its
+    sockets or to the values of its magical properties, are recorded by the lists themselves (see TrackedList).
+    """
 
-    def __init__(self, handle=None):
+    MAGIC = b"\x4a\x4d"
 
+    # items are kept in large numbers, so they have no __dict__
+    __slots__ = (
+        "dirty",
+        "original_binary",
+        "lazy_header",
+        "autoequip",
+        "autofill",
+        "ear",
+        "ethereal",
+        "identified",
+        "new",
+        "personalized",
+        "quest_item",
+        "runeword",
+        "simple",
+        "socketed",
+        "starter",
+        "unknown",
+        "sockets",
+        "sockets_filled",
+        "parent",
+        "equipped",
+        "x",
+        "y",
+        "stored",
+        "code",
+        "type_id",
+        "type_string",
+        "name",
+        "id",
+        "level",
+        "quality",
+        "multipic",
+        "pic_id",
+        "class_specific",
+        "class_info",
+        "unusual_bit",
+        "quality_info",
+        "tome_info",
+        "name_id_first",
+        "name_id_last",
+        "magical_name_ids",
+        "magical_name_prefixes",
+        "magical_name_suffixes",
+        "personalized_name",
+        "defense",
+        "durability_max",
+        "durability_current",
+        "quantity",
+        "magical_props",
+        "set_props",
+        "runeword_props",
+        "runeword_id",
+        "runeword_name",
+    )
+
+    def __init__(self, handle=None, lazy=False, verification=None):
+
+        # whether this item has changed since it was read
+        self.dirty = True
         self.original_binary = None
 
+        # the header values of an item loaded lazily, while the rest of it has not been decoded
+        self.lazy_header = None
+
         # basic information
         self.autoequip = 0
         self.autofill = False
         self.ear = False
         self.ethereal = False
         self.identified = False
+        self.new = False
         self.personalized = False
         self.quest_item = False
         self.runeword = False
@@ -61,7 +269,7 @@ class Item(object):
         self.unknown = 0
 
         # socket information
-        self.sockets = []
+        self.sockets = TrackedList()
         self.sockets_filled = 0
 
         # location information
@@ -85,9 +293,9 @@ class Item(object):
         # basic informations
         self.quality_info, self.tome_info = None, None
         self.name_id_first, self.name_id_last = None, None
-        self.magical_name_ids = []
-        self.magical_name_prefixes = []
-        self.magical_name_suffixes = []
+        self.magical_name_ids = TrackedList()
+        self.magical_name_prefixes = TrackedList()
+        self.magical_name_suffixes = TrackedList()
 
         self.personalized_name = None
         self.defense = None
@@ -105,7 +313,26 @@ class Item(object):
 
         # load data into self if a handle was given
         if handle is not None:
-            self.from_handle(handle)
+            self.from_handle(handle, lazy=lazy, verification=verification)
+
+    def __setattr__(self, name, value):
+        if name not in UNWRITTEN_ATTRIBUTES:
+            object.__setattr__(self, "dirty", True)
+        object.__setattr__(self, name, value)
+
+    def __getattr__(self, name):
+        # only called for missing attributes, which are the ones not yet decoded from a lazily loaded item
+        if name not in LAZY_ATTRIBUTES or self.lazy_header is None:
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+        self.decode()
+        return getattr(self, name)
+
+    def __getstate__(self):
+        return self.slot_values()
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
     def __str__(self):
 
@@ -166,16 +393,19 @@ class Item(object):
 
     @property
     def color_name(self):
+        # colored is only imported once colorized output is requested
+        from colored import fg, stylize
+
         # if the item is a rune, the color is independent of the quality
         if self.is_rune:
-            return stylize(self.name, colored.fg("orange_red_1"))
+            return stylize(self.name, fg("orange_red_1"))
 
         # name = f"{self.personalized_name}'s {self.name}" if self.personalized else self.name
 
         # return the color of the name, based upon the quality
         return stylize(
             self.name,
-            colored.fg(
+            fg(
                 {
                     QUALITY_CRAFTED: "orange_red_1",
                     QUALITY_UNIQUE: "dark_khaki",  # wheat_1 == too pale/yellow
@@ -204,7 +434,7 @@ class Item(object):
 
     @property
     def is_gem(self):
-        return self.code in GEM_CODES
+        return get_item_type(self.code).is_gem
 
     @property
     def is_low_quality(self):
@@ -228,7 +458,7 @@ class Item(object):
 
     @property
     def is_rune(self):
-        return self.code in RUNE_CODES
+        return get_item_type(self.code).is_rune
 
     @property
     def is_set_quality(self):
@@ -256,7 +486,7 @@ class Item(object):
 
     @property
     def has_quantity(self):
-        return has_quantity(self.code)
+        return get_item_type(self.code).has_quantity
 
     @property
     def quality_string(self):
@@ -270,398 +500,135 @@ class Item(object):
     # 	functions
     #
 
-    def from_handle(self, handle):
+    def decode(self):
+        """Decode the remainder of an item that was loaded lazily, keeping any values already changed."""
+        if self.lazy_header is None:
+            return
+
+        # values already present on this item take precedence over the decoded ones
+        state = self.slot_values()
+        item = Item(BytesIO(self.original_binary), verification=Verification(VERIFY_OFF))
+        self.__setstate__(item.slot_values())
+        self.__setstate__(state)
+        self.lazy_header = None
+
+    def slot_values(self):
+        """Return the values of the attributes of this item that are set, without decoding a lazily loaded item."""
+        values = {}
+        for name in self.__slots__:
+            try:
+                values[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        return values
+
+    def from_handle(self, handle, lazy=False, verification=None):
 
         # ensure an item is expected
         start = handle.tell()
         magic = handle.read(2)
         assert b"\x4a\x4d" == magic, "Invalid magic: %s" % magic
 
-        # read information from the handle
+        # read information from the handle, with the functions compiled from the item layout
         bitio = BitIO(handle, rread=True, rvalues=True)
-
-        # 0 bits along
-        self.quest_item = bool(bitio.read(1, "bit"))
-        bitio.read(3, "bits")
-        self.identified = bool(bitio.read(1, "bit"))
-        bitio.read(5, "bits")
-
-        # sometimes potions have this bit set when another potion will fill this spot upon use
-        self.autofill = bitio.read(1, "bit")
-
-        self.socketed = bool(bitio.read(1, "bit"))
-        bitio.read(1, "bit")
-        self.new = bool(bitio.read(1, "bit"))
-        self.autoequip = bitio.read(2, "bits")  # this is probably 2, smaller bitflags
-        self.ear = bool(bitio.read(1, "bit"))
-        self.starter = bool(bitio.read(1, "bit"))
-
-        bitio.read(3, "bits")
-        # print('Unknown: %d' % bitio.read(3, 'bits'))
-
-        self.simple = bool(bitio.read(1, "bit"))
-        self.ethereal = bool(bitio.read(1, "bit"))
-
-        bitio.read(1, "bit")
-        # logging.debug('Weird code: %d', bitio.read(1, 'bit'))
-
-        self.personalized = bool(bitio.read(1, "bit"))
-
-        bitio.read(1, "bit")
-        # print('WEIRD: %d' % bitio.read(1, 'bit'))
-
-        self.runeword = bool(bitio.read(1, "bit"))
-
-        # TODO: result 3233 was found on an amazon, equipped
-        # quiver with 238 arrows, normal otherwise
-        self.unknown = bitio.read(15, "bits")  # 3232
-
-        self.parent = bitio.read(3, "bits")
-        self.equipped = bitio.read(4, "bits")  # this should be zero if the parent is not 'ITEM_EQUIPPED'
-        self.x = bitio.read(4, "bits")
-        self.y = bitio.read(3, "bits")
-        bitio.read(1, "bit")
-        self.stored = bitio.read(3, "bits")
-
-        self.set_code(bitio.read(4, "chars")[:-1].decode())
+        header_decoder()(self, bitio)
 
         # this sets a default "name" for the object (name is custom defined, for our use)
         self.name = self.type_string
 
-        # this has to be stored, as some items will set 1 without having
-        self.sockets_filled = bitio.read(3, "bits")
-
-        if self.simple:
-            if bitio.remaining:
-                bitio.read(bitio.remaining, "bits")
-
-            # test handle match
-            end = handle.tell()
-            handle.seek(start)
-            self.original_binary = handle.read(end - start)
-            result = self.to_bytes()
-            if self.original_binary != result:
-                print("[RECREATION_FAILURE]")
-                print(self.name)
-                bin_diff(self.original_binary, result)
-
-            return self.original_binary == result
-
-        # read complex information
-        self.id = bitio.read(32, "bits")
-        self.level = bitio.read(7, "bits")
-        self.quality = bitio.read(4, "bits")
-
-        self.multipic = bool(bitio.read(1, "bit"))
-        if self.multipic:
-            self.pic_id = bitio.read(3, "bits")
-
-        self.class_specific = bool(bitio.read(1, "bit"))
-        if self.class_specific:
-            self.class_info = bitio.read(11, "bits")
-
-        # TODO
-        if self.ear:
-            pass
-
-        # quality switch
-        if self.is_low_quality or self.is_high_quality:
-            self.quality_info = bitio.read(3, "bits")
-
-        elif self.is_magic_quality:
-            self.name_id_first = bitio.read(11, "bits")
-            self.name_id_last = bitio.read(11, "bits")
-            self.name = ""
-            if 0 < self.name_id_first:
-                self.name += MAGIC_PREFIX_STRINGS[self.name_id_first] + " "
-            self.name += self.type_string
-            if 0 < self.name_id_last:
-                self.name += " of " + MAGIC_SUFFIX_STRINGS[self.name_id_last]
-
-        elif self.is_set_quality:
-            self.name_id_first = bitio.read(12, "bits")
-            self.name = SET_STRINGS[self.name_id_first]
-
-        elif self.is_crafted_quality or self.is_rare_quality:
-            self.name_id_first = bitio.read(8, "bits")
-            self.name_id_last = bitio.read(8, "bits")
-            self.name = RARE_NAMES[self.name_id_first] + " " + RARE_NAMES[self.name_id_last]
-
-            for _ in range(3):
-                if bool(bitio.read(1, "bit")):
-                    self.magical_name_prefixes.append(bitio.read(11, "bits"))
-                else:
-                    self.magical_name_prefixes.append(0)
-                if bool(bitio.read(1, "bit")):
-                    self.magical_name_suffixes.append(bitio.read(11, "bits"))
-                else:
-                    self.magical_name_suffixes.append(0)
+        if not self.simple:
+            # when loading lazily, only find where the item ends and leave the rest to be decoded upon access
+            details_decoder(item_key(self), lazy)(self, bitio, handle, verification)
 
-        elif self.is_unique_quality:
-            self.name_id_first = bitio.read(12, "bits")
-            self.name = UNIQUE_STRINGS[self.name_id_first]
-
-        if self.runeword:
-            self.runeword_id = bitio.read(12, "bits")
-            self.runeword_name = RUNEWORD_STRINGS[self.runeword_id]
-            self.name = f'"{self.runeword_name}" {self.type_string}'
-            bitio.read(4, "bits")  # always seems to be 5 ?
-
-        # read a null-terminated 7-bit string
-        if self.personalized:
-            name = ""
-            c = bitio.read(7, "bits")
-            while c:
-                name += chr(c)
-                c = bitio.read(7, "bits")
-            self.personalized_name = name
-            self.name = name + "'s " + self.name
-
-        # TODO: if the item is a tome, read another 5 bits
-        if self.code in TOME_KEYS:
-            self.tome_info = bitio.read(5, "bits")
-
-        # strange timestamp bit
-        bitio.read(1, "bit")
-        # self.unusual_bit = bitio.read(1, 'bit')
-
-        if self.has_defense:
-            self.defense = bitio.read(11, "bits")
-
-        if self.has_durability:
-            self.durability_max = bitio.read(8, "bits")
-            if 0 < self.durability_max:
-                self.durability_current = bitio.read(8, "bits")
-                bitio.read(1, "bit")
-
-        if self.has_quantity:
-            self.quantity = bitio.read(9, "bits")
-
-        # if socketed, initialize the sockets to the given count
-        if self.socketed:
-            socket_count = bitio.read(4, "bits")
-            self.sockets = [None for _ in range(socket_count)]
-
-        # if the item is set quality, determine how many set magical traits to read
-        if self.is_set_quality:
-            # actually houses the number of times to read magical traits
-            self.name_id_last = bitio.read(5, "bits")
-
-        self.magical_props = MagicalProperties(bitio)
-
-        # if the item is set quality, we must read additional magical properties
-        if self.is_set_quality:
-            self.set_props = []
-            for _ in range(SET_LIST_MAP[self.name_id_last]):
-                mp = MagicalProperties(bitio)
-                self.set_props.append(mp)
-
-        # if this is a runeword, there are runeword properties here
-        if self.runeword:
-            self.runeword_props = MagicalProperties(bitio)
-
-        # read socketed items
-        if self.socketed:
-            for i in range(self.sockets_filled):
-                self.sockets[i] = Item(handle)
+            if not lazy:
+                if self.runeword:
+                    self.runeword_name = constants.RUNEWORD_STRINGS[self.runeword_id]
+                self.name = self.default_name()
 
         # test handle match
         end = handle.tell()
         handle.seek(start)
         self.original_binary = handle.read(end - start)
-        result = self.to_bytes()
-
-        if self.original_binary != result:
-            print("[RECREATION_FAILURE]")
-            bin_diff(self.original_binary, result)
-
-    def to_bytes(self):
-        def binstrings2bytes(*binary_strings):
-
-            binstring = "".join(binary_strings).encode()
-            n = len(binstring) % 8
-            if 0 < n:
-                binstring += (8 - n) * b"0"
 
-            # join all of the binary strings together and reverse each in the process
-            # int(binstring[i:i + 8][::-1], 2).to_bytes(1, 'little')
-            return b"JM" + b"".join(
-                int(binstring[i : i + 8][::-1], 2).to_bytes(1, "little") for i in range(0, len(binstring), 8)
-            )
+        self.dirty = False
 
-        parts = []
-
-        def rbinapp(value, length):
-            parts.append("{:0{width}b}".format(value, width=length)[::-1])
+        if lazy:
+            self.lazy_header = self.header_values()
+            if not self.simple:
+                for attribute in LAZY_ATTRIBUTES:
+                    object.__delattr__(self, attribute)
+            return True
 
-        # add each value into the parts, the specified number of bytes
-        parts = []
-        for value, bit_length in [
-            (1 if self.quest_item else 0, 1),
-            (0, 3),
-            (self.identified, 1),
-            (0, 5),
-            # 10
-            (self.autofill, 1),
-            (1 if self.socketed else 0, 1),  # (0 < len(self.sockets), 1),
-            (0, 1),
-            (self.new, 1),
-            (self.autoequip, 2),  # autoequip if the item is on a corpse (should be corpse-items only, it seems)
-            (self.ear, 1),
-            (self.starter, 1),
-            (0, 3),
-            # 21
-            (1 if self.simple else 0, 1),
-            (self.ethereal, 1),
-            (1, 1),
-            (self.personalized, 1),
-            (0, 1),
-            (self.runeword, 1),
-            # 27
-            # notes from: https://github.com/nickshanks/Alkor/blob/master/Source/Item.m#L103
-            # 	(unknown 5 bits)
-            # 	(version: 8 bits)
-            # 		0 = pre-1.08; 1 = 1.08/1.09 normal; 2 = 1.10 normal; 100 = 1.08/1.09 expansion; 101 = 1.10 expansion
-            # 	(unknown: 2 bits)
-            (self.unknown, 15),  # frequently seen as 3232 (though this is probably multiple, smaller fields)
-            # (3232, 15),
-            # 42
-            (self.parent, 3),
-            (self.equipped, 4),
-            (self.x, 4),
-            (self.y, 3),
-            (0, 1),
-            (self.stored, 3),
-            # self.code contains the 3 characters that identify the base item type (ex: 'buc' -> Buckler)
-            (ord(self.code[0]), 8),
-            (ord(self.code[1]), 8),
-            (ord(self.code[2]), 8),
-            (32, 8),
-            # (len(self.sockets) - self.sockets.count(None), 3)
-        ]:
-            rbinapp(value, bit_length)
-
-        # old method added these bits no matter what?
-        rbinapp(self.sockets_filled, 3)
-
-        # new method -- fails on Mephisto's Soulstone which reports sockets_filled == 1
-        # rbinapp(len(self.sockets) - self.sockets.count(None), 3)
+        return (verification or Verification()).check(self)
 
+    def default_name(self):
+        """Return the name of this item, from its quality, runeword, and personalization."""
+        name = self.type_string
         if self.simple:
-            return binstrings2bytes(*parts)
-
-        rbinapp(self.id, 32)
-        rbinapp(self.level, 7)
-        rbinapp(self.quality, 4)
-        rbinapp(self.multipic, 1)
-
-        if self.multipic:
-            rbinapp(self.pic_id, 3)
-
-        rbinapp(self.class_specific, 1)
-        if self.class_specific:
-            rbinapp(self.class_info, 11)
+            return name
 
-        # TODO
-        if self.ear:
-            pass
-
-        # different types of quality information
-        if self.is_low_quality or self.is_high_quality:
-            # if (QUALITY_LOW == self.quality) or (QUALITY_HIGH == self.quality):
-            rbinapp(self.quality_info, 3)
-
-        elif self.is_magic_quality:
-            # elif QUALITY_MAGIC == self.quality:
-            rbinapp(self.name_id_first, 11)
-            rbinapp(self.name_id_last, 11)
+        if self.is_magic_quality:
+            if 0 < self.name_id_first:
+                name = constants.MAGIC_PREFIX_STRINGS[self.name_id_first] + " " + name
+            if 0 < self.name_id_last:
+                name += " of " + constants.MAGIC_SUFFIX_STRINGS[self.name_id_last]
 
         elif self.is_set_quality:
-            # elif QUALITY_SET == self.quality:
-            # set item name_id_last houses info for the set list map
-            rbinapp(self.name_id_first, 12)  # old: rbinapp(self.name_id_last, 12)
-            # print('\n\nSet id: {}\n\n'.format(self.name_id_last))
-            # print('Level?: {}'.format(self.level))
+            name = constants.SET_STRINGS[self.name_id_first]
 
         elif self.is_crafted_quality or self.is_rare_quality:
-            rbinapp(self.name_id_first, 8)
-            rbinapp(self.name_id_last, 8)
-
-            for index in range(3):
-                for fixes in (self.magical_name_prefixes, self.magical_name_suffixes):
-                    fix = fixes[index]
-                    if fix:
-                        rbinapp(1, 1)
-                        rbinapp(fix, 11)
-                    else:
-                        rbinapp(0, 1)
+            rare_names = constants.RARE_NAMES
+            name = rare_names[self.name_id_first] + " " + rare_names[self.name_id_last]
 
         elif self.is_unique_quality:
-            # elif QUALITY_UNIQUE == self.quality:
-            rbinapp(self.name_id_first, 12)
+            name = constants.UNIQUE_STRINGS[self.name_id_first]
 
         if self.runeword:
-            rbinapp(self.runeword_id, 12)
-            rbinapp(5, 4)
-            # rbinapp(self.runeword_info, 16)
-            # rbinapp(self.runeword_bits, 16)
+            name = f'"{self.runeword_name}" {self.type_string}'
 
         if self.personalized:
-            for c in self.personalized_name + "\x00":
-                rbinapp(ord(c), 7)
-
-        if self.type_id == TYPE_TOME:
-            rbinapp(self.tome_info, 5)
-
-        # WARNING: sometimes this is 1 and sometimes 0?
-        # 1 bit timestamp?
-        # parts.append('1')
-        # parts.append('0')
-        # print('Unusual bit:', self.unusual_bit)
-        rbinapp(self.unusual_bit, 1)
+            name = self.personalized_name + "'s " + name
 
-        if self.has_defense:
-            rbinapp(self.defense, 11)
+        return name
 
-        if self.has_durability:
-            rbinapp(self.durability_max, 8)
-            if self.durability_max:
-                rbinapp(self.durability_current, 8)
-                rbinapp(0, 1)
+    def header_values(self):
+        """Return the values of the fixed width fields at the beginning of this item."""
+        return tuple(getattr(self, attribute) for attribute in HEADER_ATTRIBUTES)
 
-        # write the quantity of this item, if applicable
-        if self.has_quantity:
-            rbinapp(self.quantity, 9)
-
-        # write the number of sockets this object has
-        if self.sockets:
-            rbinapp(len(self.sockets), 4)
-
-        # set_list_count = SET_LIST_MAP[set_list_value]
-        if QUALITY_SET == self.quality:
-            rbinapp(self.name_id_last, 5)
-
-        parts.append(self.magical_props.to_binstring())
+    @property
+    def is_dirty(self):
+        """Whether this item, or any of the items in its sockets, has changed since it was read."""
+        if self.dirty or self.original_binary is None:
+            return True
 
-        # each item in set_properties is a list?
-        if QUALITY_SET == self.quality:
-            if self.set_props is not None:
-                for props in self.set_props:
-                    parts.append(props.to_binstring())
+        # the sockets of an item loaded lazily are not decoded until they are accessed
+        if self.lazy_header is not None:
+            return False
+        return self.is_nested_changed or any(socket is not None and socket.is_dirty for socket in self.sockets)
 
-        # write runeword properties
-        if self.runeword:
-            # logging.warning('Writing runeword properties ...')
-            parts.append(self.runeword_props.to_binstring())
-
-        # write the socketed items here
-        result = binstrings2bytes(*parts)
-        for s in self.sockets:
-            if s is None:
-                break
-            result += s.to_bytes()
+    @property
+    def is_nested_changed(self):
+        """Whether a list of this item, or of its magical properties, was changed in place since it was read."""
+        lists = (self.sockets, self.magical_name_ids, self.magical_name_prefixes, self.magical_name_suffixes)
+        if any(is_changed(values) for values in lists):
+            return True
+        if self.set_props is not None and (
+            is_changed(self.set_props) or any(properties_changed(props) for props in self.set_props)
+        ):
+            return True
+        props = (self.magical_props, self.runeword_props)
+        return any(properties is not None and properties_changed(properties) for properties in props)
+
+    def encode(self):
+        """Encode the values of this item, whether or not it has changed."""
+        self.decode()
+        return encoder(item_key(self))(self)
 
-        return result
+    def to_bytes(self):
+        # an item that has not been changed is written back as it was read
+        if not self.is_dirty:
+            return self.original_binary
+        return self.encode()
 
     #
     # 	convenience functions
@@ -696,24 +663,55 @@ class Item(object):
 
     def set_code(self, code):
         """Set the item code, type id, and type string values."""
+        item_type = get_item_type(code)
         self.code = code
-        self.type_id = get_type_id(code)
-        self.type_string = get_type_string(code)
+        self.type_id = item_type.type_id
+        self.type_string = item_type.type_string
 
 
 class Items(list):
 
     MAGIC = b"\x4a\x4d"
 
-    def __init__(self, handle=None):
+    def __init__(self, handle=None, lazy=False, verification=None):
 
         self.corpse_items = False
         self.corpse_data = None
+        self.verification = Verification() if verification is None else verification
+
+        # the binary this list was read from, with the items and corpse header it was read as
+        self.original_binary = None
+        self.original_items = []
+        self.original_corpse = None
+
         if handle is not None:
-            self.from_handle(handle)
+            self.from_handle(handle, lazy=lazy)
+
+    @Timed("parse.items")
+    def from_handle(self, handle, lazy=False):
+
+        start = handle.tell()
+        self.read_items(handle, lazy=lazy)
+
+        end = handle.tell()
+        if metrics.enabled:
+            metrics.count("items_parsed", len(self))
+            metrics.count("bits_read", 8 * (end - start))
+        handle.seek(start)
+        self.original_binary = handle.read(end - start)
+        self.original_items = list(self)
+        self.original_corpse = (self.corpse_items, self.corpse_data)
+
+    def read_items(self, handle, lazy=False):
+        self.extend(self.iter_handle(handle, lazy=lazy))
 
-    def from_handle(self, handle):
+    def iter_handle(self, handle, lazy=False, predicate=None):
+        """
+        Yield the items read from a handle one at a time, setting the corpse header of this list if there is one.
 
+        When a predicate is given, it is called with each item with only its header decoded (code, quality, stored,
+        location and flags) and the items it rejects are skipped over without decoding their details.
+        """
         # read the magic header and ensure it is good
         magic = handle.read(2)
         assert self.MAGIC == magic, "Invalid magic: %s" % magic
@@ -725,20 +723,39 @@ class Items(list):
         if items_to_read == 1:
             self.corpse_items = True
             self.corpse_data = handle.read(12)
-            self.from_handle(handle)
+            yield from self.iter_handle(handle, lazy=lazy, predicate=predicate)
+            return
+
+        # read items from the handle
+        items_read = 0
+        while items_read < items_to_read:
+            if predicate is None:
+                item = Item(handle, lazy=lazy, verification=self.verification)
+                yield item
+            else:
+                item = Item(handle, lazy=True, verification=self.verification)
+                if predicate(item):
+                    yield item if lazy else Item(BytesIO(item.original_binary), verification=self.verification)
+            if item.parent != ITEM_SOCKETED:
+                items_read += 1
 
-        else:
-            # read items from the handle
-            items_read = 0
-            while items_read < items_to_read:
-                item = Item(handle)
-                if item.parent != ITEM_SOCKETED:
-                    items_read += 1
-                self.append(item)
+    @property
+    def is_dirty(self):
+        """Whether items have been added, removed, reordered, or changed since this list was read."""
+        return (
+            self.original_binary is None
+            or len(self) != len(self.original_items)
+            or (self.corpse_items, self.corpse_data) != self.original_corpse
+            or any(item is not original or item.is_dirty for item, original in zip(self, self.original_items))
+        )
 
+    @Timed("encode.items")
     def to_bytes(self):
-        # write the items back to bytes format
+        # a list that has not been changed is written back as it was read
+        if not self.is_dirty:
+            return self.original_binary
 
+        # write the items back to bytes format
         bio = BytesIO()
 
         # if these are corpse items, we must write the corpse header first
@@ -759,6 +776,18 @@ class Items(list):
         bio.seek(0)
         return bio.read()
 
+    @classmethod
+    def from_table(cls, table, verification=None):
+        """Create a list of items from an ItemTable, with the values of its columns."""
+        return table.to_items(verification=verification)
+
+    def to_table(self):
+        """Return the items of this list as the columns of an ItemTable."""
+        # numpy is only imported when a table is needed
+        from pyd2s.ItemTable import ItemTable
+
+        return ItemTable(self)
+
     @property
     def count(self):
         # count the number of items contained that are not socketed
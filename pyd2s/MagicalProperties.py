@@ -1,26 +1,106 @@
 # module imports
-from pyd2s.constants import CLASS_STRINGS, MAGICAL_PROPERTIES
+from pyd2s import constants
+from pyd2s.BitIO import BitWriter
+from pyd2s.TrackedList import TrackedList
+from pyd2s.constants import CLASS_STRINGS
+from pyd2s.decorators import Timed
 from pyd2s.utilities import binstring, to_binstring
 
 
-class MagicalProperty(object):
-    def __init__(self, flag):
-
-        # # if the flag appears invalid, dump some debugging information
-        # if flag not in MAGICAL_PROPERTIES.keys():
-        # 	data = bitio.read_remaining()
-        # 	if b'JM' in data:
-        # 		data = data[:data.index(b'JM')]
-        # 	bin_data = binstring(data, len(data))
-        # 	print(f'Bytes remaining: {data}')
-        # 	print(f'Length of bytes remaining: {len(data)}')
-        # 	print(f'Binary remaining: {bin_data}')
-        # 	print(f'Length of binary remaining: {len(bin_data)}')
-        # 	raise ValueError(f'Invalid flag {flag} in bitio!')
+# the flag that ends a list of magical properties
+END_FLAG = 0x1FF
+
+# the reader of each flag, compiled from MAGICAL_PROPERTIES when the first property is read
+PROPERTY_READERS = None
+
+
+class UnknownPropertyError(ValueError):
+    """A magical property flag that is not in MAGICAL_PROPERTIES was read, usually from a corrupt or misaligned item."""
 
+    def __init__(self, flag, position):
         self.flag = flag
-        self.lengths, self.bias, self.mstring = MAGICAL_PROPERTIES[flag]
-        self.values = [0 for _ in enumerate(self.lengths)]
+        self.position = position
+        super(UnknownPropertyError, self).__init__(
+            f"Unknown magical property flag {flag} at bit {position} of the item"
+        )
+
+
+def compile_property_readers():
+    """
+    Return the reader of every 9 bit flag, None for the flags that are unknown.
+
+    A reader is the total width of the values of a property, the (shift, mask) of each value within those bits, and
+    the bias subtracted from each, so all of the values are read with a single fetch and split arithmetically.
+    """
+    readers = [None] * (END_FLAG + 1)
+    for flag, (lengths, bias, _) in constants.MAGICAL_PROPERTIES.items():
+        plan = []
+        width = 0
+        for length in lengths:
+            plan.append((width, (1 << length) - 1))
+            width += length
+        readers[flag] = (width, tuple(plan), bias or 0)
+    return readers
+
+
+def property_readers():
+    global PROPERTY_READERS
+    if PROPERTY_READERS is None:
+        PROPERTY_READERS = compile_property_readers()
+    return PROPERTY_READERS
+
+
+def property_reader(readers, flag, bitio):
+    """Return the reader of a flag just read from a BitIO object, raising an UnknownPropertyError if there is none."""
+    reader = readers[flag]
+    if reader is None:
+        raise UnknownPropertyError(flag, bitio.consumed - 9)
+    return reader
+
+
+def skip_magical_properties(bitio):
+    """Move a BitIO object past a list of magical properties without decoding them."""
+    readers = PROPERTY_READERS or property_readers()
+    flag = bitio.read_lsb(9)
+    while flag != END_FLAG:
+        bitio.read_lsb(property_reader(readers, flag, bitio)[0])
+        flag = bitio.read_lsb(9)
+
+
+class MagicalProperty(object):
+
+    # the lengths, bias and string of a property are shared with every other property of the same flag
+    __slots__ = ("flag", "values")
+
+    def __init__(self, flag, values=None):
+
+        object.__setattr__(self, "flag", flag)
+        object.__setattr__(self, "values", [0 for _ in enumerate(self.lengths)] if values is None else values)
+
+    def __setattr__(self, name, value):
+        # a property changed after it was read marks its values as changed, which marks its item as changed
+        object.__setattr__(self, name, value)
+        if isinstance(self.values, TrackedList):
+            self.values.mark_changed()
+
+    def __getstate__(self):
+        return self.flag, self.values
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "flag", state[0])
+        object.__setattr__(self, "values", state[1])
+
+    @property
+    def lengths(self):
+        return constants.MAGICAL_PROPERTIES[self.flag][0]
+
+    @property
+    def bias(self):
+        return constants.MAGICAL_PROPERTIES[self.flag][1]
+
+    @property
+    def mstring(self):
+        return constants.MAGICAL_PROPERTIES[self.flag][2]
 
     def __str__(self):
         """Display this magical property in a nice format."""
@@ -43,34 +123,49 @@ class MagicalProperty(object):
 
     def from_bitio(self, bitio):
         """Load the data for this magical property from a BitIO class object."""
-        nums = [bitio.read(l, "bits") for l in self.lengths]
-        if self.bias is not None:
-            nums = [n - self.bias for n in nums]
-        self.values = nums
+        width, plan, bias = (PROPERTY_READERS or property_readers())[self.flag]
+        raw = bitio.read_lsb(width)
+        object.__setattr__(self, "values", TrackedList([((raw >> shift) & mask) - bias for shift, mask in plan]))
+
+    def to_bitwriter(self, writer):
+        """Write the flag and values of this magical property to a BitWriter class object."""
+        writer.write(self.flag, 9)
+        lengths, bias, _ = constants.MAGICAL_PROPERTIES[self.flag]
+        if bias is None:
+            for length, value in zip(lengths, self.values):
+                writer.write(value, length)
+        else:
+            for length, value in zip(lengths, self.values):
+                writer.write(value + bias, length)
 
     def to_binstring(self):
 
-        parts = ["{:09b}".format(self.flag)[::-1]]
-        parts.extend(
-            "{:0{width}b}".format(value if self.bias is None else value + self.bias, width=self.lengths[index])[::-1]
-            for index, value in enumerate(self.values)
-        )
-        return "".join(parts)
+        writer = BitWriter()
+        self.to_bitwriter(writer)
+        return writer.to_binstring()
 
 
-class MagicalProperties(list):
-    def __init__(self, bitio):
-        super(MagicalProperties, self).__init__()
-        while True:
+class MagicalProperties(TrackedList):
 
-            flag = bitio.read(9, "bits")
-            if flag == 0x1FF:
-                break
+    __slots__ = ()
 
-            mp = MagicalProperty(flag)
-            mp.from_bitio(bitio)
-            self.append(mp)
-            # self.append(MagicalProperty(flag, bitio))
+    @Timed("parse.magical_properties")
+    def __init__(self, bitio=None):
+        super(MagicalProperties, self).__init__()
+        if bitio is None:
+            return
+
+        # each property is its flag, then all of its values in one fetch, split with the plan compiled for the flag
+        # (appended with the method of list, so the properties read do not mark the list as changed)
+        readers = PROPERTY_READERS or property_readers()
+        read = bitio.read_lsb
+        append = list.append
+        flag = read(9)
+        while flag != END_FLAG:
+            width, plan, bias = property_reader(readers, flag, bitio)
+            raw = read(width)
+            append(self, MagicalProperty(flag, TrackedList([((raw >> shift) & mask) - bias for shift, mask in plan])))
+            flag = read(9)
 
     def __str__(self):
         return "Magical Properties:\n\t{}".format("\n\t".join("%s" % magical_property for magical_property in self))
@@ -79,6 +174,14 @@ class MagicalProperties(list):
         """Maximize all of the properties in this collection."""
         return len(mp.max() for mp in self)
 
+    def to_bitwriter(self, writer):
+        """Write each of the magical properties and the terminating flag to a BitWriter class object."""
+        for mp in self:
+            mp.to_bitwriter(writer)
+        writer.write(END_FLAG, 9)
+
     def to_binstring(self):
 
-        return "".join(mp.to_binstring() for mp in self) + ("1" * 9)
+        writer = BitWriter()
+        self.to_bitwriter(writer)
+        return writer.to_binstring()
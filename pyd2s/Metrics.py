@@ -0,0 +1,156 @@
+# standard imports
+import math
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class Histogram(object):
+    """The number, total, least and greatest of a series of values, with a count of the values below each power of 2."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.buckets = defaultdict(int)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+        # the exponent of the smallest power of 2 above the value
+        self.buckets[math.frexp(value)[1]] += 1
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def quantile(self, fraction):
+        """Return a bound, within a factor of 2, of the value that the given fraction of the values are below."""
+        target = fraction * self.count
+        seen = 0
+        for exponent in sorted(self.buckets):
+            seen += self.buckets[exponent]
+            if seen >= target:
+                return min(math.ldexp(1, exponent), self.maximum)
+        return self.maximum
+
+    def to_dict(self):
+        return dict(
+            count=self.count,
+            total=self.total,
+            mean=self.mean,
+            minimum=self.minimum,
+            maximum=self.maximum,
+            p50=self.quantile(0.5),
+            p99=self.quantile(0.99),
+        )
+
+
+class Metrics(object):
+    """
+    Counters and histograms of the work done while parsing and writing, such as the items parsed, the bits read, the
+    bytes written and the time taken by each stage (see decorators.Timed).
+
+    Nothing is recorded while the registry is disabled, and every place that records tests 'enabled' first, once per
+    stage rather than once per bit or item, so disabled metrics cost a single attribute test. Each process records to
+    its own registry.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+    def count(self, name, value=1):
+        """Add to a counter."""
+        self.counters[name] += value
+
+    def observe(self, name, value):
+        """Add a value to a histogram."""
+        self.histograms[name].add(value)
+
+    @contextmanager
+    def timer(self, name):
+        """Record the seconds taken by the body of a 'with' statement in a histogram, while enabled."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self):
+        """Return the counters and the summary of each histogram."""
+        return dict(
+            counters=dict(self.counters),
+            histograms={name: histogram.to_dict() for name, histogram in self.histograms.items()},
+        )
+
+    def report(self):
+        """Return a table of the time taken by each stage, which includes the time of the stages within it."""
+        lines = [f'{"stage":<28} {"calls":>8} {"total ms":>10} {"mean us":>10} {"p50 us":>10} {"p99 us":>10}']
+        for name in sorted(self.histograms):
+            histogram = self.histograms[name]
+            lines.append(
+                f"{name:<28} {histogram.count:>8} {histogram.total * 1e3:>10.2f} {histogram.mean * 1e6:>10.2f}"
+                f" {histogram.quantile(0.5) * 1e6:>10.2f} {histogram.quantile(0.99) * 1e6:>10.2f}"
+            )
+        for name in sorted(self.counters):
+            lines.append(f"{name:<28} {self.counters[name]:>8}")
+        return "\n".join(lines)
+
+
+# the registry that the package records to
+metrics = Metrics()
+
+
+@contextmanager
+def profiling(path=None, registry=metrics, stream=None):
+    """
+    Record metrics for the body of a 'with' statement and print their report at its end, also running cProfile
+    and writing its statistics to 'path' when one is given (read them with pstats or snakeviz).
+    """
+    stream = sys.stderr if stream is None else stream
+    profile = None
+    if path:
+        # the profiler is imported only when used, so that importing the package does not load it
+        import cProfile
+        import pstats
+
+        profile = cProfile.Profile()
+    enabled = registry.enabled
+    registry.enable()
+    if profile is not None:
+        profile.enable()
+    try:
+        yield registry
+    finally:
+        if profile is not None:
+            profile.disable()
+            profile.dump_stats(path)
+        registry.enabled = enabled
+
+        print(registry.report(), file=stream)
+        if profile is not None:
+            pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(20)
@@ -0,0 +1,57 @@
+# standard imports
+import os
+import struct
+
+# module imports
+from pyd2s.Game import read_header
+from pyd2s.utilities import save_dir
+
+
+class Roster(dict):
+    """
+    The character information of every save file in a directory, keyed by character name.
+
+    Only the header at the beginning of each save file is read, and a file is only read again by 'refresh' when
+    its modification time or size has changed, so listing a large directory is limited by the directory listing.
+    """
+
+    def __init__(self, directory=save_dir):
+
+        super(Roster, self).__init__()
+        self.directory = directory
+        self.paths = {}
+        self.stats = {}
+
+        # the reason each save file that could not be read was skipped
+        self.errors = {}
+
+    def refresh(self):
+        """Read the headers of new or changed save files in the directory and forget those that were removed."""
+        seen = set()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext != ".d2s" or not entry.is_file():
+                    continue
+
+                seen.add(name)
+                stat = entry.stat()
+                key = (stat.st_mtime_ns, stat.st_size)
+                if self.stats.get(name) == key:
+                    continue
+
+                self.paths[name] = entry.path
+                self.stats[name] = key
+                try:
+                    self[name] = read_header(entry.path)
+                    self.errors.pop(name, None)
+                except (OSError, AssertionError, struct.error) as e:
+                    self.pop(name, None)
+                    self.errors[name] = f"{e.__class__.__name__}: {e}"
+
+        for name in set(self.paths) - seen:
+            self.pop(name, None)
+            self.errors.pop(name, None)
+            del self.paths[name]
+            del self.stats[name]
+        return self
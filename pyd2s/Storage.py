@@ -1,21 +1,39 @@
 # standard imports
+import bisect
+import itertools
 import os
+import struct
+import threading
+from io import BytesIO
 
 # module imports
-from pyd2s.Items import Items
+from pyd2s.Items import Item, Items, Verification, VERIFY_OFF
+from pyd2s.Metrics import metrics
+from pyd2s.StorageIndex import ItemRange, StorageIndex
+from pyd2s.StorageJournal import DEFAULT_JOURNAL_THRESHOLD, RECORD_ADD, RECORD_REMOVE, StorageJournal
 
 
 # use a file in the current working directory, so the user can move it around easier
 DEFAULT_STORAGE_PATH = os.path.abspath("storage.d2i")
 
+# held while a journal is appended to or written into its storage file, which may happen in another thread
+JOURNAL_LOCK = threading.RLock()
+
 
 class Storage(Items):
-    def __init__(self, file_path=DEFAULT_STORAGE_PATH):
-        super(self.__class__, self).__init__()
+    def __init__(self, file_path=DEFAULT_STORAGE_PATH, verification=None):
+        super(self.__class__, self).__init__(verification=verification)
         if not os.path.isabs(file_path):
             file_path = os.path.abspath(file_path)
         self.file_path = file_path
 
+        # the byte range of each item in the storage file, for using single items without reading the others
+        self.item_index = None
+
+        # the journal size after which it is written into the storage file, and the thread doing so
+        self.journal_threshold = DEFAULT_JOURNAL_THRESHOLD
+        self.compaction = None
+
     def __enter__(self):
         if os.path.isfile(self.file_path):
             self.read(self.file_path)
@@ -25,14 +43,261 @@ class Storage(Items):
         if exc_type is None:
             self.write(self.file_path)
 
-    def read(self, file_path=None):
+    def read(self, file_path=None, lazy=False, cache=None):
         if file_path is None:
             file_path = self.file_path
-        with open(file_path, "rb") as file_handle:
-            return self.from_handle(file_handle)
+
+        # items parsed before are taken from the cache, keeping the verification policy of this storage
+        if cache is not None and not lazy:
+            items = cache.load_items(file_path)
+            del items.__dict__["verification"]
+            self[:] = items
+            self.__dict__.update(items.__dict__)
+        else:
+            with open(file_path, "rb") as file_handle:
+                self.from_handle(file_handle, lazy=lazy)
+
+        # the changes made since the storage file was written
+        with JOURNAL_LOCK:
+            self.apply_journal(StorageJournal(file_path).records(), lazy=lazy)
+
+    def apply_journal(self, records, lazy=False):
+        """Apply the records of a journal to the items of this list."""
+        for kind, contents in records:
+            if kind == RECORD_ADD:
+                handle = BytesIO(contents)
+                while handle.tell() < len(contents):
+                    self.append(Item(handle, lazy=lazy, verification=self.verification))
+            elif kind == RECORD_REMOVE:
+                for position in sorted(struct.unpack(f"<{len(contents) // 4}I", contents), reverse=True):
+                    del self[position]
+
+    def iter_items(self, file_path=None, predicate=None, lazy=False):
+        """
+        Yield the items of a storage file one at a time, each with the items in its sockets, without keeping them.
+
+        A predicate is called with each item with only its header decoded, such as its code, quality and where it is
+        stored, so items it rejects are skipped over without decoding the rest of them.
+        """
+        if file_path is None:
+            file_path = self.file_path
+
+        # the journal read is the one that follows the file opened, even if it is compacted while streaming
+        with JOURNAL_LOCK:
+            file_handle = open(file_path, "rb")
+            records = StorageJournal(file_path).records()
+
+        with file_handle:
+            items = Items(verification=self.verification)
+            if not records:
+                yield from items.iter_handle(file_handle, lazy=lazy, predicate=predicate)
+                return
+
+            # the changes in the journal are applied while streaming, leaving the storage file as it is
+            removed, added = self.journal_changes(records, self.item_count(file_handle), lazy)
+            if predicate is None:
+                for position, item in enumerate(items.iter_handle(file_handle, lazy=lazy)):
+                    if position not in removed:
+                        yield item
+            else:
+                positions = itertools.count()
+
+                def kept(item):
+                    return next(positions) not in removed and predicate(item)
+
+                yield from items.iter_handle(file_handle, lazy=lazy, predicate=kept)
+
+        for item in added:
+            if predicate is None or predicate(item):
+                yield item
+
+    @staticmethod
+    def item_count(file_handle):
+        """Return the number of items in a storage file from its header, leaving the handle where it was."""
+        start = file_handle.tell()
+        magic, count = struct.unpack("<2sH", file_handle.read(4))
+
+        # the item count of a corpse header is followed by a second list header
+        if count == 1:
+            file_handle.seek(start + 16)
+            magic, count = struct.unpack("<2sH", file_handle.read(4))
+        file_handle.seek(start)
+        return count
+
+    def journal_changes(self, records, count, lazy=False):
+        """
+        Return the positions of the items of a storage file of 'count' items removed by the records of its journal,
+        and the items added by them that are not removed.
+        """
+        removed = []
+        added = []
+        for kind, contents in records:
+            if kind == RECORD_ADD:
+                handle = BytesIO(contents)
+                while handle.tell() < len(contents):
+                    added.append(Item(handle, lazy=lazy, verification=self.verification))
+            elif kind == RECORD_REMOVE:
+                # the positions of a record follow the earlier records, so the last of them is removed first
+                for position in sorted(struct.unpack(f"<{len(contents) // 4}I", contents), reverse=True):
+                    kept = count - len(removed)
+                    if position >= kept:
+                        del added[position - kept]
+                        continue
+
+                    # the position in the file of the item at this position among those kept
+                    for earlier in removed:
+                        if earlier > position:
+                            break
+                        position += 1
+                    bisect.insort(removed, position)
+        return set(removed), added
 
     def write(self, file_path=None):
         if file_path is None:
             file_path = self.file_path
+        with JOURNAL_LOCK:
+            with open(file_path, "wb") as file_handle:
+                result = file_handle.write(self.to_bytes())
+            if metrics.enabled:
+                metrics.count("bytes_written", result)
+
+            # every change in the journal is part of the items written
+            StorageJournal(file_path).clear()
+        return result
+
+    #
+    # 	journaled changes, appended to a log next to the storage file instead of writing the whole file
+    #
+
+    def log_add(self, items, file_path=None):
+        """Add items to the end of the storage, with a single record appended to its journal."""
+        if file_path is None:
+            file_path = self.file_path
+        with JOURNAL_LOCK:
+            if not os.path.isfile(file_path):
+                with open(file_path, "wb") as file_handle:
+                    file_handle.write(self.MAGIC + struct.pack("<H", 0))
+            StorageJournal(file_path).add(b"".join(item.to_bytes() for item in items))
+        self.compact_if_needed(file_path)
+
+    def log_remove(self, positions, file_path=None):
+        """Remove the items at the given positions from the storage, with a single record appended to its journal."""
+        if file_path is None:
+            file_path = self.file_path
+        with JOURNAL_LOCK:
+            StorageJournal(file_path).remove(positions)
+        self.compact_if_needed(file_path)
+
+    def compact_if_needed(self, file_path=None):
+        """Write the journal into the storage file in a background thread, once it has grown past its threshold."""
+        if file_path is None:
+            file_path = self.file_path
+        if StorageJournal(file_path).size <= self.journal_threshold:
+            return
+        if self.compaction is not None and self.compaction.is_alive():
+            return
+        self.compaction = threading.Thread(target=self.compact, args=(file_path,), name="storage-compaction")
+        self.compaction.start()
+
+    def compact(self, file_path=None):
+        """Write the changes in the journal into the storage file, without decoding the items, and remove it."""
+        if file_path is None:
+            file_path = self.file_path
+        with JOURNAL_LOCK:
+            journal = StorageJournal(file_path)
+            if not journal.size:
+                return
+
+            # the new storage file replaces the old one at once, so an interruption leaves either of them
+            self.export(file_path + ".tmp", file_path)
+            os.replace(file_path + ".tmp", file_path)
+            journal.clear()
+
+    def export(self, path, file_path=None):
+        """Write the items of the storage, with the changes in its journal, to a file in the 'JM' list format."""
+        if file_path is None:
+            file_path = self.file_path
+        with JOURNAL_LOCK:
+            items = Storage(file_path, verification=Verification(VERIFY_OFF))
+            items.read(lazy=True)
+            with open(path, "wb") as file_handle:
+                result = file_handle.write(items.to_bytes())
+                file_handle.flush()
+                os.fsync(file_handle.fileno())
+        return result
+
+    #
+    # 	single items, used in the storage file without reading it into this list
+    #
+
+    def index(self, file_path=None):
+        """Return the index of the items in the storage file, reading it again only when the file has changed."""
+        if file_path is None:
+            file_path = self.file_path
+
+        # positions in the storage include the changes in its journal, so those are written into the file first
+        self.compact(file_path)
+        stat = os.stat(file_path)
+        index = self.item_index
+        if index is None or (index.mtime_ns, index.size) != (stat.st_mtime_ns, stat.st_size):
+            index = self.item_index = StorageIndex.load(file_path)
+        return index
+
+    def read_item(self, position, file_path=None):
+        """Decode a single item of the storage file, with the items in its sockets."""
+        if file_path is None:
+            file_path = self.file_path
+        item_range = self.index(file_path)[position]
+        with open(file_path, "rb") as file_handle:
+            file_handle.seek(item_range.offset)
+            return Item(BytesIO(file_handle.read(item_range.length)), verification=self.verification)
+
+    def append_items(self, items, file_path=None):
+        """Add items to the end of the storage file, without reading the items already in it."""
+        if file_path is None:
+            file_path = self.file_path
+        if not os.path.isfile(file_path):
+            with open(file_path, "wb") as file_handle:
+                file_handle.write(self.MAGIC + struct.pack("<H", 0))
+
+        index = self.index(file_path)
+        with open(file_path, "r+b") as file_handle:
+            offset = file_handle.seek(0, os.SEEK_END)
+            for item in items:
+                binary = item.to_bytes()
+                file_handle.write(binary)
+                index.append(ItemRange(offset, len(binary), StorageIndex.child_ranges(item, binary, offset)))
+                offset += len(binary)
+
+            file_handle.seek(index.count_offset)
+            file_handle.write(struct.pack("<H", len(index)))
+        index.save(file_path)
+
+    def remove_items(self, positions, file_path=None):
+        """Remove items from the storage file by splicing out their bytes, without decoding the others."""
+        if file_path is None:
+            file_path = self.file_path
+        index = self.index(file_path)
+        positions = sorted(set(positions))
+        with open(file_path, "rb") as file_handle:
+            data = file_handle.read()
+
+        # keep the bytes between the removed items, moving the ranges of the items after them
+        parts, start, shift, kept = [], 0, 0, []
+        removed = set(positions)
+        for position, item_range in enumerate(index):
+            if position in removed:
+                parts.append(data[start : item_range.offset])
+                start = item_range.offset + item_range.length
+                shift += item_range.length
+                continue
+            children = tuple((offset - shift, length) for offset, length in item_range.children)
+            kept.append(ItemRange(item_range.offset - shift, item_range.length, children))
+        parts.append(data[start:])
+
+        data = b"".join(parts)
+        data = data[: index.count_offset] + struct.pack("<H", len(kept)) + data[index.count_offset + 2 :]
         with open(file_path, "wb") as file_handle:
-            return file_handle.write(self.to_bytes())
+            file_handle.write(data)
+        index[:] = kept
+        index.save(file_path)
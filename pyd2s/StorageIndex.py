@@ -0,0 +1,121 @@
+# standard imports
+import os
+import struct
+from collections import namedtuple
+from io import BytesIO
+
+# module imports
+from pyd2s.Items import Item, Items, Verification, VERIFY_OFF
+
+
+# the byte range of an item in a storage file, with the (offset, length) of each item in its sockets
+ItemRange = namedtuple("ItemRange", ["offset", "length", "children"])
+
+# the index file: magic, version, modification time and size of the storage file, offset of the item count, ranges
+INDEX_MAGIC = b"D2IX"
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct("<4sHqQII")
+INDEX_RANGE = struct.Struct("<QIH")
+INDEX_CHILD = struct.Struct("<QI")
+
+
+def index_path(file_path):
+    """Return the path of the index kept next to a storage file."""
+    return file_path + ".idx"
+
+
+class StorageIndex(list):
+    """
+    The byte range of each item in a storage file, in order, so single items can be decoded, removed, or added
+    without reading the rest of the file.
+
+    An index is saved next to the storage file with the modification time and size the file had, and is built again
+    by 'load' whenever the file has changed since.
+    """
+
+    def __init__(self, ranges=(), mtime_ns=0, size=0, count_offset=2):
+        super(StorageIndex, self).__init__(ranges)
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+        # where the number of items is stored, after any corpse header
+        self.count_offset = count_offset
+
+    @classmethod
+    def build(cls, file_path):
+        """Read the items of a storage file lazily, recording where each begins and ends."""
+        stat = os.stat(file_path)
+        index = cls(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        items = Items(verification=Verification(VERIFY_OFF))
+        with open(file_path, "rb") as handle:
+            # the item count of a corpse header is followed by a second list header
+            if handle.read(4)[2:] == b"\x01\x00":
+                index.count_offset = 18
+            handle.seek(0)
+
+            for item in items.iter_handle(handle, lazy=True):
+                end = handle.tell()
+                start = end - len(item.original_binary)
+                index.append(ItemRange(start, end - start, cls.child_ranges(item, item.original_binary, start)))
+        return index
+
+    @staticmethod
+    def child_ranges(item, binary, offset):
+        """Return the (offset, length) of each item in the sockets of an item written at an offset, from its end."""
+        if item.simple or not item.sockets_filled:
+            return ()
+
+        # where the bits of an item itself end is only found by decoding it, which is only done with sockets filled
+        item = Item(BytesIO(binary), verification=Verification(VERIFY_OFF))
+        children = []
+        end = offset + len(binary)
+        for socket in reversed([socket for socket in item.sockets if socket is not None]):
+            end -= len(socket.original_binary)
+            children.append((end, len(socket.original_binary)))
+        return tuple(reversed(children))
+
+    @classmethod
+    def load(cls, file_path):
+        """Return the saved index of a storage file if it is still current, building and saving it otherwise."""
+        stat = os.stat(file_path)
+        try:
+            with open(index_path(file_path), "rb") as f:
+                data = f.read()
+            magic, version, mtime_ns, size, count_offset, count = INDEX_HEADER.unpack_from(data)
+            if (magic, version, mtime_ns, size) == (INDEX_MAGIC, INDEX_VERSION, stat.st_mtime_ns, stat.st_size):
+                return cls.from_bytes(data)
+        except (OSError, struct.error):
+            pass
+
+        index = cls.build(file_path)
+        index.save(file_path)
+        return index
+
+    @classmethod
+    def from_bytes(cls, data):
+        _, _, mtime_ns, size, count_offset, count = INDEX_HEADER.unpack_from(data)
+        index = cls(mtime_ns=mtime_ns, size=size, count_offset=count_offset)
+        position = INDEX_HEADER.size
+        for _ in range(count):
+            offset, length, child_count = INDEX_RANGE.unpack_from(data, position)
+            position += INDEX_RANGE.size
+            children = tuple(
+                INDEX_CHILD.unpack_from(data, position + INDEX_CHILD.size * child) for child in range(child_count)
+            )
+            position += INDEX_CHILD.size * child_count
+            index.append(ItemRange(offset, length, children))
+        return index
+
+    def to_bytes(self):
+        parts = [INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.mtime_ns, self.size, self.count_offset, len(self))]
+        for offset, length, children in self:
+            parts.append(INDEX_RANGE.pack(offset, length, len(children)))
+            parts.extend(INDEX_CHILD.pack(*child) for child in children)
+        return b"".join(parts)
+
+    def save(self, file_path):
+        """Save this index next to a storage file, as current for the file as it is now."""
+        stat = os.stat(file_path)
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        with open(index_path(file_path), "wb") as f:
+            f.write(self.to_bytes())
@@ -0,0 +1,138 @@
+# standard imports
+import logging
+import os
+import struct
+import zlib
+
+# the journal file: magic, version, and the modification time and size of the storage file it follows
+JOURNAL_MAGIC = b"D2IJ"
+JOURNAL_VERSION = 1
+JOURNAL_HEADER = struct.Struct("<4sHqQ")
+
+# each record: kind, length of the contents, crc32 of the contents
+JOURNAL_RECORD = struct.Struct("<BII")
+RECORD_ADD = 1
+RECORD_REMOVE = 2
+
+# the size a journal may grow to before its records are written into the storage file
+DEFAULT_JOURNAL_THRESHOLD = 64 * 1024
+
+# where the last complete record of each journal appended to by this process ends, with the state of the journal and
+# its storage file then, so an append that finds them unchanged does not read the journal again
+JOURNAL_ENDS = {}
+
+
+def journal_path(file_path):
+    """Return the path of the journal kept next to a storage file."""
+    return file_path + ".log"
+
+
+class StorageJournal(object):
+    """
+    The changes made to a storage file since it was last written, as an append-only log of records.
+
+    An 'add' record holds the bytes of the items added to the end of the storage, and a 'remove' record the positions
+    of the items removed from it, so each change costs a single small write. The journal begins with the modification
+    time and size of the storage file it follows, so records already written into a storage file, by compaction that
+    was interrupted before the journal was removed, are not applied twice.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.path = journal_path(file_path)
+
+    @property
+    def size(self):
+        """The number of bytes in the journal, or 0 when there is none."""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def base_key(self):
+        stat = os.stat(self.file_path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def state(self):
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size, *self.base_key())
+
+    def end(self):
+        """Return where the last complete record ends (0 when the journal does not apply), reading it only if needed."""
+        try:
+            state = self.state()
+        except OSError:
+            return 0
+        known = JOURNAL_ENDS.get(self.path)
+        if known is not None and known[0] == state:
+            return known[1]
+        return self.read()[1]
+
+    def records(self):
+        """Return the (kind, contents) of each record that applies to the storage file as it is now."""
+        return self.read()[0]
+
+    def read(self):
+        # the records that apply, and where the last of them ends (0 when the journal does not apply)
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return [], 0
+
+        try:
+            magic, version, mtime_ns, size = JOURNAL_HEADER.unpack_from(data)
+        except struct.error:
+            return [], 0
+        if (magic, version) != (JOURNAL_MAGIC, JOURNAL_VERSION) or (mtime_ns, size) != self.base_key():
+            logging.warning("Ignoring journal that does not follow the storage file: %s", self.path)
+            return [], 0
+
+        records = []
+        position = JOURNAL_HEADER.size
+        while position + JOURNAL_RECORD.size <= len(data):
+            kind, length, crc = JOURNAL_RECORD.unpack_from(data, position)
+            contents = data[position + JOURNAL_RECORD.size : position + JOURNAL_RECORD.size + length]
+
+            # a record cut short by an interrupted write is the last one, and was never completed
+            if len(contents) != length or zlib.crc32(contents) != crc:
+                logging.warning("Ignoring incomplete journal record at %d: %s", position, self.path)
+                break
+            records.append((kind, contents))
+            position += JOURNAL_RECORD.size + length
+        return records, position
+
+    def append(self, kind, contents):
+        """Append a record to the journal, starting the journal if there is none, and sync it to disk."""
+        end = self.end()
+        if end == 0:
+            with open(self.path, "wb") as f:
+                f.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, *self.base_key()))
+            end = JOURNAL_HEADER.size
+
+        # anything after the last complete record, left by an interrupted append, is written over
+        with open(self.path, "r+b") as f:
+            f.seek(end)
+            f.truncate()
+            f.write(JOURNAL_RECORD.pack(kind, len(contents), zlib.crc32(contents)) + contents)
+            f.flush()
+            os.fsync(f.fileno())
+            end = f.tell()
+        JOURNAL_ENDS[self.path] = (self.state(), end)
+
+    def add(self, binary):
+        """Record the bytes of items added to the end of the storage."""
+        self.append(RECORD_ADD, binary)
+
+    def remove(self, positions):
+        """Record the positions of items removed from the storage."""
+        positions = sorted(set(positions))
+        self.append(RECORD_REMOVE, struct.pack(f"<{len(positions)}I", *positions))
+
+    def clear(self):
+        """Remove the journal, once its records are part of the storage file."""
+        JOURNAL_ENDS.pop(self.path, None)
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
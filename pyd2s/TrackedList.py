@@ -0,0 +1,76 @@
+# the methods of a list that change it in place
+CHANGING_METHODS = (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+)
+
+
+def restore(cls, values):
+    """Return a tracked list of the given class holding the values, without marking it as changed."""
+    result = list.__new__(cls)
+    list.__init__(result, values)
+    return result
+
+
+def changed_class(cls):
+    """Return the class that the instances of a tracked list class become once they are changed."""
+    namespace = dict(__slots__=(), __module__=cls.__module__, __qualname__=f"{cls.__qualname__}.Changed", changed=True)
+    return type("Changed", (cls,), namespace)
+
+
+def changing(name):
+    """Return a list method that marks the list as changed before calling the method of list."""
+    method = getattr(list, name)
+
+    def change(self, *args, **kwargs):
+        self.__class__ = self.Changed
+        return method(self, *args, **kwargs)
+
+    change.__name__ = name
+    return change
+
+
+class TrackedList(list):
+    """
+    A list that records whether it was changed in place, such as by setting an element or appending to it.
+
+    Lists read from a file are kept in large numbers, so instead of a flag on each, a list that is changed becomes an
+    instance of the 'Changed' subclass of its class. Reading a list costs the same as reading any other list.
+    """
+
+    __slots__ = ()
+
+    changed = False
+
+    def __init_subclass__(cls, **kwargs):
+        super(TrackedList, cls).__init_subclass__(**kwargs)
+        if not cls.changed:
+            cls.Changed = changed_class(cls)
+
+    def __reduce_ex__(self, protocol):
+        # a list read back from a copy or a pickle is changed only if it was changed when it was stored
+        return restore, (self.__class__, list(self))
+
+    def mark_changed(self):
+        """Record that this list was changed, when one of its elements was changed in place."""
+        self.__class__ = self.Changed
+
+
+for name in CHANGING_METHODS:
+    setattr(TrackedList, name, changing(name))
+TrackedList.Changed = changed_class(TrackedList)
+
+
+def is_changed(values):
+    """Whether a list was changed since it was read, which is always the case for a list that is not tracked."""
+    return getattr(values, "changed", True)
@@ -1,21 +1,28 @@
 # standard imports
 import os
+import time
 from cmd import Cmd
 from collections import defaultdict
 from functools import wraps
 
 # package imports
+from pyd2s import constants
+from pyd2s.Cache import Cache
 from pyd2s.Game import Game
+from pyd2s.Roster import Roster
 from pyd2s.Storage import Storage
 from pyd2s.constants import (
+    CLASS_STRINGS,
     GEM_CODES,
     ITEM_BELT,
     ITEM_EQUIPPED,
     ITEM_STORED,
-    MISC_STRINGS,
     RUNE_CODES,
     RUNE_STRINGS,
-    RUNEWORDS,
+    STATUS_DIED,
+    STATUS_EXPANSION,
+    STATUS_HARDCORE,
+    STATUS_LADDER,
     STORED_CUBE,
     STORED_INVENTORY,
     STORED_STASH,
@@ -54,14 +61,14 @@ def parse_item_indexes(raw_string, max_index):
 
 
 class GameCommands(Cmd):
-    def __init__(self, character):
+    def __init__(self, character, cache=None):
         """Set up this class object to handle various commands related to handling the saved game."""
         self.prompt = f"pyd2s>{character}> "
         super(GameCommands, self).__init__()
 
         self.character = character
         self.game = Game(character)
-        self.game.from_file()
+        self.game.from_file(cache=cache)
         self.altered = False
 
     def do_attr(self, arg):
@@ -69,7 +76,7 @@ class GameCommands(Cmd):
         print("Attributes:")
         print(f'{"="*20} {"="*20}')
         for key in self.game.attributes.keys():
-            print(f"{key:>20}: {self.game.attributes[key]}")
+            print(f"{key:>20}: {self.game.attributes.view(key)}")
 
     def do_backup(self, arg):
         """Create a backup for the current character (for use with 'restore')."""
@@ -181,37 +188,37 @@ class GameCommands(Cmd):
         if not okay:
             return 0
 
-        with Storage() as store:
-            for index in sorted(indexes, reverse=True):
-                print(f"Storing: {self.game.items[index].pretty_name}")
-                store.append(self.game.items.pop(index))
-                self.altered = True
+        # the items are recorded in the journal of the storage file, without reading or rewriting the file
+        stored = []
+        for index in sorted(indexes, reverse=True):
+            print(f"Storing: {self.game.items[index].pretty_name}")
+            stored.append(self.game.items.pop(index))
+            self.altered = True
+        Storage().log_add(stored)
 
     def do_store_gems(self, arg):
         """Move gems from the current character's inventory, stash, and cube into a local storage file."""
-        with Storage() as store:
-
-            # move gems to the open store
-            index = 0
-            while index < len(self.game.items):
-                if self.game.items[index].is_gem:
-                    store.append(self.game.items.pop(index))
-                    self.altered = True
-                    continue
-                index += 1
+        stored = []
+        index = 0
+        while index < len(self.game.items):
+            if self.game.items[index].is_gem:
+                stored.append(self.game.items.pop(index))
+                self.altered = True
+                continue
+            index += 1
+        Storage().log_add(stored)
 
     def do_store_runes(self, arg):
         """Move runes from the current character's inventory, stash, and cube into a local storage file."""
-        with Storage() as store:
-
-            # move runes to the open store
-            index = 0
-            while index < len(self.game.items):
-                if self.game.items[index].is_rune:
-                    store.append(self.game.items.pop(index))
-                    self.altered = True
-                    continue
-                index += 1
+        stored = []
+        index = 0
+        while index < len(self.game.items):
+            if self.game.items[index].is_rune:
+                stored.append(self.game.items.pop(index))
+                self.altered = True
+                continue
+            index += 1
+        Storage().log_add(stored)
 
     def do_write(self, arg):
         """Write any changes made back to disk."""
@@ -224,14 +231,37 @@ class StorageCommands(Cmd):
 
     prompt = "pyd2s>storage> "
 
-    def __init__(self):
+    def __init__(self, cache=None):
         """Access the storage file to read the storage or give items to a player."""
         super(self.__class__, self).__init__()
-        self.storage = Storage()
-        if os.path.isfile(self.storage.file_path):
-            self.storage.read()
+        self.cache = cache
+
+        # single items are read, given and removed through the index of the storage file, and all of the items are
+        # only read for the commands that list or change them in memory
+        self.storage_file = Storage()
+        self.loaded = None
         self.altered = False
 
+    @property
+    def storage(self):
+        """All of the items of the storage file, read upon first use."""
+        if self.loaded is None:
+            self.loaded = Storage()
+            if os.path.isfile(self.loaded.file_path):
+                self.loaded.read(cache=self.cache)
+        return self.loaded
+
+    @property
+    def indexed(self):
+        """Whether single items are used through the index, which is only when no changes are waiting in memory."""
+        return not self.altered and os.path.isfile(self.storage_file.file_path)
+
+    def item_count(self):
+        return len(self.storage_file.index()) if self.indexed else len(self.storage)
+
+    def read_item(self, index):
+        return self.storage_file.read_item(index) if self.indexed else self.storage[index]
+
     def do_amulets(self, arg):
         """Display all of the rings in the storage file."""
         display_items(self.storage, "Amulets", "is_amulet")
@@ -286,6 +316,9 @@ class StorageCommands(Cmd):
                 else:
                     self.storage[parent_index].magical_props.append(child_prop)
 
+            # the properties were changed in place, which is not tracked by the item
+            self.storage[parent_index].dirty = True
+
         # TODO: remove each of the items that was absorbed into the parent
         self.altered = True
 
@@ -320,7 +353,7 @@ class StorageCommands(Cmd):
         print(f'Gems: [first index] name (count)\n{"=" * 50}')
         for code in sorted(GEM_CODES):
             if code in gems:
-                print(f"  [{first_index[code]:03}] {MISC_STRINGS[code]} ({gems[code]})")
+                print(f"  [{first_index[code]:03}] {constants.MISC_STRINGS[code]} ({gems[code]})")
         print()
 
     def do_give(self, arg):
@@ -339,15 +372,22 @@ class StorageCommands(Cmd):
             return 0
 
         # ensure the index is good
-        if index >= len(self.storage):
+        if index >= self.item_count():
             print(f"Index {index} is too high.")
             return 0
 
-        print(f"Giving {character}: {self.storage[index].pretty_name} ...")
+        item = self.read_item(index)
+        print(f"Giving {character}: {item.pretty_name} ...")
         with Game(character) as game:
-            item = self.storage.pop(index)
             item.move_to_inventory(0, 0)
             game.items.append(item)
+
+        # the item is only taken from the storage file once the character has it
+        if self.indexed:
+            self.storage_file.remove_items([index])
+            self.loaded = None
+        else:
+            self.storage.pop(index)
             self.altered = True
         print("Complete.")
 
@@ -371,7 +411,7 @@ class StorageCommands(Cmd):
     def do_info(self, arg):
         """Print information about the storage file."""
         print(f"Storage file location: {self.storage.file_path}")
-        print(f"Storage file contains {len(self.storage)} items.")
+        print(f"Storage file contains {self.item_count()} items.")
 
     def do_item(self, arg):
         """Display an item in full detail."""
@@ -386,11 +426,12 @@ class StorageCommands(Cmd):
 
         # convert the string to an integer and ensure it is within range
         index = int(arg)
-        if index >= len(self.storage):
-            print(f"Maximum index: {len(self.storage) - 1}")
+        count = self.item_count()
+        if index >= count:
+            print(f"Maximum index: {count - 1}")
             return 0
 
-        print(f"{self.storage[index]}\n")
+        print(f"{self.read_item(index)}\n")
 
     def do_items(self, arg):
         """Display a short listing of the items in the storage."""
@@ -408,13 +449,14 @@ class StorageCommands(Cmd):
 
     def do_read(self, arg):
         """Read the save file from disk."""
-        self.storage = Storage()
-        if not os.path.isfile(self.storage.file_path):
-            print(f"Storage file path does not yet exist: {self.storage.file_path}")
+        self.loaded = Storage()
+        self.altered = False
+        if not os.path.isfile(self.loaded.file_path):
+            print(f"Storage file path does not yet exist: {self.loaded.file_path}")
             return 0
 
-        result = self.storage.read()
-        print(f'Read from file: "{self.storage.file_path}"')
+        result = self.loaded.read(cache=self.cache)
+        print(f'Read from file: "{self.loaded.file_path}"')
 
     def do_rings(self, arg):
         """Display all of the rings in the storage file."""
@@ -426,14 +468,21 @@ class StorageCommands(Cmd):
 
     def do_rm(self, arg):
         """Delete items from the inventory."""
-        okay, indexes = parse_item_indexes(raw_string=arg, max_index=len(self.storage) - 1)
+        okay, indexes = parse_item_indexes(raw_string=arg, max_index=self.item_count() - 1)
         if not okay:
             return 0
 
         for index in sorted(indexes, reverse=True):
-            print(f"Removing: {self.storage[index].pretty_name}")
+            print(f"Removing: {self.read_item(index).pretty_name}")
+
+        # removed from the storage file at once, or from the items in memory until they are written
+        if self.indexed:
+            self.storage_file.remove_items(indexes)
+            self.loaded = None
+            return 0
+        for index in sorted(set(indexes), reverse=True):
             self.storage.pop(index)
-            self.altered = True
+        self.altered = True
 
     def do_runes(self, arg):
         """Display all of the runes in the storage container."""
@@ -449,7 +498,7 @@ class StorageCommands(Cmd):
         print(f'Runes: [first index] name (count)\n{"=" * 50}')
         for code in sorted(RUNE_CODES):
             if code in runes:
-                print(f"  [{first_index[code]:03}] {MISC_STRINGS[code]} ({runes[code]})")
+                print(f"  [{first_index[code]:03}] {constants.MISC_STRINGS[code]} ({runes[code]})")
         print()
 
     def do_runewords(self, arg):
@@ -462,9 +511,9 @@ class StorageCommands(Cmd):
             runes_stored[item.code] += 1
 
         # for each of the runewords, check if we have enough
-        for key in RUNEWORDS:
+        for key in constants.RUNEWORDS:
 
-            runeword, recipe, ladder_only = RUNEWORDS[key]
+            runeword, recipe, ladder_only = constants.RUNEWORDS[key]
 
             # do not even bother showing ladder only runewords
             if ladder_only:
@@ -505,6 +554,8 @@ class Commands(Cmd):
     def __init__(self):
         super(Commands, self).__init__()
         self.characters = get_characters()
+        self.roster = Roster()
+        self.cache = Cache()
         self.character = None
         self.game = None
         self.save_file = None
@@ -517,6 +568,30 @@ class Commands(Cmd):
         """Exit the command loop."""
         return 1
 
+    def do_list(self, arg):
+        """List the characters with their class, level, and when they were last played."""
+        self.roster.refresh()
+        print(f'{"Name":<16} {"Class":<12} {"Level":>5}  {"Last played":<16}  Status\n{"=" * 70}')
+        for name in sorted(self.roster):
+            header = self.roster[name]
+            status = ord(header["char_status"])
+            flags = [
+                text
+                for flag, text in [
+                    (STATUS_EXPANSION, "expansion"),
+                    (STATUS_HARDCORE, "hardcore"),
+                    (STATUS_LADDER, "ladder"),
+                    (STATUS_DIED, "died"),
+                ]
+                if status & flag
+            ]
+            last_played = time.strftime("%Y-%m-%d %H:%M", time.localtime(header["last_played"]))
+            class_string = CLASS_STRINGS.get(header["char_class"], header["char_class"])
+            print(f'{name:<16} {class_string:<12} {header["char_level"]:>5}  {last_played:<16}  {" ".join(flags)}')
+        for name in sorted(self.roster.errors):
+            print(f"{name:<16} {self.roster.errors[name]}")
+        print()
+
     def complete_open(self, text, line, begidx, endidx):
         """
         text: (string) prefix we are attempting to match
@@ -537,11 +612,11 @@ class Commands(Cmd):
                 print(f"  {character}")
             return 0
 
-        GameCommands(arg).cmdloop()
+        GameCommands(arg, self.cache).cmdloop()
 
     def do_storage(self, arg):
         """Open the shared stash provided by this python module."""
-        StorageCommands().cmdloop()
+        StorageCommands(self.cache).cmdloop()
 
 
 @Main()
@@ -6,9 +6,12 @@ import argparse
 import inspect
 import logging
 import sys
+import time
 
 from functools import wraps
 
+from pyd2s.Metrics import metrics, profiling
+
 
 #
 #   Standard Decorators
@@ -105,6 +108,18 @@ class ParseRoot(object):
         {"action": "count", "default": 0, "dest": "verbosity", "help": "Configure how verbose the logger should be."},
     )
 
+    # and for profile tuple injection
+    profile_tuple = (
+        ["--profile"],
+        {
+            "nargs": "?",
+            "const": "",
+            "default": None,
+            "metavar": "PSTATS",
+            "help": "Print the time taken by each stage, and write cProfile statistics to PSTATS if given.",
+        },
+    )
+
     def __init__(self, *tuples):
         """Assign the tuples to self, to be passed in upon calling."""
         self.tuples = tuples
@@ -125,6 +140,10 @@ class ParseRoot(object):
                 )
                 logging.debug("Logging level set to: %d", level)
 
+                if args.profile is not None:
+                    with profiling(args.profile):
+                        return function(args)
+
             return function(args)
 
         # return the function if this is not a main class
@@ -170,8 +189,8 @@ class Main(ParseRoot):
     create_parser = CreateParser
 
     def __init__(self, *tuples):
-        """Inject the verbosity tuple into the (args, kwargs) tuples."""
-        super(Main, self).__init__(self.verbosity_tuple, *tuples)
+        """Inject the verbosity and profile tuples into the (args, kwargs) tuples."""
+        super(Main, self).__init__(self.verbosity_tuple, self.profile_tuple, *tuples)
 
 
 class MainCommands(ParseRoot):
@@ -181,9 +200,9 @@ class MainCommands(ParseRoot):
     create_parser = CreateParserCommands
 
     def __init__(self, *command_tuples):
-        """Inject the verbosity tuple into the command tuples."""
+        """Inject the verbosity and profile tuples into the command tuples."""
         super(MainCommands, self).__init__(
-            (cmd_name, cmd_help, tuple(list(tuples) + [self.verbosity_tuple]))
+            (cmd_name, cmd_help, tuple(list(tuples) + [self.verbosity_tuple, self.profile_tuple]))
             for cmd_name, cmd_help, tuples in command_tuples
         )
 
@@ -285,6 +304,36 @@ error = LogDecoratorContainer(logging.ERROR)
 critical = LogDecoratorContainer(logging.CRITICAL)
 
 
+#
+#   Timing Decorators
+#
+
+
+class Timed(object):
+    """Record the seconds taken by each call of a function as a stage of the metrics registry, while it is enabled."""
+
+    def __init__(self, stage, registry=None):
+        """Store the name of the stage and the registry to record to."""
+        self.stage = stage
+        self.registry = metrics if registry is None else registry
+
+    def __call__(self, function):
+        """Time the decorated function while the registry is enabled, and call it directly otherwise."""
+        stage, registry = self.stage, self.registry
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not registry.enabled:
+                return function(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                registry.observe(stage, time.perf_counter() - start)
+
+        return wrapper
+
+
 @Main()
 @info.all
 def main(args):
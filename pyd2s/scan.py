@@ -0,0 +1,105 @@
+#!/bin/usr/python3
+
+# standard imports
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+# module imports
+from pyd2s.Game import Game
+from pyd2s.Items import Verification, VERIFY_OFF
+from pyd2s.constants import CLASS_STRINGS
+from pyd2s.decorators import Main
+from pyd2s.utilities import save_dir
+
+
+def list_saves(directory=save_dir):
+    """Return the paths of the save files in a directory, listing it only once."""
+    with os.scandir(directory) as entries:
+        return sorted(entry.path for entry in entries if entry.name.endswith(".d2s") and entry.is_file())
+
+
+def summarize(path, verify=False):
+    """Parse a save file and return a compact summary of the character, or the error that prevented it."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+
+        # item details are never needed for a summary, so they are not decoded or checked
+        game = Game(verification=Verification(VERIFY_OFF))
+        game.from_bytes(data, verify=verify, lazy=True)
+
+    except Exception as e:
+        return {"file": path, "error": f"{e.__class__.__name__}: {e}"}
+
+    return {
+        "file": path,
+        "size": len(data),
+        "name": game.char_name.decode("latin-1"),
+        "class": CLASS_STRINGS.get(game.char_class, game.char_class),
+        "level": game.char_level,
+        "attributes": game.attributes.views(),
+        "items": game.items.count,
+        "corpse_items": game.corpse.count,
+        "merc_items": game.merc_items.count,
+    }
+
+
+def summarize_verified(path):
+    return summarize(path, verify=True)
+
+
+def scan_saves(directory=save_dir, workers=None, chunksize=64, verify=False):
+    """
+    Yield a summary of each save file in a directory, as soon as it is available.
+
+    The files are spread across a pool of 'workers' processes (one per cpu by default) in chunks of 'chunksize'
+    paths, so summaries are not yielded in any particular order. A single worker parses in this process.
+    """
+    paths = list_saves(directory)
+    function = summarize_verified if verify else summarize
+
+    if workers == 1:
+        for path in paths:
+            yield function(path)
+        return
+
+    with Pool(workers) as pool:
+        for summary in pool.imap_unordered(function, paths, chunksize):
+            yield summary
+
+
+@Main(
+    (["directory"], dict(nargs="?", default=save_dir, help="The directory of save files to scan.")),
+    (["-w", "--workers"], dict(default=None, type=int, help="The number of processes to parse with.")),
+    (["-c", "--chunksize"], dict(default=64, type=int, help="The number of files given to a process at a time.")),
+    (["-o", "--output"], dict(default=None, help="The JSON lines file to write to (default: stdout).")),
+    (["--verify"], dict(default=False, action="store_true", help="Reject files with an invalid checksum.")),
+)
+def main(args):
+
+    output = sys.stdout if args.output is None else open(args.output, "w")
+    files, errors, size = 0, 0, 0
+    start = time.perf_counter()
+    try:
+        for summary in scan_saves(args.directory, args.workers, args.chunksize, args.verify):
+            output.write(json.dumps(summary) + "\n")
+            files += 1
+            if "error" in summary:
+                errors += 1
+            else:
+                size += summary["size"]
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    # throughput statistics go to stderr, so the output remains valid JSON lines
+    elapsed = time.perf_counter() - start
+    print(
+        f"Scanned {files} files ({errors} errors, {size / 1e6:.2f} MB) in {elapsed:.2f} seconds: "
+        f"{files / elapsed if elapsed else 0:.1f} files/s, {size / 1e6 / elapsed if elapsed else 0:.2f} MB/s",
+        file=sys.stderr,
+    )
+    return 0 if not errors else 1
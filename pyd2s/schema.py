@@ -0,0 +1,429 @@
+# standard imports
+from collections import namedtuple
+
+# module imports
+from pyd2s.BitIO import BitWriter
+from pyd2s.MagicalProperties import MagicalProperties, skip_magical_properties
+from pyd2s.TrackedList import TrackedList
+from pyd2s.constants import (
+    QUALITY_CRAFTED,
+    QUALITY_HIGH,
+    QUALITY_LOW,
+    QUALITY_MAGIC,
+    QUALITY_RARE,
+    QUALITY_SET,
+    QUALITY_UNIQUE,
+    SET_LIST_MAP,
+    TYPE_TOME,
+)
+
+
+#
+# 	field kinds
+#
+
+# an integer of a fixed number of bits
+FIELD_INT = "int"
+# a single bit, decoded as a bool
+FIELD_BOOL = "bool"
+# bits that are skipped when read, and written as a constant value
+FIELD_CONSTANT = "constant"
+# the 3 character item code followed by a space, 8 bits each
+FIELD_CODE = "code"
+# the number of sockets (4 bits), decoded as a list of empty sockets
+FIELD_SOCKETS = "sockets"
+# 3 prefixes and 3 suffixes of a rare name, each a 1 bit flag followed by 11 bits if set
+FIELD_AFFIXES = "affixes"
+# a null terminated string of 7 bit characters
+FIELD_STRING = "string"
+# a list of magical properties
+FIELD_PROPERTIES = "properties"
+# a list of magical property lists, as many as the set list map gives for 'name_id_last'
+FIELD_SET_PROPERTIES = "set_properties"
+# the items in the sockets, which follow the item (and are part of its binary)
+FIELD_SOCKETED_ITEMS = "socketed_items"
+
+# the kinds of fields with a fixed number of bits, which are read and written together
+FIXED_KINDS = (FIELD_INT, FIELD_BOOL, FIELD_CONSTANT, FIELD_CODE, FIELD_SOCKETS)
+
+# the modes a layout is compiled in
+DECODE = "decode"
+SKIP = "skip"
+ENCODE = "encode"
+
+
+# a field of the layout, stored in the item attribute 'name'
+Field = namedtuple("Field", ["name", "bits", "kind", "value"], defaults=[FIELD_INT, 0])
+
+# fields that are only present when 'static' (a function of the item key) is true, if the key is known at
+# compile time, or otherwise when 'test' (an expression of 'item') is true at run time
+Branch = namedtuple("Branch", ["static", "test", "fields"])
+
+# the values of an item that determine the code compiled for it
+ItemKey = namedtuple("ItemKey", ["simple", "quality", "runeword", "socketed"])
+
+
+def constant(bits, value=0):
+    return Field(None, bits, FIELD_CONSTANT, value)
+
+
+def when(static, *fields):
+    return Branch(static, None, fields)
+
+
+def where(expression, *fields):
+    return Branch(None, expression, fields)
+
+
+#
+# 	item layout
+#
+
+# the fields at the beginning of every item
+ITEM_HEADER = (
+    Field("quest_item", 1, FIELD_BOOL),
+    constant(3),
+    Field("identified", 1, FIELD_BOOL),
+    constant(5),
+    # sometimes potions have this bit set when another potion will fill this spot upon use
+    Field("autofill", 1),
+    Field("socketed", 1, FIELD_BOOL),
+    constant(1),
+    Field("new", 1, FIELD_BOOL),
+    # autoequip if the item is on a corpse (this is probably 2, smaller bitflags)
+    Field("autoequip", 2),
+    Field("ear", 1, FIELD_BOOL),
+    Field("starter", 1, FIELD_BOOL),
+    constant(3),
+    Field("simple", 1, FIELD_BOOL),
+    Field("ethereal", 1, FIELD_BOOL),
+    constant(1, 1),
+    Field("personalized", 1, FIELD_BOOL),
+    constant(1),
+    Field("runeword", 1, FIELD_BOOL),
+    # notes from: https://github.com/nickshanks/Alkor/blob/master/Source/Item.m#L103
+    # 	(unknown 5 bits)
+    # 	(version: 8 bits)
+    # 		0 = pre-1.08; 1 = 1.08/1.09 normal; 2 = 1.10 normal; 100 = 1.08/1.09 expansion; 101 = 1.10 expansion
+    # 	(unknown: 2 bits)
+    Field("unknown", 15),
+    Field("parent", 3),
+    # this should be zero if the parent is not 'ITEM_EQUIPPED'
+    Field("equipped", 4),
+    Field("x", 4),
+    Field("y", 3),
+    constant(1),
+    Field("stored", 3),
+    Field("code", 32, FIELD_CODE),
+    # this has to be stored, as some items will set 1 without having
+    # (fails on Mephisto's Soulstone which reports sockets_filled == 1)
+    Field("sockets_filled", 3),
+)
+
+# the fields after the header that determine the layout of the rest of a complex item
+ITEM_QUALITY = Branch(
+    lambda key: not key.simple,
+    "not item.simple",
+    (
+        Field("id", 32),
+        Field("level", 7),
+        Field("quality", 4),
+    ),
+)
+
+# the rest of a complex item
+ITEM_DETAILS = when(
+    lambda key: not key.simple,
+    Field("multipic", 1, FIELD_BOOL),
+    where("item.multipic", Field("pic_id", 3)),
+    Field("class_specific", 1, FIELD_BOOL),
+    where("item.class_specific", Field("class_info", 11)),
+    # different types of quality information
+    when(lambda key: key.quality in (QUALITY_LOW, QUALITY_HIGH), Field("quality_info", 3)),
+    when(lambda key: key.quality == QUALITY_MAGIC, Field("name_id_first", 11), Field("name_id_last", 11)),
+    when(lambda key: key.quality == QUALITY_SET, Field("name_id_first", 12)),
+    when(
+        lambda key: key.quality in (QUALITY_CRAFTED, QUALITY_RARE),
+        Field("name_id_first", 8),
+        Field("name_id_last", 8),
+        Field("magical_name", 0, FIELD_AFFIXES),
+    ),
+    when(lambda key: key.quality == QUALITY_UNIQUE, Field("name_id_first", 12)),
+    # the runeword id is followed by 4 bits that always seem to be 5
+    when(lambda key: key.runeword, Field("runeword_id", 12), constant(4, 5)),
+    where("item.personalized", Field("personalized_name", 7, FIELD_STRING)),
+    where("item.type_id == TYPE_TOME", Field("tome_info", 5)),
+    # 1 bit timestamp?
+    Field("unusual_bit", 1),
+    where("item.has_defense", Field("defense", 11)),
+    where(
+        "item.has_durability",
+        Field("durability_max", 8),
+        where("item.durability_max", Field("durability_current", 8), constant(1)),
+    ),
+    where("item.has_quantity", Field("quantity", 9)),
+    when(lambda key: key.socketed, Field("sockets", 4, FIELD_SOCKETS)),
+    # set item name_id_last houses the key to the set list map (the number of set property lists)
+    when(lambda key: key.quality == QUALITY_SET, Field("name_id_last", 5)),
+    Field("magical_props", 0, FIELD_PROPERTIES),
+    when(lambda key: key.quality == QUALITY_SET, Field("set_props", 0, FIELD_SET_PROPERTIES)),
+    when(lambda key: key.runeword, Field("runeword_props", 0, FIELD_PROPERTIES)),
+    when(lambda key: key.socketed, Field("sockets", 0, FIELD_SOCKETED_ITEMS)),
+)
+
+ITEM_LAYOUT = ITEM_HEADER + (ITEM_QUALITY, ITEM_DETAILS)
+
+
+def item_key(item):
+    """Return the values of an item that determine the code compiled for it."""
+    if item.simple:
+        return ItemKey(True, None, False, False)
+    return ItemKey(False, item.quality, bool(item.runeword), bool(item.socketed))
+
+
+#
+# 	code generation
+#
+
+
+def flatten(layout, key):
+    """Yield the fields and branches of a layout, with the branches the key decides replaced by their fields."""
+    for entry in layout:
+        if isinstance(entry, Field):
+            yield entry
+        elif key is not None and entry.static is not None:
+            if entry.static(key):
+                yield from flatten(entry.fields, key)
+        else:
+            assert entry.test is not None, "A branch without a test requires an item key."
+            yield Branch(None, entry.test, tuple(flatten(entry.fields, key)))
+
+
+def decode_run(run):
+    """Return the lines that read a run of fixed width fields with a single read."""
+    lines = [f"v = take({sum(field.bits for field in run)})"]
+    offset = 0
+    for field in run:
+        value = f"v >> {offset} & {(1 << field.bits) - 1:#x}" if offset else f"v & {(1 << field.bits) - 1:#x}"
+        if field.kind == FIELD_INT:
+            lines.append(f"set_(item, {field.name!r}, {value})")
+        elif field.kind == FIELD_BOOL:
+            lines.append(f"set_(item, {field.name!r}, bool({value}))")
+        elif field.kind == FIELD_CODE:
+            lines.append(f'item.set_code(({value}).to_bytes(4, "little")[:-1].decode())')
+        elif field.kind == FIELD_SOCKETS:
+            lines.append(f"set_(item, {field.name!r}, TrackedList([None] * ({value})))")
+        offset += field.bits
+    return lines
+
+
+def encode_run(run):
+    """Return the lines that write a run of fixed width fields with a single write."""
+    terms = []
+    constants = 0
+    offset = 0
+    for field in run:
+        shift = f" << {offset}" if offset else ""
+        mask = (1 << field.bits) - 1
+        if field.kind == FIELD_INT:
+            terms.append(f"(item.{field.name} & {mask:#x}){shift}")
+        elif field.kind == FIELD_BOOL:
+            terms.append(f"({1 << offset:#x} if item.{field.name} else 0)")
+        elif field.kind == FIELD_CONSTANT:
+            constants |= field.value << offset
+        elif field.kind == FIELD_CODE:
+            # the code is followed by a space
+            terms.append(f'int.from_bytes(item.{field.name}.encode(), "little"){shift}')
+            constants |= 0x20 << (offset + 24)
+        elif field.kind == FIELD_SOCKETS:
+            terms.append(f"(len(item.{field.name}) & {mask:#x}){shift}")
+        offset += field.bits
+    if constants or not terms:
+        terms.append(f"{constants:#x}")
+    return [f"write({' | '.join(terms)}, {offset})"]
+
+
+def generate(layout, mode, key, indent="    "):
+    """Return the lines of code for the given mode that read or write the fields of a flattened layout."""
+    lines = []
+    run = []
+
+    def flush():
+        if run:
+            lines.extend(indent + line for line in (encode_run(run) if mode == ENCODE else decode_run(run)))
+            run.clear()
+
+    for entry in layout:
+        if isinstance(entry, Field) and entry.kind in FIXED_KINDS:
+            run.append(entry)
+            continue
+        flush()
+
+        if isinstance(entry, Branch):
+            lines.append(f"{indent}if {entry.test}:")
+            lines.extend(generate(entry.fields, mode, key, indent + "    ") or [indent + "    pass"])
+            continue
+
+        name = entry.name
+        if entry.kind == FIELD_AFFIXES:
+            if mode == ENCODE:
+                lines += [
+                    f"{indent}for index in range(3):",
+                    f"{indent}    for fix in (item.{name}_prefixes[index], item.{name}_suffixes[index]):",
+                    f"{indent}        if fix:",
+                    f"{indent}            write((fix & 0x7ff) << 1 | 1, 12)",
+                    f"{indent}        else:",
+                    f"{indent}            write(0, 1)",
+                ]
+            else:
+                lines += [
+                    f"{indent}prefixes, suffixes = [], []",
+                    f"{indent}for _ in range(3):",
+                    f"{indent}    prefixes.append(take(11) if take(1) else 0)",
+                    f"{indent}    suffixes.append(take(11) if take(1) else 0)",
+                    f"{indent}set_(item, {name + '_prefixes'!r}, TrackedList(prefixes))",
+                    f"{indent}set_(item, {name + '_suffixes'!r}, TrackedList(suffixes))",
+                ]
+
+        elif entry.kind == FIELD_STRING:
+            mask = (1 << entry.bits) - 1
+            if mode == ENCODE:
+                lines += [
+                    f"{indent}for c in item.{name}:",
+                    f"{indent}    write(ord(c) & {mask:#x}, {entry.bits})",
+                    f"{indent}write(0, {entry.bits})",
+                ]
+            else:
+                lines += [
+                    f'{indent}name = ""',
+                    f"{indent}c = take({entry.bits})",
+                    f"{indent}while c:",
+                    f"{indent}    name += chr(c)",
+                    f"{indent}    c = take({entry.bits})",
+                    f"{indent}set_(item, {name!r}, name)",
+                ]
+
+        elif entry.kind == FIELD_PROPERTIES:
+            if mode == ENCODE:
+                lines.append(f"{indent}item.{name}.to_bitwriter(writer)")
+            elif mode == SKIP:
+                lines.append(f"{indent}skip_magical_properties(bitio)")
+            else:
+                lines.append(f"{indent}set_(item, {name!r}, MagicalProperties(bitio))")
+
+        elif entry.kind == FIELD_SET_PROPERTIES:
+            if mode == ENCODE:
+                lines += [
+                    f"{indent}if item.{name} is not None:",
+                    f"{indent}    for props in item.{name}:",
+                    f"{indent}        props.to_bitwriter(writer)",
+                ]
+            elif mode == SKIP:
+                lines += [
+                    f"{indent}for _ in range(SET_LIST_MAP[item.name_id_last]):",
+                    f"{indent}    skip_magical_properties(bitio)",
+                ]
+            else:
+                lines.append(
+                    f"{indent}set_(item, {name!r}, "
+                    f"TrackedList([MagicalProperties(bitio) for _ in range(SET_LIST_MAP[item.name_id_last])]))"
+                )
+
+        elif entry.kind == FIELD_SOCKETED_ITEMS:
+            # socketed items are whole items of their own, following this one
+            if mode == ENCODE:
+                lines += [
+                    f"{indent}result = writer.to_bytes()",
+                    f"{indent}for socket in item.{name}:",
+                    f"{indent}    if socket is None:",
+                    f"{indent}        break",
+                    f"{indent}    result += socket.to_bytes()",
+                    f"{indent}return result",
+                ]
+            elif mode == SKIP:
+                lines += [
+                    f"{indent}for _ in range(item.sockets_filled):",
+                    f"{indent}    type(item)(handle, lazy=True)",
+                ]
+            else:
+                # (set with the method of list, so the items read do not mark the sockets as changed)
+                lines += [
+                    f"{indent}for index in range(item.sockets_filled):",
+                    f"{indent}    list.__setitem__(item.{name}, index, type(item)(handle, verification=verification))",
+                ]
+
+        else:
+            raise ValueError(f"Invalid field kind: {entry.kind}")
+
+    flush()
+    return lines
+
+
+def compile_layout(layout, mode, key=None, name="codec"):
+    """
+    Compile a layout into a function for the given mode, specialized for an item key.
+
+    Decoding and skipping functions take (item, bitio, handle, verification) and store the values read on the
+    item with object.__setattr__ (so they do not mark it as changed), with skipping leaving the magical properties
+    and socketed items undecoded. Encoding functions take an
+    item and return its bytes.
+    """
+    fields = tuple(flatten(layout, key))
+    if mode == ENCODE:
+        lines = [f"def {name}(item):", '    writer = BitWriter(b"JM")', "    write = writer.write"]
+        lines += generate(fields, mode, key)
+        if not lines[-1].strip().startswith("return"):
+            lines.append("    return writer.to_bytes()")
+    else:
+        lines = [
+            f"def {name}(item, bitio, handle=None, verification=None):",
+            "    set_ = object.__setattr__",
+            "    take = bitio._take",
+        ]
+        lines += generate(fields, mode, key)
+
+    source = "\n".join(lines) + "\n"
+    namespace = {
+        "BitWriter": BitWriter,
+        "MagicalProperties": MagicalProperties,
+        "SET_LIST_MAP": SET_LIST_MAP,
+        "TYPE_TOME": TYPE_TOME,
+        "TrackedList": TrackedList,
+        "skip_magical_properties": skip_magical_properties,
+    }
+    exec(compile(source, f"<pyd2s.schema {name}>", "exec"), namespace)
+    function = namespace[name]
+    function.source = source
+    return function
+
+
+# the compiled functions, by mode and item key
+CODECS = {}
+
+
+def header_decoder():
+    """Return the function that decodes the fields of an item up to and including its quality."""
+    try:
+        return CODECS[DECODE, None]
+    except KeyError:
+        function = CODECS[DECODE, None] = compile_layout(ITEM_HEADER + (ITEM_QUALITY,), DECODE, None, "decode_header")
+        return function
+
+
+def details_decoder(key, lazy=False):
+    """Return the function that decodes (or, when 'lazy', skips) the rest of a complex item with the given key."""
+    mode = SKIP if lazy else DECODE
+    try:
+        return CODECS[mode, key]
+    except KeyError:
+        function = CODECS[mode, key] = compile_layout((ITEM_DETAILS,), mode, key, f"{mode}_details")
+        return function
+
+
+def encoder(key):
+    """Return the function that encodes an item with the given key."""
+    try:
+        return CODECS[ENCODE, key]
+    except KeyError:
+        function = CODECS[ENCODE, key] = compile_layout(ITEM_LAYOUT, ENCODE, key, "encode")
+        return function
@@ -0,0 +1,266 @@
+#!/bin/usr/python3
+"""
+Create valid save and storage files of any size from a seed, for testing without the saves of a Diablo 2 installation.
+
+The same seed and sizes always give the same bytes. Items cycle through every quality and cover runewords, set items
+with their set property lists, items with filled sockets, personalized, ethereal and simple items, and random
+magical properties, so every path of the item layout is used.
+"""
+
+# standard imports
+import os
+import random
+import struct
+from io import BytesIO
+
+# module imports
+from pyd2s import constants
+from pyd2s.Attributes import Attributes
+from pyd2s.BitIO import BitWriter
+from pyd2s.Game import HEADER, HEADER_FIELDS, Game, patch_checksum
+from pyd2s.Items import Item, Items
+from pyd2s.MagicalProperties import MagicalProperties, MagicalProperty
+from pyd2s.Storage import Storage
+from pyd2s.constants import (
+    CLASS_STRINGS,
+    ITEM_SOCKETED,
+    ITEM_STORED,
+    QUALITY_CRAFTED,
+    QUALITY_HIGH,
+    QUALITY_LOW,
+    QUALITY_MAGIC,
+    QUALITY_RARE,
+    QUALITY_SET,
+    QUALITY_STRINGS,
+    QUALITY_UNIQUE,
+    STATUS_EXPANSION,
+    STORED_CUBE,
+    STORED_INVENTORY,
+    STORED_STASH,
+    TYPE_TOME,
+)
+from pyd2s.decorators import Main
+
+
+# the properties whose first value is a character class
+CLASS_PROPERTIES = (83, 84)
+
+
+def random_properties(r, count):
+    """Return a list of magical properties with random flags and values."""
+    props = MagicalProperties()
+    flags = sorted(constants.MAGICAL_PROPERTIES)
+    for _ in range(count):
+        prop = MagicalProperty(r.choice(flags))
+        prop.values = [r.randrange(1 << length) - (prop.bias or 0) for length in prop.lengths]
+        if prop.flag in CLASS_PROPERTIES:
+            prop.values[0] = r.choice(list(CLASS_STRINGS))
+        props.append(prop)
+    return props
+
+
+def random_simple_item(r, parent=ITEM_STORED):
+    """Return a gem, rune or other item without details, such as those held in sockets."""
+    item = Item()
+    item.set_code(r.choice([*constants.GEM_CODES, *constants.RUNE_CODES]))
+    item.identified = True
+    item.simple = True
+    item.parent = parent
+    if parent != ITEM_SOCKETED:
+        item.stored = r.choice([STORED_INVENTORY, STORED_CUBE, STORED_STASH])
+        item.x, item.y = r.randrange(10), r.randrange(8)
+    return item
+
+
+def random_item(r, quality=None):
+    """Return an item with details, of the given quality or a random one, which may hold items in its sockets."""
+    item = Item()
+    codes = [*constants.ARMOR_KEYS, *constants.WEAPON_KEYS, *constants.SHIELD_KEYS, *constants.TOME_KEYS]
+    item.set_code(r.choice(codes))
+    item.parent, item.stored = ITEM_STORED, r.choice([STORED_INVENTORY, STORED_CUBE, STORED_STASH])
+    item.x, item.y = r.randrange(10), r.randrange(8)
+    item.identified = r.random() < 0.9
+    item.ethereal = r.random() < 0.1
+    item.unknown = r.choice([3232, 3233])
+
+    item.id, item.level = r.getrandbits(32), r.randrange(1, 100)
+    item.quality = r.choice(list(QUALITY_STRINGS)) if quality is None else quality
+    item.multipic = r.random() < 0.2
+    if item.multipic:
+        item.pic_id = r.randrange(8)
+    item.class_specific = r.random() < 0.1
+    if item.class_specific:
+        item.class_info = r.randrange(2048)
+
+    if item.quality in (QUALITY_LOW, QUALITY_HIGH):
+        item.quality_info = r.randrange(8)
+    elif item.quality == QUALITY_MAGIC:
+        item.name_id_first = r.choice([0, *constants.MAGIC_PREFIX_STRINGS])
+        item.name_id_last = r.choice([0, *constants.MAGIC_SUFFIX_STRINGS])
+    elif item.quality == QUALITY_SET:
+        item.name_id_first = r.choice(list(constants.SET_STRINGS))
+        item.name_id_last = r.choice(list(constants.SET_LIST_MAP))
+    elif item.quality in (QUALITY_RARE, QUALITY_CRAFTED):
+        item.name_id_first = r.choice(list(constants.RARE_NAMES))
+        item.name_id_last = r.choice(list(constants.RARE_NAMES))
+        item.magical_name_prefixes = [r.choice([0, r.randrange(1, 2048)]) for _ in range(3)]
+        item.magical_name_suffixes = [r.choice([0, r.randrange(1, 2048)]) for _ in range(3)]
+    elif item.quality == QUALITY_UNIQUE:
+        item.name_id_first = r.choice(list(constants.UNIQUE_STRINGS))
+
+    if item.type_id == TYPE_TOME:
+        item.tome_info = r.randrange(32)
+    if item.has_defense:
+        item.defense = r.randrange(2048)
+    if item.has_durability:
+        item.durability_max = r.choice([0, r.randrange(1, 256)])
+        item.durability_current = r.randrange(item.durability_max + 1) if item.durability_max else None
+    if item.has_quantity:
+        item.quantity = r.randrange(512)
+
+    item.personalized = r.random() < 0.1
+    if item.personalized:
+        item.personalized_name = "".join(chr(r.randrange(65, 91)) for _ in range(r.randrange(2, 16)))
+
+    item.magical_props = random_properties(r, r.randrange(12))
+    if item.quality == QUALITY_SET:
+        item.set_props = [
+            random_properties(r, r.randrange(1, 4)) for _ in range(constants.SET_LIST_MAP[item.name_id_last])
+        ]
+
+    # runewords are always socketed, other items sometimes are
+    item.runeword = r.random() < 0.1
+    if item.runeword:
+        item.runeword_id = r.choice(list(constants.RUNEWORD_STRINGS))
+        item.runeword_props = random_properties(r, r.randrange(1, 6))
+    if item.runeword or r.random() < 0.2:
+        item.socketed = True
+        item.sockets = [None] * r.randrange(1, 7)
+        item.sockets_filled = len(item.sockets) if item.runeword else r.randrange(len(item.sockets) + 1)
+        for index in range(item.sockets_filled):
+            item.sockets[index] = random_simple_item(r, parent=ITEM_SOCKETED)
+    return item
+
+
+def random_items(r, count, simple=0.25):
+    """Return a list of random items, cycling through every quality, with a share of simple items."""
+    qualities = sorted(QUALITY_STRINGS)
+    items = Items()
+    for index in range(count):
+        if r.random() < simple:
+            items.append(random_simple_item(r))
+        else:
+            items.append(random_item(r, quality=qualities[index % len(qualities)]))
+    return items
+
+
+def items_to_bytes(items):
+    """Return the bytes of a list of items."""
+    # a list of a single item is read as a corpse header, so that count cannot be read back
+    assert items.count != 1, "A list of one item cannot be read back."
+    return items.to_bytes()
+
+
+def random_attributes(r):
+    """Return the bytes of a character's attributes with random values."""
+    writer = BitWriter(Attributes.MAGIC)
+    for flag, _, length, _ in Attributes.SPECIFICATION:
+        writer.write(flag, 9)
+        writer.write(r.randrange(1, 1 << min(length, 16)), length)
+    writer.write(0x1FF, 9)
+    return writer.to_bytes()
+
+
+def synthetic_game_bytes(seed=0, items=20, merc_items=0):
+    """Return the bytes of a save file with random items in the inventory and, if any, with a mercenary."""
+    r = random.Random(seed)
+    header = dict(
+        magic=Game.MAGIC,
+        file_version=96,
+        file_size=0,
+        file_checksum=0,
+        active_weapon=0,
+        char_name=f"Synthetic{seed % 1000}".encode(),
+        char_status=bytes([STATUS_EXPANSION]),
+        char_progression=b"\x00",
+        char_class=r.choice(list(CLASS_STRINGS)),
+        char_level=r.randrange(1, 100),
+        last_played=r.getrandbits(32),
+        assigned_skills=bytes(64),
+        lmb_skill=0,
+        rmb_skill=0,
+        lmb_skill_swp=0,
+        rmb_skill_swp=0,
+        char_menu_appearance=bytes(32),
+        difficulty=bytes(3),
+        map_id=r.getrandbits(32),
+        merc_dead=0,
+        merc_id=r.getrandbits(32) | 1 if merc_items else 0,
+        merc_name_id=0,
+        merc_type=0,
+        merc_exp=0,
+        quests=bytes(298),
+        waypoints=bytes(81),
+        npc_intros=bytes(51),
+    )
+    data = bytearray(HEADER.pack(*(header[name] for name in HEADER_FIELDS)))
+
+    # the unknown bytes after the class and the time last played, as the game writes them
+    data[41:43], data[52:56] = b"\x10\x1e", b"\xff" * 4
+    data += random_attributes(r) + b"if" + bytes(30)
+    data += items_to_bytes(random_items(r, items)) + b"JM\x00\x00" + Game.MERCENARY_MAGIC
+    if merc_items:
+        data += items_to_bytes(random_items(r, merc_items, simple=0))
+
+    data[8:12] = struct.pack("<I", len(data))
+    return patch_checksum(bytes(data))
+
+
+def synthetic_game(seed=0, items=20, merc_items=0):
+    """Return a Game read from a random save file."""
+    game = Game()
+    game.from_bytes(synthetic_game_bytes(seed, items, merc_items))
+    return game
+
+
+def synthetic_storage(file_path, seed=0, items=100):
+    """Return a Storage of random items read from a storage file written to the given path."""
+    storage = Storage(file_path)
+    storage.extend(random_items(random.Random(seed), items))
+    binary = items_to_bytes(storage)
+    storage.clear()
+    storage.from_handle(BytesIO(binary))
+    storage.write()
+    return storage
+
+
+def write_saves(directory, count=10, items=20, merc_items=0, storage_items=0, seed=0):
+    """Write save files, and a storage file when it has items, to a directory, returning their paths."""
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"Synthetic{index:04}.d2s")
+        with open(path, "wb") as f:
+            f.write(synthetic_game_bytes(seed + index, items, merc_items))
+        paths.append(path)
+
+    if storage_items:
+        paths.append(synthetic_storage(os.path.join(directory, "storage.d2i"), seed, storage_items).file_path)
+    return paths
+
+
+@Main(
+    (["directory"], dict(help="The directory to write the files to.")),
+    (["-n", "--count"], dict(default=10, type=int, help="The number of save files.")),
+    (["-i", "--items"], dict(default=20, type=int, help="The number of items in each save file.")),
+    (["-m", "--merc-items"], dict(default=0, type=int, help="The number of items of each mercenary.")),
+    (["-s", "--storage-items"], dict(default=0, type=int, help="The number of items in a storage file.")),
+    (["--seed"], dict(default=0, type=int, help="The seed of the first save file.")),
+)
+def main(args):
+    paths = write_saves(args.directory, args.count, args.items, args.merc_items, args.storage_items, args.seed)
+    size = sum(os.path.getsize(path) for path in paths)
+    print(f"Wrote {len(paths)} files ({size / 1e6:.2f} MB) to {args.directory}")
+    return 0
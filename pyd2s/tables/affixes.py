@@ -0,0 +1,1393 @@
+"""The names of the magical prefixes and suffixes."""
+
+
+MAGIC_PREFIX_STRINGS = {
+    2: "Sturdy",
+    3: "Strong",
+    4: "Glorious",
+    5: "Blessed",
+    6: "Saintly",
+    7: "Holy",
+    8: "Devious",
+    9: "Fortified",
+    13: "Jagged",
+    14: "Deadly",
+    15: "Vicious",
+    16: "Brutal",
+    17: "Massive",
+    18: "Savage",
+    19: "Merciless",
+    20: "Vulpine",
+    25: "Tireless",
+    26: "Rugged",
+    27: "Bronze",
+    28: "Iron",
+    29: "Steel",
+    30: "Silver",
+    32: "Gold",
+    33: "Platinum",
+    34: "Meteoric",
+    35: "Sharp",
+    36: "Fine",
+    37: "Warrior's",
+    38: "Soldier's",
+    39: "Knight's",
+    40: "Lord's",
+    41: "King's",
+    42: "Howling",
+    43: "Fortuitous",
+    49: "Glimmering",
+    50: "Glowing",
+    53: "Lizard's",
+    55: "Snake's",
+    56: "Serpent's",
+    57: "Serpent's",
+    58: "Drake's",
+    59: "Dragon's",
+    60: "Dragon's",
+    61: "Wyrm's",
+    64: "Prismatic",
+    65: "Prismatic",
+    66: "Azure",
+    67: "Lapis",
+    68: "Lapis",
+    69: "Cobalt",
+    70: "Cobalt",
+    72: "Sapphire",
+    75: "Crimson",
+    76: "Burgundy",
+    77: "Burgundy",
+    78: "Garnet",
+    79: "Garnet",
+    81: "Ruby",
+    84: "Ocher",
+    85: "Tangerine",
+    86: "Tangerine",
+    87: "Coral",
+    88: "Coral",
+    90: "Amber",
+    93: "Beryl",
+    94: "Jade",
+    95: "Jade",
+    96: "Viridian",
+    97: "Viridian",
+    99: "Emerald",
+    101: "Fletcher's",
+    102: "Archer's",
+    103: "Archer's",
+    104: "Monk's",
+    105: "Priest's",
+    106: "Priest's",
+    107: "Summoner's",
+    108: "Necromancer's",
+    109: "Necromancer's",
+    110: "Angel's",
+    111: "Arch-Angel's",
+    112: "Arch-Angel's",
+    113: "Slayer's",
+    114: "Berserker's",
+    115: "Berserker's",
+    118: "Triumphant",
+    119: "Stout",
+    120: "Stout",
+    121: "Stout",
+    122: "Burly",
+    123: "Burly",
+    124: "Burly",
+    125: "Stalwart",
+    126: "Stalwart",
+    127: "Stalwart",
+    128: "Stout",
+    129: "Stout",
+    130: "Stout",
+    131: "Burly",
+    132: "Burly",
+    133: "Stalwart",
+    134: "Stalwart",
+    135: "Stout",
+    136: "Stout",
+    137: "Burly",
+    138: "Stalwart",
+    139: "Blanched",
+    140: "Eburin",
+    141: "Bone",
+    142: "Ivory",
+    143: "Sturdy",
+    144: "Sturdy",
+    145: "Strong",
+    146: "Glorious",
+    147: "Blessed",
+    148: "Saintly",
+    149: "Holy",
+    150: "Godly",
+    151: "Devious",
+    152: "Blank",
+    153: "Null",
+    154: "Antimagic",
+    155: "Red",
+    156: "Red",
+    157: "Sanguinary",
+    158: "Sanguinary",
+    159: "Bloody",
+    160: "Red",
+    161: "Sanguinary",
+    162: "Bloody",
+    163: "Red",
+    164: "Sanguinary",
+    165: "Bloody",
+    166: "Scarlet",
+    167: "Crimson",
+    168: "Jagged",
+    169: "Jagged",
+    170: "Jagged",
+    171: "Forked",
+    172: "Forked",
+    173: "Serrated",
+    174: "Serrated",
+    175: "Jagged",
+    176: "Jagged",
+    177: "Forked",
+    178: "Forked",
+    179: "Serrated",
+    180: "Jagged",
+    181: "Forked",
+    182: "Serrated",
+    183: "Carbuncle",
+    184: "Carmine",
+    185: "Vermillion",
+    186: "Jagged",
+    187: "Deadly",
+    188: "Vicious",
+    189: "Brutal",
+    190: "Massive",
+    191: "Savage",
+    192: "Merciless",
+    193: "Ferocious",
+    194: "Cruel",
+    195: "Cinnabar",
+    196: "Rusty",
+    197: "Realgar",
+    198: "Ruby",
+    199: "Vulpine",
+    200: "Dun",
+    201: "Tireless",
+    202: "Tireless",
+    203: "Brown",
+    204: "Rugged",
+    205: "Rugged",
+    206: "Rugged",
+    207: "Rugged",
+    208: "Rugged",
+    209: "Rugged",
+    210: "Rugged",
+    211: "Rugged",
+    212: "Rugged",
+    213: "Rugged",
+    214: "Rugged",
+    215: "Vigorous",
+    216: "Chestnut",
+    217: "Maroon",
+    218: "Bronze",
+    219: "Bronze",
+    220: "Bronze",
+    221: "Iron",
+    222: "Iron",
+    223: "Iron",
+    224: "Steel",
+    225: "Steel",
+    226: "Steel",
+    227: "Bronze",
+    228: "Bronze",
+    229: "Bronze",
+    230: "Iron",
+    231: "Iron",
+    232: "Steel",
+    233: "Steel",
+    234: "Bronze",
+    235: "Bronze",
+    236: "Iron",
+    237: "Steel",
+    238: "Bronze",
+    239: "Iron",
+    240: "Steel",
+    241: "Silver",
+    242: "Gold",
+    243: "Platinum",
+    244: "Meteoric",
+    245: "Strange",
+    246: "Weird",
+    247: "Nickel",
+    248: "Tin",
+    249: "Silver",
+    250: "Argent",
+    251: "Fine",
+    252: "Fine",
+    253: "Sharp",
+    254: "Fine",
+    255: "Sharp",
+    256: "Fine",
+    257: "Sharp",
+    258: "Fine",
+    259: "Warrior's",
+    260: "Soldier's",
+    261: "Knight's",
+    262: "Lord's",
+    263: "King's",
+    264: "Master's",
+    265: "Grandmaster's",
+    266: "Glimmering",
+    267: "Glowing",
+    268: "Bright",
+    269: "Screaming",
+    270: "Howling",
+    271: "Wailing",
+    272: "Screaming",
+    273: "Howling",
+    274: "Wailing",
+    275: "Lucky",
+    276: "Lucky",
+    277: "Lucky",
+    278: "Lucky",
+    279: "Lucky",
+    280: "Lucky",
+    281: "Felicitous",
+    282: "Fortuitous",
+    283: "Emerald",
+    284: "Lizard's",
+    285: "Lizard's",
+    286: "Lizard's",
+    287: "Snake's",
+    288: "Snake's",
+    289: "Snake's",
+    290: "Serpent's",
+    291: "Serpent's",
+    292: "Serpent's",
+    293: "Lizard's",
+    294: "Lizard's",
+    295: "Lizard's",
+    296: "Snake's",
+    297: "Snake's",
+    298: "Serpent's",
+    299: "Serpent's",
+    300: "Lizard's",
+    301: "Lizard's",
+    302: "Snake's",
+    303: "Serpent's",
+    304: "Lizard's",
+    305: "Snake's",
+    306: "Serpent's",
+    307: "Serpent's",
+    308: "Drake's",
+    309: "Dragon's",
+    310: "Dragon's",
+    311: "Wyrm's",
+    312: "Great Wyrm's",
+    313: "Bahamut's",
+    314: "Zircon",
+    315: "Jacinth",
+    316: "Turquoise",
+    317: "Shimmering",
+    318: "Shimmering",
+    319: "Shimmering",
+    320: "Shimmering",
+    321: "Shimmering",
+    322: "Shimmering",
+    323: "Shimmering",
+    324: "Rainbow",
+    325: "Scintillating",
+    326: "Prismatic",
+    327: "Chromatic",
+    328: "Shimmering",
+    329: "Rainbow",
+    330: "Scintillating",
+    331: "Prismatic",
+    332: "Chromatic",
+    333: "Shimmering",
+    334: "Rainbow",
+    335: "Scintillating",
+    336: "Shimmering",
+    337: "Scintillating",
+    338: "Azure",
+    339: "Lapis",
+    340: "Cobalt",
+    341: "Sapphire",
+    342: "Azure",
+    343: "Lapis",
+    344: "Cobalt",
+    345: "Sapphire",
+    346: "Azure",
+    347: "Lapis",
+    348: "Cobalt",
+    349: "Sapphire",
+    350: "Azure",
+    351: "Lapis",
+    352: "Lapis",
+    353: "Cobalt",
+    354: "Cobalt",
+    355: "Sapphire",
+    356: "Lapis Lazuli",
+    357: "Sapphire",
+    358: "Crimson",
+    359: "Russet",
+    360: "Garnet",
+    361: "Ruby",
+    362: "Crimson",
+    363: "Russet",
+    364: "Garnet",
+    365: "Ruby",
+    366: "Crimson",
+    367: "Russet",
+    368: "Garnet",
+    369: "Ruby",
+    370: "Russet",
+    371: "Russet",
+    372: "Garnet",
+    373: "Garnet",
+    374: "Ruby",
+    375: "Garnet",
+    376: "Ruby",
+    377: "Tangerine",
+    378: "Ocher",
+    379: "Coral",
+    380: "Amber",
+    381: "Tangerine",
+    382: "Ocher",
+    383: "Coral",
+    384: "Amber",
+    385: "Tangerine",
+    386: "Ocher",
+    387: "Coral",
+    388: "Amber",
+    389: "Tangerine",
+    390: "Ocher",
+    391: "Ocher",
+    392: "Coral",
+    393: "Coral",
+    394: "Amber",
+    395: "Camphor",
+    396: " Ambergris",
+    397: "Beryl",
+    398: "Viridian",
+    399: "Jade",
+    400: "Emerald",
+    401: "Beryl",
+    402: "Viridian",
+    403: "Jade",
+    404: "Emerald",
+    405: "Beryl",
+    406: "Viridian",
+    407: "Jade",
+    408: "Emerald",
+    409: "Beryl",
+    410: "Viridian",
+    411: "Viridian",
+    412: "Jade",
+    413: "Jade",
+    414: "Emerald",
+    415: "Beryl",
+    416: "Jade",
+    417: "Triumphant",
+    418: "Victorious",
+    419: "Aureolin",
+    420: "Mechanist's",
+    421: "Artificer's",
+    422: "Jeweler's",
+    423: "Assamic",
+    424: "Arcadian",
+    425: "Unearthly",
+    426: "Astral",
+    427: "Elysian",
+    428: "Celestial",
+    429: "Diamond",
+    430: "Fletcher's",
+    431: "Acrobat's",
+    432: "Harpoonist's",
+    433: "Fletcher's",
+    434: "Bowyer's",
+    435: "Archer's",
+    436: "Acrobat's",
+    437: "Gymnast's",
+    438: "Athlete's",
+    439: "Harpoonist's",
+    440: "Spearmaiden's",
+    441: "Lancer's",
+    442: "Burning",
+    443: "Sparking",
+    444: "Chilling",
+    445: "Burning",
+    446: "Blazing",
+    447: "Volcanic",
+    448: "Sparking",
+    449: "Charged",
+    450: "Powered",
+    451: "Chilling",
+    452: "Freezing",
+    453: "Glacial",
+    454: "Hexing",
+    455: "Fungal",
+    456: "Graverobber's",
+    457: "Hexing",
+    458: "Blighting",
+    459: "Accursed",
+    460: "Fungal",
+    461: "Noxious",
+    462: "Venomous",
+    463: "Graverobber's",
+    464: "Vodoun",
+    465: "Golemlord's",
+    466: "Lion Branded",
+    467: "Captain's",
+    468: "Preserver's",
+    469: "Lion Branded",
+    470: "Hawk Branded",
+    471: "Rose Branded",
+    472: "Captain's",
+    473: "Commander's",
+    474: "Marshal's",
+    475: "Preserver's",
+    476: "Warder's",
+    477: "Guardian's",
+    478: "Expert's",
+    479: "Fanatic",
+    480: "Sounding",
+    481: "Expert's",
+    482: "Veteran's",
+    483: "Master's",
+    484: "Fanatic",
+    485: "Raging",
+    486: "Furious",
+    487: "Sounding",
+    488: "Resonant",
+    489: "Echoing",
+    490: "Trainer's",
+    491: "Spiritual",
+    492: "Nature's",
+    493: "Trainer's",
+    494: "Caretaker's",
+    495: "Keeper's",
+    496: "Spiritual",
+    497: "Feral",
+    498: "Communal",
+    499: "Nature's",
+    500: "Terra's",
+    501: "Gaea's",
+    502: "Entrapping",
+    503: "Mentalist's",
+    504: "Shogukusha's",
+    505: "Entrapping",
+    506: "Trickster's",
+    507: "Cunning",
+    508: "Mentalist's",
+    509: "Psychic",
+    510: "Shadow",
+    511: "Shogukusha's",
+    512: "Sensei's",
+    513: "Kenshi's",
+    514: "Miocene",
+    515: "Miocene",
+    516: "Oligocene",
+    517: "Oligocene",
+    518: "Eocene",
+    519: "Eocene",
+    520: "Paleocene",
+    521: "Paleocene",
+    522: "Knave's",
+    523: "Jack's",
+    524: "Jester's",
+    525: "Joker's",
+    526: "Trump",
+    527: "Loud",
+    528: "Calling",
+    529: "Yelling",
+    530: "Shouting",
+    531: "Screaming",
+    532: "Paradox",
+    533: "Paradox",
+    534: "Robineye",
+    535: "Sparroweye",
+    536: "Falconeye",
+    537: "Hawkeye",
+    538: "Eagleeye",
+    539: "Visionary",
+    540: "Mnemonic",
+    541: "Snowflake",
+    542: "Shivering",
+    543: "Boreal",
+    544: "Hibernal",
+    545: "Ember",
+    546: "Smoldering",
+    547: "Smoking",
+    548: "Flaming",
+    549: "Scorching",
+    550: "Static",
+    551: "Glowing",
+    552: "Buzzing",
+    553: "Arcing",
+    554: "Shocking",
+    555: "Septic",
+    556: "Envenomed",
+    557: "Corosive",
+    558: "Toxic",
+    559: "Pestilent",
+    560: "Maiden's",
+    561: "Valkyrie's",
+    562: "Maiden's",
+    563: "Valkyrie's",
+    564: "Monk's",
+    565: "Priest's",
+    566: "Monk's",
+    567: "Priest's",
+    568: "Monk's",
+    569: "Priest's",
+    570: "Summoner's",
+    571: "Necromancer's",
+    572: "Summoner's",
+    573: "Necromancer's",
+    574: "Angel's",
+    575: "Arch-Angel's",
+    576: "Angel's",
+    577: "Arch-Angel's",
+    578: "Slayer's",
+    579: "Berserker's",
+    580: "Slayer's",
+    581: "Berserker's",
+    582: "Slayer's",
+    583: "Berserker's",
+    584: "Shaman's",
+    585: "Hierophant's",
+    586: "Shaman's",
+    587: "Hierophant's",
+    588: "Magekiller's",
+    589: "Witch-hunter's",
+    590: "Magekiller's",
+    591: "Witch-hunter's",
+    592: "Compact",
+    593: "Thin",
+    594: "Dense",
+    595: "Consecrated",
+    596: "Pure",
+    597: "Sacred",
+    598: "Hallowed",
+    599: "Divine",
+    600: "Pearl",
+    601: "Crimson",
+    602: "Red",
+    603: "Sanguinary",
+    604: "Bloody",
+    605: "Red",
+    606: "Sanguinary",
+    607: "Red",
+    608: "Jagged",
+    609: "Forked",
+    610: "Serrated",
+    611: "Jagged",
+    612: "Forked",
+    613: "Jagged",
+    614: "Snowflake",
+    615: "Shivering",
+    616: "Boreal",
+    617: "Hibernal",
+    618: "Snowflake",
+    619: "Shivering",
+    620: "Boreal",
+    621: "Hibernal",
+    622: "Snowflake",
+    623: "Shivering",
+    624: "Boreal",
+    625: "Hibernal",
+    626: "Ember",
+    627: "Smoldering",
+    628: "Smoking",
+    629: "Flaming",
+    630: "Ember",
+    631: "Smoldering",
+    632: "Smoking",
+    633: "Flaming",
+    634: "Ember",
+    635: "Smoldering",
+    636: "Smoking",
+    637: "Flaming",
+    638: "Static",
+    639: "Glowing",
+    640: "Arcing",
+    641: "Shocking",
+    642: "Static",
+    643: "Glowing",
+    644: "Arcing",
+    645: "Shocking",
+    646: "Static",
+    647: "Glowing",
+    648: "Arcing",
+    649: "Shocking",
+    650: "Septic",
+    651: "Envenomed",
+    652: "Toxic",
+    653: "Pestilent",
+    654: "Septic",
+    655: "Envenomed",
+    656: "Toxic",
+    657: "Pestilent",
+    658: "Septic",
+    659: "Envenomed",
+    660: "Toxic",
+    661: "Pestilent",
+    662: "Tireless",
+    663: "Lizard's",
+    664: "Azure",
+    665: "Crimson",
+    666: "Tangerine",
+    667: "Beryl",
+    668: "Godly",
+    669: "Cruel",
+}
+
+
+MAGIC_SUFFIX_STRINGS = {
+    1: "Health",
+    2: "Protection",
+    3: "Absorption",
+    4: "Life",
+    5: "(nothing?)",
+    6: "Warding",
+    7: "the Sentinel",
+    8: "Guarding",
+    9: "Negation",
+    10: "(nothing?)",
+    11: "Piercing",
+    12: "Bashing",
+    13: "Puncturing",
+    14: "Thorns",
+    15: "Spikes",
+    16: "Fleadiness",
+    17: "Alacrity",
+    18: "Swiitness ",
+    19: "Quickness",
+    20: "Blocking",
+    21: "Deilecting",
+    22: "the Apprentice",
+    23: "the Magus",
+    24: "Frost",
+    25: "the Glacier",
+    26: "Frost",
+    27: "Warmth",
+    28: "Flame",
+    29: "Fire",
+    30: "Burning",
+    31: "Flame",
+    32: "Shook",
+    33: "Lightning",
+    34: "Thunder",
+    35: "Shock",
+    36: "Craftsmanship",
+    37: "Quality",
+    38: "Maiming",
+    39: "Slaying",
+    40: "Gore",
+    41: "Carnage",
+    42: "Slaughter",
+    43: "Maiming",
+    44: "Worth",
+    45: "Measure",
+    46: "Excellence",
+    47: "Petlctmance",
+    48: "Measure",
+    49: "Blight",
+    50: "Venom",
+    51: "Pestilence",
+    52: "Blight",
+    53: "Dextetity",
+    54: "Dextetity",
+    55: "Skill",
+    56: "Skill",
+    57: "Accuracy",
+    58: "Precision",
+    59: "Precision",
+    60: "Petlection",
+    61: "Balance",
+    62: "Stability",
+    63: "(nothing?)",
+    64: "Regenetation",
+    65: "Regenetation",
+    66: "Regenetation",
+    67: "Regrowth",
+    68: "Regrowth",
+    69: "Vileness",
+    70: "(nothing?)",
+    71: "Greed",
+    72: "Wealth",
+    73: "Chance",
+    74: "Fortune",
+    75: "Energy",
+    76: "Energy",
+    77: "the Mind",
+    78: "Brilliance",
+    79: "Sorcery",
+    80: "Wizardry",
+    81: "the Beat",
+    82: "Light",
+    83: "Radiance",
+    84: "the Sun",
+    85: "Life",
+    86: "the Jackal",
+    87: "the Fox",
+    88: "the Wolf",
+    89: "the Wolf",
+    90: "the Tiget",
+    91: "the Mammoth",
+    92: "the Mammoth",
+    93: "the Colosuss",
+    94: "the Leech",
+    95: "the Locust",
+    96: "the Bat",
+    97: "the Vampire",
+    98: "Defiance",
+    99: "Amelioration",
+    100: "Remedy",
+    101: "(nothing?)",
+    102: "Simplicity",
+    103: "Ease",
+    104: "(nothing?)",
+    105: "Strength",
+    106: "Might",
+    107: "the Ox",
+    108: "the Ox",
+    109: "the Giant",
+    110: "the Giant",
+    111: "the Titan",
+    112: "Pacing",
+    113: "Haste",
+    114: "Speed",
+    115: "Health",
+    116: "Protection",
+    117: "Absorption",
+    118: "Life",
+    119: "Life Everlasting",
+    120: "Protection",
+    121: "Absorption",
+    122: "Life",
+    123: "Anima",
+    124: "Warding",
+    125: "the Sentinel",
+    126: "Guarding",
+    127: "Negation",
+    128: "the Sentinel",
+    129: "Guarding",
+    130: "Negation",
+    131: "Coolness",
+    132: "Incombustibility",
+    133: "Amianthus",
+    134: "Fire Quenching",
+    135: "Coolness",
+    136: "Incombustibility",
+    137: "Amianthus",
+    138: "Fire Quenching",
+    139: "Faith",
+    140: "Resistance",
+    141: "Insulation",
+    142: "Grounding",
+    143: "the Dynamo",
+    144: "Resistance",
+    145: "Insulation",
+    146: "Grounding",
+    147: "the Dynamo",
+    148: "Stoicism",
+    149: "Warming",
+    150: "Thawing",
+    151: "the Dunes",
+    152: "the Sirocco",
+    153: "Warming",
+    154: "Thawing",
+    155: "the Dunes",
+    156: "the Sirocco",
+    157: "Desire",
+    158: "Piercing",
+    159: "Bashing",
+    160: "Puncturing",
+    161: "Thorns",
+    162: "Spikes",
+    163: "Razors",
+    164: "Swords",
+    165: "Malice",
+    166: "Readiness",
+    167: "Alacrity",
+    168: "Swiftness",
+    169: "Quickness",
+    170: "Alacrity",
+    171: "Fewer",
+    172: "Blocking",
+    173: "Deflecting",
+    174: "the Apprentice",
+    175: "the Magus",
+    176: "Frost",
+    177: "the Icicle",
+    178: "the Glacier",
+    179: "Winter",
+    180: "Frost",
+    181: "Frigidity",
+    182: "Warmth",
+    183: "Flame",
+    184: "Fire",
+    185: "Burning",
+    186: "Incineration",
+    187: "Flame",
+    188: "Passion",
+    189: "Shock",
+    190: "Lightning",
+    191: "Thunder",
+    192: "Storms",
+    193: "Shock",
+    194: "Ennui",
+    195: "Craftsmanship",
+    196: "Quality",
+    197: "Maiming",
+    198: "Slaying",
+    199: "Gore",
+    200: "Damage",
+    201: "Slaughter",
+    202: "Butchery",
+    203: "Evisceration",
+    204: "Maiming",
+    205: "Craftsmanship",
+    206: "Craftsmanship",
+    207: "Craftsmanship",
+    208: "Quality",
+    209: "Quality",
+    210: "Maiming",
+    211: "Maiming",
+    212: "Craftsmanship",
+    213: "Craftsmanship",
+    214: "Quality",
+    215: "Quality",
+    216: "Maiming",
+    217: "Craftsmanship",
+    218: "Quality",
+    219: "Maiming",
+    220: "Ire",
+    221: "Wrath",
+    222: "Damage",
+    223: "Worth",
+    224: "Measure",
+    225: "Excellence",
+    226: "Performance",
+    227: "Transcendence",
+    228: "Worth",
+    229: "Measure",
+    230: "Excellence",
+    231: "Performance",
+    232: "Joyfulness",
+    233: "Bliss",
+    234: "Blight",
+    235: "Venom",
+    236: "Pestilence",
+    237: "Anthrax",
+    238: "Blight",
+    239: "Envy",
+    240: "Dexterity",
+    241: "Skill",
+    242: "Accuracy",
+    243: "Precision",
+    244: "Perfection",
+    245: "Nirvana",
+    246: "Dexterity",
+    247: "Skill",
+    248: "Accuracy",
+    249: "Precision",
+    250: "Perfection",
+    251: "Dexterity",
+    252: "Skill",
+    253: "Accuracy",
+    254: "Precision",
+    255: "Dexterity",
+    256: "Dexterity",
+    257: "Dexterity",
+    258: "Dexterity",
+    259: "Dexterity",
+    260: "Dexterity",
+    261: "Daring",
+    262: "Balance",
+    263: "Equilibrium",
+    264: "Stability",
+    265: "Balance",
+    266: "Balance",
+    267: "Balance",
+    268: "Truth",
+    269: "Regeneration",
+    270: "Regeneration",
+    271: "Regeneration",
+    272: "Regrowth",
+    273: "Regrowth",
+    274: "Revivification",
+    275: "Honor",
+    276: "Vileness",
+    277: "Greed",
+    278: "Wealth",
+    279: "Greed",
+    280: "Greed",
+    281: "Greed",
+    282: "Greed",
+    283: "Greed",
+    284: "Greed",
+    285: "Avarice",
+    286: "Chance",
+    287: "Fortune",
+    288: "Fortune",
+    289: "Luck",
+    290: "Fortune",
+    291: "Good Luck",
+    292: "Prosperity",
+    293: "Energy",
+    294: "the Mind",
+    295: "Brilliance",
+    296: "Sorcery",
+    297: "Wizardry",
+    298: "Enlightenment",
+    299: "Energy",
+    300: "the Mind",
+    301: "Brilliance",
+    302: "Sorcery",
+    303: "Wizardry",
+    304: "Energy",
+    305: "the Mind",
+    306: "Brilliance",
+    307: "Sorcery",
+    308: "Knowledge",
+    309: "the Bear",
+    310: "Light",
+    311: "Radiance",
+    312: "the Sun",
+    313: "the Jackal",
+    314: "the Fox",
+    315: "the Wolf",
+    316: "the Tiger",
+    317: "the Mammoth",
+    318: "the Colosuss",
+    319: "the Squid",
+    320: "the Whale",
+    321: "the Jackal",
+    322: "the Fox",
+    323: "the Wolf",
+    324: "the Tiger",
+    325: "the Mammoth",
+    326: "the Colosuss",
+    327: "the Jackal",
+    328: "the Fox",
+    329: "the Wolf",
+    330: "the Tiger",
+    331: "the Mammoth",
+    332: "Life",
+    333: "Life",
+    334: "Life",
+    335: "Substinence",
+    336: "Substinence",
+    337: "Substinence",
+    338: "Vita",
+    339: "Vita",
+    340: "Vita",
+    341: "Life",
+    342: "Life",
+    343: "Substinence",
+    344: "Substinence",
+    345: "Vita",
+    346: "Vita",
+    347: "Life",
+    348: "Substinence",
+    349: "Vita",
+    350: "Spirit",
+    351: "Hope",
+    352: "the Leech",
+    353: "the Locust",
+    354: "the Lamprey",
+    355: "the Leech",
+    356: "the Locust",
+    357: "the Lamprey",
+    358: "the Leech",
+    359: "the Bat",
+    360: "the Wraith",
+    361: "the Vampire",
+    362: "the Bat",
+    363: "the Wraith",
+    364: "the Vampire",
+    365: "the Bat",
+    366: "Defiance",
+    367: "Amelioration",
+    368: "Remedy",
+    369: "Simplicity",
+    370: "Ease",
+    371: "Freedom",
+    372: "Strength",
+    373: "Might",
+    374: "the Ox",
+    375: "the Giant",
+    376: "the Titan",
+    377: "Atlus",
+    378: "Strength",
+    379: "Might",
+    380: "the Us",
+    381: "the Giant",
+    382: "the Titan",
+    383: "Strength",
+    384: "Might",
+    385: "the Us",
+    386: "the Giant",
+    387: "Strength",
+    388: "Strength",
+    389: "Strength",
+    390: "Strength",
+    391: "Strength",
+    392: "Strength",
+    393: "Virility",
+    394: "Pacing",
+    395: "Haste",
+    396: "Speed",
+    397: "Traveling",
+    398: "Acceleration",
+    399: "Inertia",
+    400: "Inertia",
+    401: "Inertia",
+    402: "Self-Repair",
+    403: "Fast Repair",
+    404: "Ages",
+    405: "Heplenishing",
+    406: "Propagation",
+    407: "the Kraken",
+    408: "Memory",
+    409: "the Elephant",
+    410: "Power",
+    411: "Grace",
+    412: "Grace and Power",
+    413: "the Yeti",
+    414: "the Phoenix",
+    415: "the Efreeti",
+    416: "the Cobra",
+    417: "the Elements",
+    418: "Firebolts",
+    419: "Firebolts",
+    420: "Firebolts",
+    421: "Charged Shield",
+    422: "Charged Shield",
+    423: "Charged Shield",
+    424: "Icebolt",
+    425: "Frozen Armor",
+    426: "Static Field",
+    427: "Telekinesis",
+    428: "Frost Shield",
+    429: "Ice Blast",
+    430: "Blaze",
+    431: "Fire Ball",
+    432: "Nova",
+    433: "Nova",
+    434: "Nova Shield",
+    435: "Nova Shield",
+    436: "Nova Shield",
+    437: "Lightning",
+    438: "Lightning",
+    439: "Shiver Armor",
+    440: "Fire Wall",
+    441: "Enchant",
+    442: "Chain Lightning",
+    443: "Chain Lightning",
+    444: "Chain Lightning",
+    445: "Teleport Shield",
+    446: "Teleport Shield",
+    447: "Teleport Shield",
+    448: "Glacial Spike",
+    449: "Meteor",
+    450: "Thunder Storm",
+    451: "Energy Shield",
+    452: "Blizzard",
+    453: "Chilling Armor",
+    454: "Hydra Shield",
+    455: "Frozen ler",
+    456: "Dawn",
+    457: "Sunlight",
+    458: "Magic Arrows",
+    459: "Magic Arrows",
+    460: "Fire Arrows",
+    461: "Fire Arrows",
+    462: "lnner Sight",
+    463: "Inner Sight",
+    464: "Jabbing",
+    465: "Jabbing",
+    466: "Cold Arrows",
+    467: "Cold Arrows",
+    468: "Multiple Shot",
+    469: "Multiple Shot",
+    470: "Power Strike",
+    471: "Power Strike",
+    472: "Poison Jab",
+    473: "Poison Jab",
+    474: "Exploding Arrows",
+    475: "Exploding Arrows",
+    476: "Slow Missiles",
+    477: "Slow Missiles",
+    478: "lmpaling Strike",
+    479: "lmpaling Strike",
+    480: "Lightning Javelin",
+    481: "Lightning Javelin",
+    482: "Ice Arrows",
+    483: "Ice Arrows",
+    484: "Guided Arrows",
+    485: "Guided Arrows",
+    486: "Charged Strike",
+    487: "Charged Strike",
+    488: "Plague Jab",
+    489: "Plague Jab",
+    490: "lmmolating Arrows",
+    491: "lmmolating Arrows",
+    492: "Fending",
+    493: "Fending",
+    494: "Freezing Arrows",
+    495: "Freezing Arrows",
+    496: "Lightning Strike",
+    497: "Lightning Strike",
+    498: "Lightning Fury",
+    499: "Lightning Fury",
+    500: "Fire Bolts",
+    501: "Fire Bolts",
+    502: "Charged Bolts",
+    503: "Charged Bolts",
+    504: "Ice Bolts",
+    505: "Ice Bolts",
+    506: "Frozen Armor",
+    507: "Frozen Armor",
+    508: "Static Field",
+    509: "Static Field",
+    510: "Telekinesis",
+    511: "Telekinesis",
+    512: "Frost Novas",
+    513: "Frost Novas",
+    514: "Ice Blasts",
+    515: "Ice Blasts",
+    516: "Blazing",
+    517: "Blazing",
+    518: "Fire Balls",
+    519: "Fire Balls",
+    520: "Novas",
+    521: "Novas",
+    522: "Lightning",
+    523: "Lightning",
+    524: "Shiver Armor",
+    525: "Shiver Armor",
+    526: "Fire Walls",
+    527: "Fire Walls",
+    528: "Enchantment",
+    529: "Enchantment",
+    530: "Chain Lightning",
+    531: "Chain Lightning",
+    532: "Teleportation",
+    533: "Teleportation",
+    534: "Glacial Spikes",
+    535: "Glacial Spikes",
+    536: "Meteors",
+    537: "Meteors",
+    538: "Thunder Storm",
+    539: "Thunder Storm",
+    540: "Energy Shield",
+    541: "Energy Shield",
+    542: "Blizzards",
+    543: "Blizzards",
+    544: "Chilling Armor",
+    545: "Chilling Armor",
+    546: "Hydras",
+    547: "Hydras",
+    548: "Frozen Orbs",
+    549: "Frozen Orbs",
+    550: "Amplify Damage",
+    551: "Amplify Damage",
+    552: "Teeth",
+    553: "Teeth",
+    554: "Bone Armor",
+    555: "Bone Armor",
+    556: "Raise Skeletons",
+    557: "Raise Skeletons",
+    558: "Dim Vision",
+    559: "Dim Vision",
+    560: "Weaken",
+    561: "Weaken",
+    562: "Poison Dagger",
+    563: "Poison Dagger",
+    564: "Corpse Explosions",
+    565: "Corpse Explosions",
+    566: "Clay Golem Summoning",
+    567: "Clay Golem Summoning",
+    568: "Iron Maiden",
+    569: "Iron Maiden",
+    570: "Terror",
+    571: "Terror",
+    572: "Bone Walls",
+    573: "Bone Walls",
+    574: "Raise Skeletal Mages",
+    575: "Raise Skeletal Mages",
+    576: "Confusion",
+    577: "Confusion",
+    578: "Life Tap",
+    579: "Life Tap",
+    580: "Poison Explosion",
+    581: "Poison Explosion",
+    582: "Bone Spears",
+    583: "Bone Spears",
+    584: "Blood Golem Summoning",
+    585: "Blood Golem Summoning",
+    586: "Attraction",
+    587: "Attraction",
+    588: "Decrepification",
+    589: "Decrepification",
+    590: "Bone Imprisonment",
+    591: "Bone Imprisonment",
+    592: "Iron Golem Creation",
+    593: "Iron Golem Creation",
+    594: "Lower Resistance",
+    595: "Lower Flesistance",
+    596: "Poison Novas",
+    597: "Poison Novas",
+    598: "Bone Spirits",
+    599: "Bone Spirits",
+    600: "Fire Golem Summoning",
+    601: "Fire Golem Summoning",
+    602: "Revivification",
+    603: "Revivification",
+    604: "Sacrifice",
+    605: "Sacrifice",
+    606: "Holy Bolts",
+    607: "Holy Bolts",
+    608: "Zeal",
+    609: "Zeal",
+    610: "Vengeance",
+    611: "Vengeance",
+    612: "Blessed Hammers",
+    613: "Blessed Hammers",
+    614: "Conversion",
+    615: "Conversion",
+    616: "Fist of the Heavens",
+    617: "Fist of the Heavens",
+    618: "Bashing",
+    619: "Bashing",
+    620: "Howling",
+    621: "Howling",
+    622: "Potion Finding",
+    623: "Potion Finding",
+    624: "Taunting",
+    625: "Taunting",
+    626: "Shouting",
+    627: "Shouting",
+    628: "Stunning",
+    629: "Stunning",
+    630: "Find Item",
+    631: "Find Item",
+    632: "Concentration",
+    633: "Concentration",
+    634: "Battle Cry",
+    635: "Battle Cry",
+    636: "Battle Orders",
+    637: "Battle Orders",
+    638: "Grim Ward",
+    639: "Grim Ward",
+    640: "War Cry",
+    641: "War Cry",
+    642: "Battle Command",
+    643: "Battle Command",
+    644: "Firestorms",
+    645: "Firestorms",
+    646: "Molten Boulders",
+    647: "Molten Boulders",
+    648: "Eruption",
+    649: "Eruption",
+    650: "Cyclone Armor",
+    651: "Cyclone Armor",
+    652: "Twister",
+    653: "Twister",
+    654: "Volcano",
+    655: "Volcano",
+    656: "Tornado",
+    657: "Tornado",
+    658: "Armageddon",
+    659: "Armageddon",
+    660: "Hurricane",
+    661: "Hurricane",
+    662: "Damage Amplification",
+    663: "the Icicle",
+    664: "the Glacier",
+    665: "Fire",
+    666: "Burning",
+    667: "Lightning",
+    668: "Thunder",
+    669: "Daring",
+    670: "Daring",
+    671: "Knowledge",
+    672: "Knowledge",
+    673: "Virility",
+    674: "Virility",
+    675: "Readiness",
+    676: "Craftsmanship",
+    677: "Quality",
+    678: "Maiming",
+    679: "Craftsmanship",
+    680: "Quality",
+    681: "Craftsmanship",
+    682: "Blight",
+    683: "Venom",
+    684: "Pestilence",
+    685: "Anthrax",
+    686: "Blight",
+    687: "Venom",
+    688: "Pestilence",
+    689: "Anthrax",
+    690: "Blight",
+    691: "Venom",
+    692: "Pestilence",
+    693: "Anthrax",
+    694: "Frost",
+    695: "the Icicle",
+    696: "the Glacier",
+    697: "Winter",
+    698: "Frost",
+    699: "the Icicle",
+    700: "the Glacier",
+    701: "Winter",
+    702: "Frost",
+    703: "the Icicle",
+    704: "the Glacier",
+    705: "Winter",
+    706: "Flame",
+    707: "Fire",
+    708: "Burning",
+    709: "Incineration",
+    710: "Flame",
+    711: "Fire",
+    712: "Burning",
+    713: "Incineration",
+    714: "Flame",
+    715: "Fire",
+    716: "Burning",
+    717: "Incineration",
+    718: "Shock",
+    719: "Lightning",
+    720: "Thunder",
+    721: "Storms",
+    722: "Shock",
+    723: "Lightning",
+    724: "Thunder",
+    725: "Storms",
+    726: "Shock",
+    727: "Lightning",
+    728: "Thunder",
+    729: "Storms",
+    730: "Dexterity",
+    731: "Dexterity",
+    732: "Strength",
+    733: "Strength",
+    734: "Thorns",
+    735: "Frost",
+    736: "Flame",
+    737: "Blight",
+    738: "Shock",
+    739: "Regeneration",
+    740: "Energy",
+    741: "Light",
+    742: "the Leech",
+    743: "the Locust",
+    744: "the Lamprey",
+    745: "the Bat",
+    746: "the Wraith",
+    747: "the Vampire",
+}
@@ -0,0 +1,668 @@
+"""The base item codes and the names of their types."""
+
+
+SHIELD_STRINGS = {
+    "uow": "Aegis",
+    "pa4": "Aerin Shield",
+    "pa7": "Akaran Rondache",
+    "pa6": "Akaran Targe",
+    "pad": "Kurast Shield",
+    "xts": "Ancient Shield",
+    "xpk": "Barbed Shield",
+    "upk": "Blade Barrier",
+    "nef": "Bloodlord Skull",
+    "bsh": "Bone Shield",
+    "buc": "Buckler",
+    "ne9": "Cantor Trophy",
+    "pa5": "Crown Shield",
+    "xuc": "Defender",
+    "ne5": "Demon Head",
+    "xit": "Dragon Shield",
+    "ne7": "Fetish Trophy",
+    "ne4": "Gargoyle Head",
+    "gts": "Gothic Shield",
+    "xsh": "Grim Shield",
+    "pa9": "Gilded Shield",
+    "nea": "Heirophant Trophy",
+    "uuc": "Heater",
+    "neg": "Hellspawn Skull",
+    "pa3": "Heraldic Shield",
+    "kit": "Kite Shield",
+    "lrg": "Large Shield",
+    "uml": "Luna",
+    "neb": "Minion Skull",
+    "uit": "Monarch",
+    "ne6": "Mummified Trophy",
+    "ned": "Overseer Skull",
+    "xow": "Pavise",
+    "ne1": "Preserved Head",
+    "pa8": "Protector Shield",
+    "pa2": "Rondache",
+    "xml": "Round Shield",
+    "paa": "Royal Shield",
+    "pac": "Sacred Rondache",
+    "pab": "Sacred Targe",
+    "xrg": "Scutum",
+    "ne8": "Sexton Trophy",
+    "sml": "Small Shield",
+    "spk": "Spiked Shield",
+    "nee": "Succubus Skull",
+    "pa1": "Targe",
+    "tow": "Tower Shield",
+    "ush": "Troll Nest",
+    "ne3": "Unraveller Head",
+    "paf": "Vortex Shield",
+    "uts": "Ward",
+    "pae": "Zakarum Shield",
+    "ne2": "Zombie Head",
+}
+SHIELD_KEYS = SHIELD_STRINGS.keys()
+
+
+ARMOR_STRINGS = {
+    "dr6": "Alpha Helm",
+    "aar": "Ancient Armor",
+    "dr3": "Antlers",
+    "utp": "Archon Plate",
+    "ulm": "Armet",
+    "ba4": "Assault Helmet",
+    "ba5": "Avenger Guard",
+    "upl": "Balrog Skin",
+    "xhl": "Basinet",
+    "ztb": "Battle Belt",
+    "xtb": "Battle Boots",
+    "xtg": "Battle Gauntlets",
+    "mbl": "Belt",
+    "drb": "Blood Spirit",
+    "bhm": "Bone Helm",
+    "uh9": "Bone Visage",
+    "uhn": "Boneweave",
+    "umb": "Boneweave Boots",
+    "mgl": "Bracers",
+    "ulg": "Bramble Mitts",
+    "brs": "Breast Plate",
+    "cap": "Cap",
+    "bab": "Carnage Helm",
+    "xlm": "Casque",
+    "mbt": "Chain Boots",
+    "chn": "Chain Mail",
+    "xul": "Chaos Armor",
+    "ci0": "Circlet",
+    "uhc": "Colossus Girdle",
+    "bae": "Conqueror Crown",
+    "urn": "Corona",
+    "ci1": "Coronet",
+    "crn": "Crown",
+    "utg": "Crusader Gauntlets",
+    "xrs": "Cuirass",
+    "xsk": "Death Mask",
+    "usk": "Demonhead",
+    "xla": "Demonhide Armor",
+    "xlb": "Demonhide Boots",
+    "xlg": "Demonhide Gloves",
+    "zlb": "Demonhide Sash",
+    "bad": "Destroyer Helm",
+    "ci3": "Diadem",
+    "ung": "Diamond Mail",
+    "drf": "Dream Spirit",
+    "uui": "Dusk Shroud",
+    "drd": "Earth Spirit",
+    "xth": "Embossed Plate",
+    "dr4": "Falcon Mask",
+    "ba2": "Fanged Helm",
+    "fld": "Field Plate",
+    "fhl": "Full Helm",
+    "plt": "Plate Mail",
+    "ful": "Full Plate Mail",
+    "bac": "Fury Visor",
+    "hgl": "Gauntlets",
+    "xui": "Ghost Armor",
+    "uhl": "Giant Conch",
+    "hbl": "Girdle",
+    "lgl": "Gloves",
+    "gth": "Gothic Plate",
+    "xrn": "Grand Crown",
+    "urs": "Great Hauberk",
+    "ghm": "Great Helm",
+    "dr7": "Griffon Headress",
+    "xh9": "Grim Helm",
+    "baf": "Guardian Crown",
+    "hla": "Hard Leather Armor",
+    "dr2": "Hawk Helm",
+    "tbl": "Heavy Belt",
+    "vbt": "Heavy Boots",
+    "xmg": "Heavy Bracers",
+    "vgl": "Heavy Gloves",
+    "ult": "Hellforged Plate",
+    "hlm": "Helm",
+    "ba3": "Horned Helm",
+    "dr8": "Hunter's Guise",
+    "ukp": "Hydraskull",
+    "urg": "Hyperion",
+    "ba1": "Jawbone Cap",
+    "ba6": "Jawbone Visor",
+    "uld": "Kraken Shell",
+    "uth": "Lacquered Plate",
+    "lea": "Leather Armor",
+    "lbt": "Leather Boots",
+    "vbl": "Light Belt",
+    "tgl": "Light Gauntlets",
+    "ltp": "Light Plate",
+    "tbt": "Light Plated Boots",
+    "xng": "Linked Mail",
+    "ba7": "Lion Helm",
+    "ucl": "Loricated Mail",
+    "xtp": "Mage Plate",
+    "msk": "Mask",
+    "xhn": "Mesh Armor",
+    "zmb": "Mesh Belt",
+    "xmb": "Mesh Boots",
+    "utb": "Mirrored Boots",
+    "umc": "Mithril Coil",
+    "uhb": "Myrmidon Greaves",
+    "uhg": "Ogre Gauntlets",
+    "xar": "Ornate Plate",
+    "hbt": "Plate Boots",
+    "qui": "Quilted Armor",
+    "ba8": "Rage Mask",
+    "rng": "Ring Mail",
+    "xpl": "Russet Armor",
+    "uar": "Sacred Armor",
+    "dr9": "Sacred Feathers",
+    "xkp": "Sallet",
+    "lbl": "Sash",
+    "ba9": "Savage Helmet",
+    "scl": "Scale Mail",
+    "ula": "Scarab Husk",
+    "uvb": "Scarabshell Boots",
+    "xea": "Serpentskin Armor",
+    "uul": "Shadow Plate",
+    "uap": "Shako",
+    "zvb": "Sharkskin Belt",
+    "xvb": "Sharkskin Boots",
+    "xvg": "Sharkskin Gloves",
+    "xld": "Sharktooth Armor",
+    "skp": "Skull Cap",
+    "dre": "Sky Spirit",
+    "baa": "Slayer Guard",
+    "ulc": "Spiderweb Sash",
+    "uhm": "Spired Helm",
+    "dr5": "Spirit Mask",
+    "spl": "Splint Mail",
+    "stu": "Studded Leather",
+    "drc": "Sun Spirit",
+    "xlt": "Templar Coat",
+    "ci2": "Tiara",
+    "xcl": "Tigulated Mail",
+    "dra": "Totemic Mask",
+    "xtu": "Trellised Armor",
+    "utc": "Troll Belt",
+    "umg": "Vambraces",
+    "uvg": "Vampirebone Gloves",
+    "uvc": "Vampirefang Belt",
+    "zhb": "War Belt",
+    "xhb": "War Boots",
+    "xhg": "War Gauntlets",
+    "xap": "War Hat",
+    "xhm": "Winged Helm",
+    "utu": "Wire Fleece",
+    "dr1": "Wolf Head",
+    "uea": "Wyrmhide",
+    "ulb": "Wyrmhide Boots",
+}
+ARMOR_KEYS = ARMOR_STRINGS.keys()
+
+
+WEAPON_STRINGS = {
+    "9gi": "Ancient Axe",
+    "9wd": "Ancient Sword",
+    "8lx": "Arbalest",
+    "6ws": "Archon Staff",
+    "am6": "Ashwood Bow",
+    "7sm": "Ataghan",
+    "axe": "Axe",
+    "bal": "Balanced Axe",
+    "bkf": "Balanced Knife",
+    "8hx": "Balista",
+    "7gs": "Balrog Blade",
+    "7s7": "Balrog Spear",
+    "9sp": "Barbed Club",
+    "bar": "Bardiche",
+    "bsw": "Bastard Sword",
+    "btx": "Battle Axe",
+    "7cs": "Battle Cestus",
+    "9tk": "Battle Dart",
+    "9wh": "Battle Hammer",
+    "9s8": "Battle Scythe",
+    "bst": "Battle Staff",
+    "9bs": "Battle Sword",
+    "9ba": "Bearded Axe",
+    "9h9": "Bec De Corbin",
+    "7wa": "Berserker Axe",
+    "9vo": "Bill",
+    "bld": "Blade",
+    "6hb": "Blade Bow",
+    "btl": "Blade Talons",
+    "7dg": "Bone Knife",
+    "bwn": "Bone Wand",
+    "brn": "Brandistock",
+    "bax": "Broad Axe",
+    "bsd": "Broad Sword",
+    "9wn": "Burnt Wand",
+    "7ws": "Caduceus",
+    "8lb": "Cedar Bow",
+    "8cs": "Cedar Staff",
+    "am7": "Ceremonial Bow",
+    "ama": "Ceremonial Javelin",
+    "am9": "Ceremonial Pike",
+    "am8": "Ceremonial Spear",
+    "ces": "Cestus",
+    "7ga": "Champion Axe",
+    "7b7": "Champion Sword",
+    "gpm": "Choking Gas Potion",
+    "8rx": "Chu-Ko-Nu",
+    "9kr": "Cinquedeas",
+    "ob4": "Clasped Orb",
+    "clw": "Claws",
+    "clm": "Claymore",
+    "9ax": "Cleaver",
+    "ob8": "Cloudy Sphere",
+    "clb": "Club",
+    "7fb": "Colossal Sword",
+    "7gd": "Colossal Blade",
+    "6hx": "Colossus Crossbow",
+    "7vo": "Colossus Voulge",
+    "cbw": "Composite Bow",
+    "7bs": "Conquest Sword",
+    "mxb": "Crossbow",
+    "9mp": "Crowbill",
+    "6l7": "Crusader Bow",
+    "7pa": "Cryptic Axe",
+    "7ls": "Cryptic Sword",
+    "crs": "Crystal Sword",
+    "ob7": "Crystalline Globe",
+    "9cl": "Cudgel",
+    "9sm": "Cutlass",
+    "9cm": "Dacian Falx",
+    "dgr": "Dagger",
+    "7bt": "Decapitator",
+    "d33": "Decoy Dagger",
+    "6rx": "Demon Crossbow",
+    "obd": "Demon Heart",
+    "7mt": "Devil Star",
+    "6s7": "Diamond Bow",
+    "9cr": "Dimensional Blade",
+    "obf": "Dimensional Shard",
+    "dir": "Dirk",
+    "9ws": "Divine Scepter",
+    "2ax": "Double Axe",
+    "8cb": "Double Bow",
+    "ob5": "Dragon Stone",
+    "ob1": "Eable Orb",
+    "8sb": "Edge Bow",
+    "6cs": "Elder Staff",
+    "obc": "Eldritch Orb",
+    "7sb": "Elegant Blade",
+    "92h": "Espadon",
+    "72a": "Ettin Axe",
+    "9gd": "Executioner Sword",
+    "opm": "Exploding Potion",
+    "7ss": "Falcata",
+    "flc": "Falchion",
+    "7kr": "Fanged Knife",
+    "9xf": "Fascia",
+    "7la": "Feral Axe",
+    "7lw": "Feral Claws",
+    "fla": "Flail",
+    "flb": "Flamberge",
+    "9ma": "Flanged Mace",
+    "7ta": "Flying Axe",
+    "7tk": "Flying Knife",
+    "9ta": "Francisca",
+    "opl": "Fulmating Potion",
+    "9tr": "Fuscina",
+    "7gl": "Ghost Glaive",
+    "7st": "Ghost Spear",
+    "7yw": "Ghost Wand",
+    "gix": "Giant Axe",
+    "gis": "Giant Sword",
+    "7wc": "Giant Thresher",
+    "g33": "Gidbinn",
+    "9ss": "Gladius",
+    "glv": "Glaive",
+    "7gi": "Glorious Axe",
+    "ob6": "Glowing Orb",
+    "cst": "Gnarled Staff",
+    "6mx": "Gorgon Crossbow",
+    "9ga": "Gothic Axe",
+    "8lw": "Gothic Bow",
+    "8bs": "Gothic Staff",
+    "9b9": "Gothic Sword",
+    "amc": "Grand Matron Bow",
+    "gsc": "Grand Scepter",
+    "9gw": "Grave Wand",
+    "gax": "Great Axe",
+    "6cb": "Great Bow",
+    "gma": "Great Maul",
+    "9pi": "Great Pilum",
+    "7h7": "Great Poleaxe",
+    "gsd": "Great Sword",
+    "9lw": "Greater Claws",
+    "9tw": "Greater Talons",
+    "9wc": "Grim Scythe",
+    "gwn": "Grim Wand",
+    "hal": "Halberd",
+    "hax": "Hand Axe",
+    "9cs": "Hand Scythe",
+    "9ts": "Harpoon",
+    "9ha": "Hatchet",
+    "axf": "HatchetHands",
+    "obb": "Heavenly Stone",
+    "hxb": "Heavy Crossbow",
+    "hfh": "Hellforge Hammer",
+    "7cm": "Highland Blade",
+    "9qs": "Holy Water Sprinkler",
+    "hdm": "Horadric Malus",
+    "hst": "Horadric Staff",
+    "hbw": "Hunters Bow",
+    "9b8": "Hurlbat",
+    "6lw": "Hydra Bow",
+    "7fc": "Hydra Edge",
+    "7ja": "Hyperion Javelin",
+    "7sr": "Hyperion Spear",
+    "9mt": "Jagged Star",
+    "jav": "Javelin",
+    "8ss": "Jo Staff",
+    "ktr": "Katar",
+    "qf1": "Khalim Flail",
+    "9fl": "Knout",
+    "kri": "Kriss",
+    "9p9": "Lance",
+    "lax": "Large Axe",
+    "7bl": "Legend Spike",
+    "72h": "Legend Sword",
+    "7wh": "Legendary Mallet",
+    "7bw": "Lich Wand",
+    "lxb": "Light Crossbow",
+    "9b7": "Lochaber Axe",
+    "lbb": "Long Battle Bow",
+    "lbw": "Long Bow",
+    "8l8": "Long Siege Bow",
+    "lst": "Long Staff",
+    "lsd": "Long Sword",
+    "lwb": "Long War Bow",
+    "mac": "Mace",
+    "am5": "Maiden Javelin",
+    "am4": "Maiden Pike",
+    "am3": "Maiden Spear",
+    "7br": "Mancatcher",
+    "9gm": "Martel de Fer",
+    "amb": "Matriarchal Bow",
+    "ame": "Matriarchal Pike",
+    "amd": "Matriarchal Spear",
+    "amf": "Matriarchal Javelin",
+    "mau": "Maul",
+    "7sc": "Mighty Scepter",
+    "9la": "Military Axe",
+    "mpi": "Military Pick",
+    "7di": "Mithral Point",
+    "mst": "Morning Star",
+    "7wd": "Mythical Sword",
+    "9wa": "Naga",
+    "7o7": "Ogre Axe",
+    "7m7": "Ogre Maul",
+    "ops": "Oil Potion",
+    "9pa": "Partizan",
+    "6lx": "Pellet Bow",
+    "9yw": "Petrified Wand",
+    "7cr": "Phase Blade",
+    "pik": "Pike",
+    "pil": "Pilum",
+    "9dg": "Poignard",
+    "pax": "Poleaxe",
+    "7wn": "Polished Wand",
+    "8ls": "Quarter Staff",
+    "9ar": "Quhab",
+    "gps": "Rancid Gas Potion",
+    "8hb": "Razor Bow",
+    "am2": "Reflex Bow",
+    "7ma": "Reinforced Mace",
+    "rxb": "Repeating Crossbow",
+    "9di": "Rondel",
+    "8sw": "Rune Bow",
+    "9sc": "Rune Scepter",
+    "8ws": "Rune Staff",
+    "9ls": "Rune Sword",
+    "7tw": "Runic Talons",
+    "sbr": "Sabre",
+    "ob2": "Sacred Globe",
+    "scp": "Scepter",
+    "scm": "Scimitar",
+    "skr": "Scissors Katar",
+    "9qr": "Scissors Quhab",
+    "7qr": "Scissors Suwayyah",
+    "7fl": "Scourge",
+    "scy": "Scythe",
+    "7qs": "Seraph Rod",
+    "6lb": "Shadow Bow",
+    "9sb": "Shamshir",
+    "6bs": "Shillelah",
+    "sbb": "Short Battle Bow",
+    "sbw": "Short Bow",
+    "8s8": "Short Siege Bow",
+    "ssp": "Short Spear",
+    "sst": "Short Staff",
+    "ssd": "Short Sword",
+    "swb": "Short War Bow",
+    "8mx": "Siege Crossbow",
+    "7ba": "Silver Edged Axe",
+    "9s9": "Simbilan",
+    "7ax": "Small Crescent",
+    "ob3": "Smoked Sphere",
+    "ob9": "Sparkling Ball",
+    "spr": "Spear",
+    "spt": "Spetum",
+    "9gl": "Spiculum",
+    "6sb": "Spider Bow",
+    "spc": "Spiked Club",
+    "msf": "Staff Of The Kings",
+    "am1": "Stag Bow",
+    "6ls": "Stalagmite",
+    "9bl": "Stilleto",
+    "gpl": "Strangling Gas Potion",
+    "7tr": "Stygian Pike",
+    "7pi": "Stygian Pilum",
+    "qf2": "Super Khalim Flail",
+    "7ar": "Suwayyah",
+    "oba": "Swirling Crystal",
+    "9bt": "Tabar",
+    "7s8": "Thresher",
+    "tax": "Throwing Axe",
+    "tkf": "Throwing Knife",
+    "tsp": "Throwing Spear",
+    "7gm": "Thunder Maul",
+    "7ha": "Tomahawk",
+    "9bw": "Tomb Wand",
+    "tri": "Trident",
+    "7cl": "Truncheon",
+    "9fc": "Tulwar",
+    "9gs": "Tusk Sword",
+    "92a": "Twin Axe",
+    "2hs": "Two Handed Sword",
+    "7sp": "Tyrant Club",
+    "7gw": "Unearthed Wand",
+    "obe": "Vortex Orb",
+    "vou": "Voulge",
+    "6ss": "Walking Stick",
+    "wnd": "Wand",
+    "wax": "War Axe",
+    "9m9": "War Club",
+    "9bk": "War Dart",
+    "7xf": "War Fist",
+    "9br": "War Fork",
+    "whm": "War Hammer",
+    "9ja": "War Javelin",
+    "7p7": "War Pike",
+    "wsp": "War Scepter",
+    "wsc": "War Scythe",
+    "9sr": "War Spear",
+    "7mp": "War Spike",
+    "wst": "War Staff",
+    "wsd": "War Sword",
+    "6sw": "Ward Bow",
+    "7b8": "Winged Axe",
+    "7ts": "Winged Harpoon",
+    "7bk": "Winged Knife",
+    "leg": "Wirts Leg",
+    "wrb": "Wrist Blade",
+    "9wb": "Wrist Spike",
+    "7wb": "Wrist Sword",
+    "9st": "Yari",
+    "ywn": "Yew Wand",
+    "9fb": "Zweihander",
+}
+WEAPON_KEYS = WEAPON_STRINGS.keys()
+
+
+MISC_STRINGS = {
+    "gsv": "Amethyst",
+    "r11": "Amn Rune",
+    "amu": "Amulet",
+    "yps": "Antidote Potion",
+    "aqv": "Arrows",
+    "bey": "Baal's Eye",
+    "bks": "Bark Scroll",
+    "r30": "Ber Rune",
+    "cqv": "Bolts",
+    "ass": "Book of Skill",
+    "bet": "Burning Essence of Terror",
+    "r32": "Cham Rune",
+    "ceh": "Charged Essence of Hatred",
+    "cm3": "Grand Charm",
+    "cm2": "Large Charm",
+    "cm1": "Small Charm",
+    "gcv": "Chipped Amethyst",
+    "gcw": "Chipped Diamond",
+    "gcg": "Chipped Emerald",
+    "gcr": "Chipped Ruby",
+    "gcb": "Chipped Sapphire",
+    "skc": "Chipped Skull",
+    "gcy": "Chipped Topaz",
+    "bkd": "Deciphered Bark Scroll",
+    "dhn": "Diablo's Horn",
+    "gsw": "Diamond",
+    "r14": "Dol Rune",
+    "r01": "El Rune",
+    "r02": "Eld Rune",
+    "elx": "Elixir",
+    "gsg": "Emerald",
+    "r05": "Eth Rune",
+    "r19": "Fal Rune",
+    "fed": "Festering Essence of Destruction",
+    "gfv": "Flawed Amethyst",
+    "gfw": "Flawed Diamond",
+    "gfg": "Flawed Emerald",
+    "gfr": "Flawed Ruby",
+    "gfb": "Flawed Sapphire",
+    "skf": "Flawed Skull",
+    "gfy": "Flawed Topaz",
+    "gzv": "Flawless Amethyst",
+    "glw": "Flawless Diamond",
+    "glg": "Flawless Emerald",
+    "glr": "Flawless Ruby",
+    "glb": "Flawless Sapphire",
+    "skl": "Flawless Skull",
+    "gly": "Flawless Topaz",
+    "hpf": "Full Healing Potion",
+    "mpf": "Full Mana Potion",
+    "rvl": "Full Rejuvenation Potion",
+    "gld": "Gold",
+    "g34": "Gold Bird",
+    "hp5": "Greater Healing Potion",
+    "mp5": "Greater Mana Potion",
+    "r25": "Gul Rune",
+    "hp3": "Healing Potion",
+    "hpo": "Healing Potion",
+    "r15": "Hel Rune",
+    "hrb": "Herb",
+    "box": "Horadric Cube",
+    "ibk": "Identify Book",
+    "isc": "Identify Scroll",
+    "r16": "Io Rune",
+    "r24": "Ist Rune",
+    "r06": "Ith Rune",
+    "j34": "Jade Figurine",
+    "r31": "Jah Rune",
+    "jew": "Jewel",
+    "pk3": "Key of Destruction",
+    "pk2": "Key of Hate",
+    "pk1": "Key of Terror",
+    "qbr": "Khalim's Brain",
+    "qey": "Khalim's Eye",
+    "qhr": "Khalim's Heart",
+    "r18": "Ko Rune",
+    "bbb": "Lam Esens Tome",
+    "bpl": "Large Blue Potion",
+    "rpl": "Large Red Potion",
+    "r20": "Lem Rune",
+    "hp1": "Lesser Healing Potion",
+    "mp1": "Lesser Mana Potion",
+    "hp2": "Light Healing Potion",
+    "mp2": "Light Mana Potion",
+    "r28": "Lo Rune",
+    "r17": "Lum Rune",
+    "ice": "Maguffin",
+    "r23": "Mal Rune",
+    "mp3": "Mana Potion",
+    "mpo": "Mana Potion",
+    "mbr": "Mephisto's Brain",
+    "luv": "Mephisto Key",
+    "mss": "Mephisto Soul Stone",
+    "r04": "Nef Rune",
+    "r27": "Ohm Rune",
+    "r09": "Ort Rune",
+    "gpv": "Perfect Amethyst",
+    "gpw": "Perfect Diamond",
+    "gpg": "Perfect Emerald",
+    "gpr": "Perfect Ruby",
+    "gpb": "Perfect Sapphire",
+    "skz": "Perfect Skull",
+    "gpy": "Perfect Topaz",
+    "ear": "Player Ear",
+    "r21": "Pul Rune",
+    "r08": "Ral Rune",
+    "rvs": "Rejuvenation Potion",
+    "rin": "Ring",
+    "gsr": "Ruby",
+    "gsb": "Sapphire",
+    "0sc": "Scroll",
+    "tr1": "Scroll of Horadric",
+    "tr2": "Scroll of Malah",
+    "xyz": "Potion of Life",
+    "r13": "Shael Rune",
+    "key": "Skeleton Key",
+    "sku": "Skull",
+    "bps": "Small Blue Potion",
+    "rps": "Small Red Potion",
+    "r12": "Sol Rune",
+    "vps": "Stamina Potion",
+    "std": "Standard of Heroes",
+    "hp4": "Strong Healing Potion",
+    "mp4": "Strong Mana Potion",
+    "r29": "Sur Rune",
+    "r07": "Tal Rune",
+    "wms": "Thawing Potion",
+    "r10": "Thul Rune",
+    "r03": "Tir Rune",
+    "toa": "Token of Absolution",
+    "gsy": "Topaz",
+    "tch": "Torch",
+    "tbk": "Town Portal Book",
+    "tsc": "Town Portal Scroll",
+    "tes": "Twisted Essence of Suffering",
+    "r22": "Um Rune",
+    "r26": "Vex Rune",
+    "vip": "Viper Amulet",
+    "r33": "Zod Rune",
+}
+MISC_KEYS = MISC_STRINGS.keys()
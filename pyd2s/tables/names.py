@@ -0,0 +1,907 @@
+"""The names of rare, set, unique and runeword items."""
+
+
+RARE_NAMES = {
+    1: "Bite",
+    2: "Scratch",
+    3: "Scalpel",
+    4: "Fang",
+    5: "Gutter",
+    6: "Thirst",
+    7: "Razor",
+    8: "Scythe",
+    9: "Edge",
+    10: "Saw",
+    11: "Splitter",
+    12: "Cleaver",
+    13: "Sever",
+    14: "Sunder",
+    15: "Rend",
+    16: "Mangler",
+    17: "Slayer",
+    18: "Reaver",
+    19: "Spawn",
+    20: "Gnash",
+    21: "Star",
+    22: "Blow",
+    23: "Smasher",
+    24: "Bane",
+    25: "Crusher",
+    26: "Breaker",
+    27: "Grinder",
+    28: "Crack",
+    29: "Mallet",
+    30: "Knell",
+    31: "Lance",
+    32: "Spike",
+    33: "Impaler",
+    34: "Skewer",
+    35: "Prod",
+    36: "Scourge",
+    37: "Wand",
+    38: "Wrack",
+    39: "Barb",
+    40: "Needle",
+    41: "Dart",
+    42: "Bolt",
+    43: "Quarrel",
+    44: "Fletch",
+    45: "Flight",
+    46: "Nock",
+    47: "Horn",
+    48: "Stinger",
+    49: "Quill",
+    50: "Goad",
+    51: "Branch",
+    52: "Spire",
+    53: "Song",
+    54: "Call",
+    55: "Cry",
+    56: "Spell",
+    57: "Chant",
+    58: "Weaver",
+    59: "Gnarl",
+    60: "Visage",
+    61: "Crest",
+    62: "Circlet",
+    63: "Veil",
+    64: "Hood",
+    65: "Mask",
+    66: "Brow",
+    67: "Casque",
+    68: "Visor",
+    69: "Cowl",
+    70: "Hide",
+    71: "Pelt",
+    72: "Carapace",
+    73: "Coat",
+    74: "Wrap",
+    75: "Suit",
+    76: "Cloak",
+    77: "Shroud",
+    78: "Jack",
+    79: "Mantle",
+    80: "Guard",
+    81: "Badge",
+    82: "Rock",
+    83: "Aegis",
+    84: "Ward",
+    85: "Tower",
+    86: "Shield",
+    87: "Wing",
+    88: "Mark",
+    89: "Emblem",
+    90: "Hand",
+    91: "Fist",
+    92: "Claw",
+    93: "Clutches",
+    94: "Grip",
+    95: "Grasp",
+    96: "Hold",
+    97: "Torch",
+    98: "Finger",
+    99: "Knuckle",
+    100: "Shank",
+    101: "Spur",
+    102: "Tread",
+    103: "Stalker",
+    104: "Greave",
+    105: "Blazer",
+    106: "Nails",
+    107: "Trample",
+    108: "Brogues",
+    109: "Track",
+    110: "Slippers",
+    111: "Clasp",
+    112: "Buckle",
+    113: "Harness",
+    114: "Lock",
+    115: "Fringe",
+    116: "Winding",
+    117: "Chain",
+    118: "Strap",
+    119: "Lash",
+    120: "Cord",
+    121: "Knot",
+    122: "Circle",
+    123: "Loop",
+    124: "Eye",
+    125: "Turn",
+    126: "Spiral",
+    127: "Coil",
+    128: "Gyre",
+    129: "Band",
+    130: "Whorl",
+    131: "Talisman",
+    132: "Heart",
+    133: "Noose",
+    134: "Necklace",
+    135: "Collar",
+    136: "Beads",
+    137: "Torc",
+    138: "Gorget",
+    139: "Scarab",
+    140: "Wood",
+    141: "Brand",
+    142: "Bludgeon",
+    143: "Cudgel",
+    144: "Loom",
+    145: "Harp",
+    146: "Master",
+    147: "Barl",
+    148: "Hew",
+    149: "Crook",
+    150: "Mar",
+    151: "Shell",
+    152: "Stake",
+    153: "Picket",
+    154: "Pale",
+    155: "Flange",
+    156: "Beast",
+    157: "Eagle",
+    158: "Raven",
+    159: "Viper",
+    160: "Ghoul",
+    161: "Skull",
+    162: "Blood",
+    163: "Dread",
+    164: "Doom",
+    165: "Grim",
+    166: "Bone",
+    167: "Death",
+    168: "Shadow",
+    169: "Storm",
+    170: "Rune",
+    171: "Plague",
+    172: "Stone",
+    173: "Wraith",
+    174: "Spirit",
+    175: "Storm",
+    176: "Demon",
+    177: "Cruel",
+    178: "Empyrion",
+    179: "Bramble",
+    180: "Pain",
+    181: "Loath",
+    182: "Glyph",
+    183: "Imp",
+    184: "Fiendra",
+    185: "Hailstone",
+    186: "Gale",
+    187: "Dire",
+    188: "Soul",
+    189: "Brimstone",
+    190: "Corpse",
+    191: "Carrion",
+    192: "Armageddon",
+    193: "Havoc",
+    194: "Bitter",
+    195: "Entropy",
+    196: "Chaos",
+    197: "Order",
+    198: "Rule",
+    199: "Warp",
+    200: "Rift",
+    201: "Corruption",
+}
+
+
+SET_STRINGS = {
+    0: "Civerb's Ward",
+    1: "Civerb's Icon",
+    2: "Civerb's Cudgel",
+    3: "Hsaru's Iron Heel",
+    4: "Hsaru's Iron Fist",
+    5: "Hsaru's Iron Stay",
+    6: "Cleglaw's Tooth",
+    7: "Cleglaw's Claw",
+    8: "Cleglaw's Pincers",
+    9: "Iratha's Collar",
+    10: "Iratha's Cuff",
+    11: "Iratha's Coil",
+    12: "Iratha's Cord",
+    13: "Isenhart's Lightbrand",
+    14: "Isenhart's Parry",
+    15: "Isenhart's Case",
+    16: "Isenhart's Horns",
+    17: "Vidala's Barb",
+    18: "Vidala's Fetlock",
+    19: "Vidala's Ambush",
+    20: "Vidala's Snare",
+    21: "Milabrega's Orb",
+    22: "Milabrega's Rod",
+    23: "Milabrega's Diadem",
+    24: "Mialbrega's Robe",
+    25: "Cathan's Rule",
+    26: "Cathan's Mesh",
+    27: "Cathan's Visage",
+    28: "Cathan's Sigil",
+    29: "Cathan's Seal",
+    30: "Tancred's Crowbill",
+    31: "Tancred's Spine",
+    32: "Tancred's Hobnails",
+    33: "Tancred's Weird",
+    34: "Tancred's Skull",
+    35: "Sigon's Gage",
+    36: "Sigon's Visor",
+    37: "Sigon's Shelter",
+    38: "Sigon's Sabot",
+    39: "Sigon's Wrap",
+    40: "Sigon's Guard",
+    41: "Infernal Cranium",
+    42: "Infernal Torch",
+    43: "Infernal Sign",
+    44: "Berserker's Headgear",
+    45: "Berserker's Hauberk",
+    46: "Berserker's Hatchet",
+    47: "Death's Hand",
+    48: "Death's Guard",
+    49: "Death's Touch",
+    50: "Angelic Sickle",
+    51: "Angelic Mantle",
+    52: "Angelic Halo",
+    53: "Angelic Wings",
+    54: "Arctic Horn",
+    55: "Arctic Furs",
+    56: "Arctic Binding",
+    57: "Arctic Mitts",
+    58: "Arcanna's Sign",
+    59: "Arcanna's Deathwand",
+    60: "Arcanna's Head",
+    61: "Arcanna's Flesh",
+    62: "Natalya's Totem",
+    63: "Natalya's Mark",
+    64: "Natalya's Shadow",
+    65: "Natalya's Soul",
+    66: "Aldur's Stony Gaze",
+    67: "Aldur's Deception",
+    68: "Aldur's Rhythm",
+    69: "Aldur's Advance",
+    70: "Immortal King's Will",
+    71: "Immortal King's Soul Cage",
+    72: "Immortal King's Detail",
+    73: "Immortal King's Forge",
+    74: "Immortal King's Pillar",
+    75: "Immortal King's Stone Crusher",
+    76: "Tal Rasha's Fine-Spun Cloth",
+    77: "Tal Rasha's Adjudication",
+    78: "Tal Rasha's Lidless Eye",
+    79: "Tal Rasha's Guardianship",
+    80: "Tal Rasha's Horadric Crest",
+    81: "Griswold's Valor",
+    82: "Griswold's Heart",
+    83: "Griswold's Redemption",
+    84: "Griswold's Honor",
+    85: "Trang-Oul's Guise",
+    86: "Trang-Oul's Scales",
+    87: "Trang-Oul's Wing",
+    88: "Trang-Oul's Claws",
+    89: "Trang-Oul's Girth",
+    90: "M'avina's True Sight",
+    91: "M'avina's Embrace",
+    92: "M'avina's Icy Clutch",
+    93: "M'avina's Tenet",
+    94: "M'avina's Caster",
+    95: "Telling of Beads",
+    96: "Laying of Hands",
+    97: "Rite of Passage",
+    98: "Dark Adherent",
+    99: "Credendum",
+    100: "Dangoon's Teaching",
+    101: "Taebaek's Glory",
+    102: "Haemosu's Adament",
+    103: "Ondal's Almighty",
+    104: "Guillaume's Face",
+    105: "Wilhelm's Pride",
+    106: "Magnus' Skin",
+    107: "Wihtstan's Guard",
+    108: "Hwanin's Splendor",
+    109: "Hwanin's Refuge",
+    110: "Hwanin's Blessing",
+    111: "Hwanin's Justice",
+    112: "Sazabi's Cobalt Redeemer",
+    113: "Sazabi's Ghost Liberator",
+    114: "Sazabi's Mental Sheath",
+    115: "Bul-Katho's Sacred Charge",
+    116: "Bul-Katho's Tribal Guardian",
+    117: "Cow King's Horns",
+    118: "Cow King's Hide",
+    119: "Cow King's Hooves",
+    120: "Naj's Puzzler",
+    121: "Naj's Light Plate",
+    122: "Naj's Circlet",
+    123: "Sander's Paragon",
+    124: "Sander's Riprap",
+    125: "Sander's Taboo",
+    126: "Sander's Superstition",
+}
+
+
+RUNEWORD_STRINGS = {
+    27: "Ancient's Pledge",
+    30: "Beast",
+    32: "Black",
+    34: "Bone",
+    35: "Bramble",
+    36: "Brand",
+    37: "Breath of the Dying",
+    39: "Call to Arms",
+    40: "Chains of Honor",
+    42: "Chaos",
+    43: "Crescent Moon",
+    46: "Death",
+    51: "Destruction",
+    52: "Doom",
+    53: "Dragon",
+    55: "Dream",
+    56: "Duress",
+    57: "Edge",
+    59: "Enigma",
+    60: "Enlightenment",
+    62: "Eternity",
+    63: "Exile",
+    64: "Faith",
+    65: "Famine",
+    67: "Fortitude",
+    70: "Fury",
+    71: "Gloom",
+    73: "Grief",
+    74: "Hand of Justice",
+    75: "Harmory",
+    77: "Heart of the Oak",
+    80: "Holy Thunder",
+    81: "Honor",
+    85: "Ice",
+    86: "Infinity",
+    88: "Insight",
+    91: "King's Grace",
+    92: "Kingslayer",
+    95: "Last Wish",
+    97: "Lawbringer",
+    98: "Leaf",
+    100: "Lionheart",
+    101: "Lore",
+    106: "Malice",
+    107: "Melody",
+    108: "Memory",
+    112: "Myth",
+    113: "Nadir",
+    116: "Oath",
+    117: "Obedience",
+    120: "Passion",
+    123: "Peace",
+    124: "Winter",
+    128: "Phoenix",
+    134: "Pride",
+    135: "Principle",
+    137: "Prudence",
+    141: "Radiance",
+    142: "Rain",
+    145: "Rhyme",
+    146: "Rift",
+    147: "Sanctuary",
+    151: "Silence",
+    153: "Smoke",
+    155: "Spirit",
+    156: "Splendor",
+    158: "Stealth",
+    159: "Steel",
+    162: "Stone",
+    164: "Strength",
+    173: "Treachery",
+    179: "Venom",
+    185: "Wealth",
+    187: "White",
+    188: "Wind",
+    193: "Wrath",
+    195: "Zephyr",
+    2718: "Delirium",
+}
+
+# key: name, formula, ladder only
+RUNEWORDS = {
+    27: ("Ancient's Pledge", ["r08", "r09", "r07"], False),  # Ral Ort Tal
+    30: ("Beast", [r"r30", "r03", "r22", "r23", "r17"], False),  # Ber Tir Um Mal Lum
+    32: ("Black", ["r10", "r16", "r04"], False),  # Thul Io Nef
+    34: ("Bone", ["r12", "r22", "r22"], True),  # Sol Um Um
+    35: ("Bramble", ["r08", "r27", "r29", "r05"], False),  # Ral Ohm Sur Eth
+    36: ("Brand", ["r31", "r28", "r23", "r25"], True),  # Jah Lo Mal Gul
+    37: ("Breath of the Dying", ["r26", "r15", "r01", "r02", "r33", "r05"], False),
+    39: ("Call to Arms", ["r11", "r08", "r23", "r24", "r27"], False),  # Amn Ral Mal Ist Ohm
+    40: ("Chains of Honor", ["r14", "r22", "r30", "r24"], False),  # Dol Um Ber Ist
+    42: ("Chaos", ["r19", "r27", "r22"], False),  # Fal Ohm Um
+    43: ("Crescent Moon", ["r13", "r22", "r03"], False),  # Shael Um Tir
+    46: ("Death", ["r15", "r01", "r26", "r09", "r25"], True),  # Hel El Vex Ort Gul
+    51: ("Destruction", ["r26", "r28", "r30", "r31", "r18"], True),  # Vex Lo Ber Jah Ko
+    52: ("Doom", ["r15", "r27", "r22", "r28", "r32"], False),  # Hel Ohm Um Lo Cham
+    53: ("Dragon", ["r29", "r28", "r12"], True),  # Sur Lo Sol
+    55: ("Dream", ["r16", "r31", "r21"], True),  # Io Jah Pul
+    56: ("Duress", ["r13", "r22", "r10"], False),  # Shael Um Thul
+    57: ("Edge", ["r03", "r07", "r11"], True),  # Tir Tal Amn
+    59: ("Enigma", ["r31", "r06", "r30"], False),  # Jah Ith Ber
+    60: ("Enlightenment", ["r21", "r08", "r12"], False),  # Pul Ral Sol
+    62: ("Eternity", ["r11", "r30", "r24", "r12", "r29"], False),  # Amn Ber Ist Sol Sur
+    63: ("Exile", ["r26", "r27", "r24", "r14"], False),  # Vex Ohm Ist Dol
+    64: ("Faith", ["r27", "r31", "r20", "r02"], True),  # Ohm Jah Lem Eld
+    65: ("Famine", ["r19", "r27", "r09", "r31"], False),  # FalOhm Ort Jah
+    67: ("Fortitude", ["r01", "r12", "r14", "r28"], True),  # El Sol Dol Lo
+    70: ("Fury", ["r31", "r25", "r05"], False),  # Jah Gul Eth
+    71: ("Gloom", ["r19", "r22", "r21"], False),  # Fal Um Pul
+    73: ("Grief", ["r05", "r03", "r28", "r23", "r08"], True),  # Eth Tir Lo Mal Ral
+    74: ("Hand of Justice", ["r29", "r32", "r11", "r28"], False),  # Sur Cham Amn Lo
+    75: ("Harmony", ["r03", "r06", "r12", "r18"], True),  # Tir Ith Sol Ko
+    77: ("Heart of the Oak", ["r18", "r26", "r21", "r10"], False),  # Ko Vex Pul Thul
+    80: ("Holy Thunder", ["r05", "r08", "r09", "r07"], False),  # Eth Ral Ort Tal
+    81: ("Honor", ["r11", "r01", "r06", "r03", "r12"], False),  # Amn El Ith Tir Sol
+    85: ("Ice", ["r11", "r13", "r31", "r28"], True),  # Amn Shael Jah Lo
+    86: ("Infinity", ["r30", "r23", "r30", "r24"], True),  # Ber Mal Ber Ist
+    88: ("Insight", ["r08", "r03", "r07", "r12"], True),  # Ral Tir Tal Sol
+    91: ("King's Grace", ["r11", "r08", "r10"], False),  # King's Grace
+    92: ("Kingslayer", ["r23", "r22", "r25", "r19"], False),  # Mal Um Gul Fal
+    95: ("Last Wish", ["r31", "r23", "r31", "r29", "r31", "r30"], True),  # Jah Mal Jah Sur Jah Ber
+    97: ("Lawbringer", ["r11", "r20", "r18"], True),  # Lawbringer
+    98: ("Leaf", ["r03", "r08"], False),  # Tir Ral
+    100: ("Lionheart", ["r15", "r17", "r19"], False),  # Hel Lum Fal
+    101: ("Lore", ["r09", "r12"], False),  # Ort Sol
+    106: ("Malice", ["r06", "r01", "r05"], False),  # Ith El Ith
+    107: ("Melody", ["r13", "r18", "r04"], False),  # Shael Ko Nef
+    108: ("Memory", ["r17", "r16", "r12", "r05"], False),  # Lum Io Sol Eth
+    112: ("Myth", ["r15", "r11", "r04"], False),  # Hel Amn Nef
+    113: ("Nadir", ["r04", "r03"], False),  # Nef Tir
+    116: ("Oath", ["r13", "r21", "r23", "r17"], True),  # Shael Pul Mal Lum
+    117: ("Obedience", ["r15", "r18", "r10", "r05", "r19"], True),  # Hel Ko Thul Eth Fal
+    120: ("Passion", ["r14", "r09", "r02", "r20"], False),  # Dol Ort Eld Lem
+    123: ("Peace", ["r13", "r10", "r11"], False),  # Shael Thul Amn
+    # 124: [],  # Winter
+    128: ("Phoenix", ["r26", "r26", "r28", "r31"], True),  # Vex Vex Lo Jah
+    134: ("Pride", ["r32", "r29", "r16", "r28"], True),  # Cham Sur Io Lo
+    135: ("Principle", ["r08", "r25", "r02"], False),  # Ral Gul Eld
+    137: ("Prudence", ["r23", "r03"], False),  # Mal Tir
+    141: ("Radiance", ["r04", "r12", "r06"], False),  # Nef Sol Ith
+    142: ("Rain", ["r09", "r23", "r06"], False),  # Ort Mal Ith
+    145: ("Rhyme", ["r13", "r05"], False),  # Shael Eth
+    146: ("Rift", ["r15", "r18", "r20", "r25"], True),  # Hel Ko Lem Gul
+    147: ("Sanctuary", ["r18", "r18", "r23"], False),  # Ko Ko Mal
+    151: ("Silence", ["r14", "r02", "r15", "r24", "r03", "r26"], False),  # Dol Eld Hel Ist Tir Vex
+    153: ("Smoke", ["r04", "r17"], False),  # Nef Lum
+    155: ("Spirit", ["r07", "r10", "r09", "r11"], True),  # Tal Thul Ort Amn
+    156: ("Splendor", ["r05", "r17"], False),  # Eth Lum
+    158: ("Stealth", ["r07", "r05"], False),  # Tal Eth
+    159: ("Steel", ["r03", "r01"], False),  # Tir El
+    162: ("Stone", ["r13", "r22", "r21", "r17"], False),  # Shael Um Pul Lum
+    164: ("Strength", ["r11", "r03"], False),  # Amn Tir
+    173: ("Treachery", ["r13", "r10", "r20"], False),  # Shael Thul Lem
+    179: ("Venom", ["r07", "r14", "r23"], False),  # Tal Dol Mal
+    # Voice of Reason? Lem Ko El Eld, True (index unknown)
+    185: ("Wealth", ["r20", "r18", "r03"], False),  # Lem Ko Tir
+    187: ("White", ["r14", "r16"], False),  # Dol Io
+    188: ("Wind", ["r29", "r01"], False),  # Sur El
+    193: ("Wrath", ["r21", "r17", "r30", "r23"], True),  # Pul Lum Ber Mal
+    195: ("Zephyr", ["r09", "r05"], False),  # Zephyr, Ort Eth
+    2718: ("Delirium", ["r20", "r24", "r16"], False),  # Lem Ist Io
+}
+
+
+UNIQUE_STRINGS = {
+    0: "The Gnasher",
+    1: "Deathspade",
+    2: "Bladebone",
+    3: "Skull splitter",
+    4: "Rakescar",
+    5: "Axe of Fechmar",
+    6: "Goreshovel",
+    7: "The Chiefthan",
+    8: "Brainhew",
+    9: "Humongous",
+    10: "Torch of Iros",
+    11: "Maelstorm",
+    12: "Gravenspine",
+    13: "Umes Lament",
+    14: "Felloak",
+    15: "Knell Striker",
+    16: "Rusthandle",
+    17: "Stormeye",
+    18: "Stoutnail",
+    19: "Crushflange",
+    20: "Bloodrise",
+    21: "The Generals Tan Do Li Ga",
+    22: "Ironstone",
+    23: "Bonesnap",
+    24: "Steeldriver",
+    25: "Rixot's Keen",
+    26: "Blood Crescent",
+    27: "Skewer of Krintiz",
+    28: "Gleamscythe",
+    29: "Azurewrath",
+    30: "Griswold's Edge",
+    31: "Hellplague",
+    32: "Culwens Point",
+    33: "Shadowfang",
+    34: "Soulflay",
+    35: "Kinemils Awl",
+    36: "Blacktongue",
+    37: "Ripsaw",
+    38: "The Patriarch",
+    39: "Gull",
+    40: "The Diggler",
+    41: "The Jade Tan Do",
+    42: "Spectral Shard",
+    43: "The Dragon Chang",
+    44: "Razortine",
+    45: "Bloodthief",
+    46: "Lance of Yaggai",
+    47: "The Tannr Gorerod",
+    48: "Dimoaks Hew",
+    49: "Steelgoad",
+    50: "Soul Harvest",
+    51: "The Battlebranch",
+    52: "Woestave",
+    53: "The Grim Reaper",
+    54: "Bane Ash",
+    55: "Serpent Lord",
+    56: "Spire of Lazarus",
+    57: "The Salamander",
+    58: "The Iron Jang Bong",
+    59: "Pluckeye",
+    60: "Witherstring",
+    61: "Raven Claw",
+    62: "Rogue's Bow",
+    63: "Stormstrike",
+    64: "Wizendraw",
+    65: "Hellclap",
+    66: "Blastbark",
+    67: "Leadcrow",
+    68: "Ichorsting",
+    69: "Hellcast",
+    70: "Doomslinger",
+    71: "Biggin's Bonnet",
+    72: "Tarnhelm",
+    73: "Coif of Glory",
+    74: "Duskdeep",
+    75: "Wormskull",
+    76: "Howltusk",
+    77: "Undead Crown",
+    78: "The Face of Horror",
+    79: "Greyform",
+    80: "Blinkbat's Form",
+    81: "The Centurion",
+    82: "Twitchthroe",
+    83: "Darkglow",
+    84: "Hawkmail",
+    85: "Sparking Mail",
+    86: "Venom Ward",
+    87: "Iceblink",
+    88: "Boneflesh",
+    89: "Rockfleece",
+    90: "Rattlecage",
+    91: "Goldskin",
+    92: "Victors Silk",
+    93: "Heavenly Garb",
+    94: "Pelta Lunata",
+    95: "Umbral Disk",
+    96: "Stormguild",
+    97: "Wall of the Eyeless",
+    98: "Swordback Hold",
+    99: "Steelclash",
+    100: "Bverrit Keep",
+    101: "The Ward",
+    102: "The Hand of Broc",
+    103: "Bloodfist",
+    104: "Chance Guards",
+    105: "Magefist",
+    106: "Frostburn",
+    107: "Hotspur",
+    108: "Gorefoot",
+    109: "Treads of Cthon",
+    110: "Goblin Toe",
+    111: "Tearhaunch",
+    112: "Lenymo",
+    113: "Snakecord",
+    114: "Nightsmoke",
+    115: "Goldwrap",
+    116: "Bladebuckle",
+    117: "Nokozan Relic",
+    118: "The Eye of Etlich",
+    119: "The Mahim-Oak Curio",
+    120: "Nagelring",
+    121: "Manald Heal",
+    122: "The Stone of Jordan",
+    123: "Amulet of the Viper",
+    124: "Staff of Kings",
+    125: "Horadric Staff",
+    126: "Hell Forge Hammer",
+    127: "Khalim's Flail",
+    128: "Super Khalim's Flail",
+    129: "Coldkill",
+    130: "Butcher's Pupil",
+    131: "Islestrike",
+    132: "Pompe's Wrath",
+    133: "Guardian Naga",
+    134: "Warlord's Trust",
+    135: "Spellsteel",
+    136: "Stormrider",
+    137: "Boneslayer Blade",
+    138: "The Minataur",
+    139: "Suicide Branch",
+    140: "Carin Shard",
+    141: "Arm of King Leoric",
+    142: "Blackhand Key",
+    143: "Dark Clan Crusher",
+    144: "Zakarum's Hand",
+    145: "The Fetid Sprinkler",
+    146: "Hand of Blessed Light",
+    147: "Fleshrender",
+    148: "Sureshrill Frost",
+    149: "Moonfall",
+    150: "Baezil's Vortex",
+    151: "Earthshaker",
+    152: "Bloodtree Stump",
+    153: "The Gavel of Pain",
+    154: "Bloodletter",
+    155: "Coldsteel Eye",
+    156: "Hexfire",
+    157: "Blade of Ali Baba",
+    158: "Ginther's Rift",
+    159: "Headstriker",
+    160: "Plague Bearer",
+    161: "The Atlantian",
+    162: "Crainte Vomir",
+    163: "Bing Sz Wang",
+    164: "The Vile Husk",
+    165: "Cloudcrack",
+    166: "Todesfaelle Flamme",
+    167: "Swordguard",
+    168: "Spineripper",
+    169: "Heart Carver",
+    170: "Blackbog's Sharp",
+    171: "Stormspike",
+    172: "The Impaler",
+    173: "Kelpie Snare",
+    174: "Soulfeast Tine",
+    175: "Hone Sundan",
+    176: "Spire of Honor",
+    177: "The Meat Scraper",
+    178: "Blackleach Blade",
+    179: "Athena's Wrath",
+    180: "Pierre Tombale Couant",
+    181: "Husoldal Evo",
+    182: "Grim's Burning Dead",
+    183: "Razorswitch",
+    184: "Ribcracker",
+    185: "Chromatic Ire",
+    186: "Warpspear",
+    187: "Skullcollector",
+    188: "Skystrike",
+    189: "Riphook",
+    190: "Kuko Shakaku",
+    191: "Endlesshail",
+    192: "Whichwild String",
+    193: "Cliffkiller",
+    194: "Magewrath",
+    195: "Godstrike Arch",
+    196: "Langer Briser",
+    197: "Pus Spiter",
+    198: "Buriza-Do Kyanon",
+    199: "Demon Machine",
+    200: "Armor (Unknown)",
+    201: "Peasent Crown",
+    202: "Rockstopper",
+    203: "Stealskull",
+    204: "Darksight Helm",
+    205: "Valkyrie Wing",
+    206: "Crown of Thieves",
+    207: "Blackhorn's Face",
+    208: "Vampire Gaze",
+    209: "The Spirit Shroud",
+    210: "Skin of the Vipermagi",
+    211: "Skin of the Flayed One",
+    212: "Ironpelt",
+    213: "Spiritforge",
+    214: "Crow Caw",
+    215: "Shaftstop",
+    216: "Duriel's Shell",
+    217: "Skullder's Ire",
+    218: "Guardian Angel",
+    219: "Toothrow",
+    220: "Atma's Wail",
+    221: "Black Hades",
+    222: "Corpsemourn",
+    223: "Que-Hegan's Wisdom",
+    224: "Visceratuant",
+    225: "Mosers Blessed Circle",
+    226: "Stormchaser",
+    227: "Tiamat's Rebuke",
+    228: "Gerke's Sanctuary",
+    229: "Radimant's Sphere",
+    230: "Lidless Wall",
+    231: "Lance Guard",
+    232: "Venom Grip",
+    233: "Gravepalm",
+    234: "Ghoulhide",
+    235: "Lavagout",
+    236: "Hellmouth",
+    237: "Infernostride",
+    238: "Waterwalk",
+    239: "Silkweave",
+    240: "War Traveler",
+    241: "Gore Rider",
+    242: "String of Ears",
+    243: "Razortail",
+    244: "Gloomstrap",
+    245: "Snowclash",
+    246: "Thundergod's Vigor",
+    247: "Elite unique",
+    248: "Harlequin Crest",
+    249: "Veil of Steel",
+    250: "The Gladiator's Bane",
+    251: "Arkaine's Valor",
+    252: "Blackoak Shield",
+    253: "Stormshield",
+    254: "Hellslayer",
+    255: "Messerschmidt's Reaver",
+    256: "Baranar's Star",
+    257: "Schaefer's Hammer",
+    258: "The Cranium Basher",
+    259: "Lightsabre",
+    260: "Doombringer",
+    261: "The Grandfather",
+    262: "Wizardspike",
+    263: "Constricting Ring",
+    264: "Stormspire",
+    265: "Eaglehorn",
+    266: "Windforce",
+    267: "Ring",
+    268: "Bul Katho's Wedding Band",
+    269: "The Cat's Eye",
+    270: "The Rising Sun",
+    271: "Crescent Moon",
+    272: "Mara's Kaleidoscope",
+    273: "Atma's Scarab",
+    274: "Dwarf Star",
+    275: "Raven Frost",
+    276: "Highlord's Wrath",
+    277: "Saracen's Chance",
+    278: "Class specific",
+    279: "Arreat's Face",
+    280: "Homunculus",
+    281: "Titan's Revenge",
+    282: "Lycander's Aim",
+    283: "Lycander's Flank",
+    284: "The Oculus",
+    285: "Herald of Zakarum",
+    286: "Bartuc's Cut-Throat",
+    287: "Jalal's Mane",
+    288: "The Scalper",
+    289: "Bloodmoon",
+    290: "Djinnslayer",
+    291: "Deathbit",
+    292: "Warshrike",
+    293: "Gutsiphon",
+    294: "Razoredge",
+    295: "Gore Ripper",
+    296: "Demon Limb",
+    297: "Steel Shade",
+    298: "Tomb Reaver",
+    299: "Death's Web",
+    300: "Nature's Peace",
+    301: "Azurewrath",
+    302: "Seraph's Hymn",
+    303: "Zakarum's Salvation",
+    304: "Fleshripper",
+    305: "Odium",
+    306: "Horizon's Tornado",
+    307: "Stone Crusher",
+    308: "Jade Talon",
+    309: "Shadow Dancer",
+    310: "Cerebus' Bite",
+    311: "Tyrael's Might",
+    312: "Soul Drainer",
+    313: "Rune Master",
+    314: "Death Cleaver",
+    315: "Executioner's Justice",
+    316: "Stoneraven",
+    317: "Leviathan",
+    318: "Larzuk's Champion",
+    319: "Wisp Projector",
+    320: "Gargoyle's Bite",
+    321: "Lacerator",
+    322: "Mang Song's Lesson",
+    323: "Viperfork",
+    324: "Ethereal Edge",
+    325: "Demonhorn's Edge",
+    326: "The Reaper's Toll",
+    327: "Spiritkeeper",
+    328: "Hellrack",
+    329: "Alma Negra",
+    330: "Darkforge Spawn",
+    331: "Widowmaker",
+    332: "Bloodraven's Charge",
+    333: "Ghostflame",
+    334: "Shadowkiller",
+    335: "Gimmershred",
+    336: "Griffon's Eye",
+    337: "Windhammer",
+    338: "Thunderstroke",
+    339: "Giant Maimer",
+    340: "Demon's Arch",
+    341: "Boneflame",
+    342: "Steelpillar",
+    343: "Nightwing's Veil",
+    344: "Crown of Ages",
+    345: "Andariel's Visage",
+    346: "Darkfear",
+    347: "Dragonscale",
+    348: "Steel Carapice",
+    349: "Medusa's Gaze",
+    350: "Ravenlore",
+    351: "Boneshade",
+    352: "Nethercrow",
+    353: "Flamebellow",
+    354: "Fathom",
+    355: "Wolfhowl",
+    356: "Spirit Ward",
+    357: "Kira's Guardian",
+    358: "Ormus Robes",
+    359: "Gheed's Fortune",
+    360: "Stormlash",
+    361: "Halaberd's Reign",
+    362: "Warriv's Warder",
+    363: "Spike Thorn",
+    364: "Dracul's Grasp",
+    365: "Frostwind",
+    366: "Templar's Might",
+    367: "Eschuta's Temper",
+    368: "Firelizard's Talons",
+    369: "Sandstorm Trek",
+    370: "Marrowwalk",
+    371: "Heaven's Light",
+    372: "Merman's Speed",
+    373: "Arachnid Mesh",
+    374: "Nosferatu's Coil",
+    375: "Metalgrid",
+    376: "Verdugo's Hearty Cord",
+    377: "Sigurd's Staunch",
+    378: "Carrion Wind",
+    379: "Giantskull",
+    380: "Ironward",
+    381: "Annihilus",
+    382: "Arioc's Needle",
+    383: "Cranebeak",
+    384: "Nord's Tenderizer",
+    385: "Earthshifter",
+    386: "Wraithflight",
+    387: "Bonehew",
+    388: "Ondal's Wisdom",
+    389: "The Reedeemer",
+    390: "Headhunter's Glory",
+    391: "Steelrend",
+    392: "Rainbow Facet",
+    393: "Rainbow Facet",
+    394: "Rainbow Facet",
+    395: "Rainbow Facet",
+    396: "Rainbow Facet",
+    397: "Rainbow Facet",
+    398: "Rainbow Facet",
+    399: "Rainbow Facet",
+    400: "Hellfire Torch",
+}
@@ -0,0 +1,226 @@
+"""The magical properties that can be found on items."""
+
+
+#
+# The way this structure is setup is to integrate with
+# the bit parsing done on each object. Read a 9 bit flag,
+# find the magical property listed here, read the number of bits
+# for each argument (arg0), subtract the bias, if present,
+# and format each of the obtained arguments against the final string.
+#
+MAGICAL_PROPERTIES = {
+    0: ([8], 32, "+{0} to Strength"),
+    1: ([7], 32, "+{0} to Energy"),
+    2: ([7], 32, "+{0} to Dexterity"),
+    3: ([7], 32, "+{0} to Vitality"),
+    7: ([9], 32, "+{0} to Life"),
+    9: ([8], 32, "+{0} to Mana"),
+    11: ([8], 32, "+{0} to Maximum Stamina"),
+    16: ([9], None, "+{0}% Enhanced Defense"),
+    # two arguments here, probably minimum and maximum damage
+    17: ([9, 9], None, "+{0}% Enhanced Damage"),
+    19: ([10], None, "+{0} to Attack Rating"),
+    20: ([6], None, "+{0}% Increased Chance of Blocking"),
+    21: ([6], None, "+{0} to Minimum 1-handed Damage"),
+    22: ([7], None, "+{0} to Maximum 1-handed Damage"),
+    23: ([6], None, "+{0} to Minimum 2-handed Damage"),
+    24: ([7], None, "+{0} to Maximum 2-handed Damage"),
+    27: ([8], None, "Regenerate Mana {0}%"),
+    28: ([8], None, "Heal Stamina {0}%"),
+    31: ([11], 10, "+{0} Defense"),
+    32: ([9], None, "+{0} vs. Missile"),
+    33: ([8], 10, "+{0} vs. Melee"),
+    34: ([6], None, "Damage Reduced by {0}"),
+    35: ([6], None, "Magic Damage Reduced by {0}"),
+    36: ([8], None, "Damage Reduced by {0}%"),
+    # magic resistances
+    37: ([8], None, "Magic Resist +{0}%"),
+    38: ([8], None, "+{0}% to Maximum Magic Resist"),
+    39: ([8], 50, "Fire Resist +{0}%"),
+    40: ([5], None, "+{0}% to Maximum Fire Resist"),
+    41: ([8], 50, "Lightning Resist +{0}%"),
+    42: ([5], None, "+{0}% to Maximum Lightning Resist"),
+    43: ([8], 50, "Cold Resist +{0}%"),
+    44: ([5], None, "+{0}% to Maximum Cold Resist"),
+    45: ([8], 50, "Poison Resist +{0}%"),
+    46: ([5], None, "+{0}% to Maximum Poison Resist"),
+    # magic damages
+    48: ([8, 9], None, "Adds {0}-{1} Fire Damage"),
+    49: ([9], None, "+{0} to Maximum Fire Damage"),  # proven
+    50: ([6, 10], None, "Adds {0}-{1} Lightning Damage"),
+    51: ([9], None, "+{0} to Maximum Lightning Damage"),  # guess
+    52: ([8, 9], None, "Adds {0}-{1} Magic Damage"),
+    53: ([9], None, "+{0} to Maximum Magic Damage"),  # guess
+    # 54: ([8, 9], None, "Adds {0}-{1} Cold Damage"),
+    54: ([8, 9, 8], None, "Adds {0}-{1} Cold Damage"),
+    55: ([9], None, "+{0} to Maximum Cold Damage"),  # guess
+    57: ([10, 10, 9], None, "Adds {0}-{1} Poison Damage over {2} Seconds"),
+    # life/mana steal
+    60: ([7], None, "{0}% Life Stolen Per Hit"),
+    62: ([7], None, "{0}% Mana Stolen Per Hit"),
+    # general defensive properties
+    73: ([8], None, "+{0} Maximum Durability"),
+    74: ([6], 30, "Replenish Life +{0}"),
+    75: ([7], 20, "Increase Maximum Durability {0}%"),
+    76: ([6], 10, "Increase Maximum Life {0}%"),
+    77: ([6], 10, "Increase Maximum Mana {0}%"),
+    78: ([7], None, "Attacker Takes Damage of {0}"),
+    # greed
+    79: ([9], 100, "{0}% Extra Gold from Monsters"),
+    80: ([8], 100, "{0}% Better Chance of Getting Magic Items"),
+    81: ([7], None, "Knockback"),
+    83: ([3, 3], None, "+{1} to {0} Skill Levels"),
+    84: ([3, 3], None, "+{1} to {0} Skill Levels"),
+    85: ([9], 50, "{0}% To Experience Gained"),
+    86: ([7], None, "+{0} Life After Each Kill"),
+    87: ([7], None, "Reduces Prices {0}%"),
+    89: ([4], 4, "+{0} to Light Radius"),
+    90: ([5], None, "Ambient Light"),
+    91: ([8], 100, "Requirements {0}%"),
+    92: ([7], None, "Level Requirements +{0} (Invisible)"),
+    # speed
+    93: ([7], 20, "{0}% Increased Attack Speed"),
+    96: ([7], 20, "{0}% Faster Run/Walk"),
+    # ?
+    97: ([9, 6], None, "+{1} To {0}"),
+    98: ([8, 1], None, "{1}+ to {0} (Visual effect only)"),
+    99: ([7], 20, "{0}% Faster Hit Recovery"),
+    102: ([7], 20, "{0}% Faster Block Rate"),
+    105: ([7], 20, "{0}% Faster Cast Rate"),
+    107: ([9, 3], None, "+{1} To {0}"),
+    108: ([1], None, "Rest In Peace"),
+    # individual skills
+    109: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    181: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    182: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    183: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    184: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    185: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    186: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    187: ([9, 5], None, "+{1} to spell {0} (char_class Only)"),
+    110: ([8], 20, "Poison Length Reduced by {0}%"),
+    111: ([9], 20, "Damage +{0}"),
+    112: ([7], None, "Hit Causes Monsters to Flee {0}%"),
+    113: ([7], None, "Hit Blinds Target +{0}"),
+    114: ([6], None, "{0}% Damage Taken Goes to Mana"),
+    115: ([1], None, "Ignore Target Defense"),
+    116: ([7], None, "{0}% Target Defense"),
+    117: ([7], None, "Prevent Monster Heal"),
+    118: ([1], None, "Half Freeze Duration"),
+    119: ([9], 20, "{0}% Bonus to Attack Rating"),
+    120: ([7], 128, "{0} to Monster Defense Per Hit"),
+    121: ([9], 20, "+{0}% Damage to Demons"),
+    122: ([9], 20, "+{0}% Damage to Undead"),
+    123: ([10], 128, "+{0} to Attack Rating against Demons"),
+    124: ([10], 128, "+{0} to Attack Rating against Undead"),
+    126: ([3, 3], None, "+{0} to Fire Skills"),
+    127: ([3], None, "+{0} to All Skill Levels"),
+    128: ([5], None, "Attacker Takes Lightning Damage of {0}"),
+    134: ([5], None, "Freezes Target +{0}"),
+    135: ([7], None, "{0}% Chance of Open Wounds"),
+    136: ([7], None, "{0}% Chance of Crushing Blow"),
+    137: ([7], None, "+{0} Kick Damage"),
+    138: ([7], None, "+{0} to Mana After Each Kill"),
+    139: ([7], None, "+{0} Life after each Demon Kill"),
+    140: ([7], None, "Unknown"),
+    141: ([7], None, "{0}% Deadly Strike"),
+    142: ([7], None, "Fire Absorb {0}%"),
+    143: ([7], None, "+{0} Fire Absorb"),
+    144: ([7], None, "Lightning Absorb {0}%"),
+    145: ([7], None, "+{0} Lightning Absorb"),
+    146: ([7], None, "Magic Absorb {0}%"),
+    147: ([7], None, "+{0} Magic Absorb"),
+    148: ([7], None, "Cold Absorb {0}%"),
+    149: ([7], None, "+{0} Cold Absorb"),
+    150: ([7], None, "Slows Target by {0}%"),
+    151: ([9, 5], None, "Level +{1} {0} When Equipped"),
+    152: ([1], None, "Indestructible"),
+    153: ([1], None, "Cannot Be Frozen"),
+    154: ([7], 20, "{0}% Slower Stamina Drain"),
+    155: ([10, 7], None, "{0}% Chance to Reanimate Target"),
+    156: ([7], None, "Piercing Attack"),
+    157: ([7], None, "Fires Magic Arrows"),
+    158: ([7], None, "Fires Explosive Arrows or Bolts"),
+    159: ([6], None, "+{0} to Minimum Throw Damage"),
+    160: ([7], None, "+{0} to Maximum Throw Damage"),
+    179: ([3], None, "+{0} to Druid Skill Levels"),
+    180: ([3], None, "+{0} to Assassin Skill Levels"),
+    188: ([3, 13, 3], None, "+{2} to {0} Skills ({1} only)"),
+    189: ([10, 9], None, "+{0} to {1} Skills (char_class Only)"),
+    190: ([10, 9], None, "+{0} to {1} Skills (char_class Only)"),
+    191: ([10, 9], None, "+{0} to {1} Skills (char_class Only)"),
+    192: ([10, 9], None, "+{0} to {1} Skills (char_class Only)"),
+    193: ([10, 9], None, "+{0} to {1} Skills (char_class Only)"),
+    194: ([4], None, "Adds {0} extra sockets to the item"),
+    195: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} When you die"),
+    196: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} When you die"),
+    197: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} When you die"),
+    198: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} On Striking"),
+    199: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} On Striking"),
+    200: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} On Striking"),
+    201: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} When Struck"),
+    202: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} When Struck"),
+    203: ([6, 10, 7], None, "{2}% Chance to Cast Level {0} {1} When Struck"),
+    204: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    205: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    206: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    207: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    208: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    209: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    210: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    211: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    212: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    213: ([6, 10, 8, 8], None, "Level {0} {1} ({2}/{3} Charges)"),
+    214: ([6], None, "+{0} to Defense (Based on Character Level)"),
+    215: ([6], None, "{0}% Enhanced Defense (Based on Character Level)"),
+    216: ([6], None, "+{0} to Life (Based on Character Level)"),
+    217: ([6], None, "+{0} to Mana (Based on Character Level)"),
+    218: ([6], None, "+{0} to Maximum Damage (Based on Character Level)"),
+    219: ([6], None, "{0}% Enhanced Maximum Damage (Based on Character Level)"),
+    220: ([6], None, "+{0} to Strength (Based on Character Level)"),
+    221: ([6], None, "+{0} to Dexterity (Based on Character Level)"),
+    222: ([6], None, "+{0} to Energy (Based on Character Level)"),
+    223: ([6], None, "+{0} to Vitality (Based on Character Level)"),
+    224: ([6], None, "+{0} to Attack Rating (Based on Character Level)"),
+    225: ([6], None, "{0}% Bonus to Attack Rating (Based on Character Level)"),
+    226: ([6], None, "+{0} Cold Damage (Based on Character Level)"),
+    227: ([6], None, "+{0} Fire Damage (Based on Character Level)"),
+    228: ([6], None, "+{0} Lightning Damage (Based on Character Level)"),
+    229: ([6], None, "+{0} Poison Damage (Based on Character Level)"),
+    230: ([6], None, "Cold Resist +{0}% (Based on Character Level)"),
+    231: ([6], None, "Fire Resist +{0}% (Based on Character Level)"),
+    232: ([6], None, "Lightning Resist +{0}% (Based on Character Level)"),
+    233: ([6], None, "Poison Resist +{0}% (Based on Character Level)"),
+    234: ([6], None, "+{0} Cold Absorb (Based on Character Level)"),
+    235: ([6], None, "+{0} Fire Absorb (Based on Character Level)"),
+    236: ([6], None, "+{0} Lightning Absorb (Based on Character Level)"),
+    237: ([6], None, "{0} Poison Absorb (Based on Character Level)"),
+    238: ([5], None, "Attacker Takes Damage of {0} (Based on Character Level)"),
+    239: ([6], None, "{0}% Extra Gold from Monsters (Based on Character Level)"),
+    240: ([6], None, "{0}% Better Chance of Getting Magic Items (Based on Character Level)"),
+    241: ([6], None, "Heal Stamina Plus {0}% (Based on Character Level)"),
+    242: ([6], None, "+{0} Maxmium Stamina (Based on Character Level)"),
+    243: ([6], None, "{0}% Damage to Demons (Based on Character Level)"),
+    244: ([6], None, "{0}% Damage to Undead (Based on Character Level)"),
+    245: ([6], None, "+{0} to Attack Rating against Demons (Based on Character Level)"),
+    246: ([6], None, "+{0} to Attack Rating against Undead (Based on Character Level)"),
+    247: ([6], None, "{0}% Chance of Crushing Blow (Based on Character Level)"),
+    248: ([6], None, "{0}% Chance of Open Wounds (Based on Character Level)"),
+    249: ([6], None, "+{0} Kick Damage (Based on Character Level)"),
+    250: ([6], None, "{0}% to Deadly Strike (Based on Character Level)"),
+    252: ([6], None, "Repairs 1 Durability in {0} Seconds"),
+    253: ([6], None, "Replenishes Quantity"),
+    254: ([8], None, "Increased Stack Size"),
+    305: ([8], None, "{0} Pierce Cold"),
+    306: ([8], None, "{0} Pierce Fire"),
+    307: ([8], None, "{0} Pierce Lightning"),
+    329: ([9], 50, "{0}% To Fire Skill Damage"),
+    330: ([9], 50, "{0}% To Lightning Skill Damage"),
+    331: ([9], 50, "{0}% To Cold Skill Damage"),
+    332: ([9], 50, "{0}% To Poison Skill Damage"),
+    333: ([8], None, "-{0}% To Enemy Fire Resistance"),
+    334: ([8], None, "-{0}% To Enemy Lightning Resistance"),
+    335: ([8], None, "-{0}% To Enemy Cold Resistance"),
+    336: ([8], None, "-{0}% To Enemy Poison Resistance"),
+    356: ([2], None, "Quest Item Difficulty +{0} (Invisible)"),
+}
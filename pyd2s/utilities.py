@@ -10,8 +10,12 @@ from zipfile import ZipFile
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 backup_dir = os.path.join(base_dir, "backup")
+cache_dir = os.path.join(base_dir, "cache")
 save_dir = os.path.expanduser("~/.wine/drive_c/users/default/Saved Games/Diablo II/")
 
+# each byte value with the order of its bits reversed, for use with bytes.translate
+REVERSED_BYTES = bytes(int("{:08b}".format(i)[::-1], 2) for i in range(256))
+
 
 """
 
@@ -200,6 +204,13 @@ def rbits(element, length):
         raise Exception("Type not yet implemented: %r" % type(element))
 
 
+def reverse_bits(value, length):
+    """Reverse the order of the lowest 'length' bits of an integer."""
+    size = (length + 7) >> 3
+    reversed_value = int.from_bytes(value.to_bytes(size, "little").translate(REVERSED_BYTES), "big")
+    return reversed_value >> ((size << 3) - length)
+
+
 def restore_backup(zip_file):
 
     # ensure the zip file exists before anything is removed
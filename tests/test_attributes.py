@@ -0,0 +1,52 @@
+# standard imports
+from io import BytesIO
+
+# installed imports
+import pytest
+
+# module imports
+from pyd2s.Attributes import Attributes, UnknownAttributeError
+from pyd2s.BitIO import BitWriter
+
+
+def attributes_binary(values):
+    writer = BitWriter(Attributes.MAGIC)
+    for flag, name, length, _ in Attributes.SPECIFICATION:
+        if name in values:
+            writer.write(flag, 9)
+            writer.write(values[name], length)
+    writer.write(0x1FF, 9)
+    return writer.to_bytes()
+
+
+def test_attributes():
+    binary = attributes_binary(dict(strength=30, life_current=50 * 256 + 128, life_max=120 * 256, gold=12345))
+    attributes = Attributes(BytesIO(binary + b"if"))
+    assert attributes.to_bytes() == binary
+
+    # fixed point values are kept exactly, and viewed as floats
+    assert attributes["life_current"] == 12928
+    assert attributes.life_current == 50.5
+    assert attributes.view("life_max") == 120.0
+    assert attributes.view("strength") == 30
+    assert attributes["mana_max"] == 0
+
+    attributes.life_max = 150.25
+    assert attributes["life_max"] == 38464
+    assert attributes.is_dirty
+    assert Attributes(BytesIO(attributes.to_bytes()))["life_max"] == 38464
+
+    # every attribute with a divisor is viewed through a property of its name
+    for _, name, _, divisor in Attributes.SPECIFICATION:
+        assert isinstance(getattr(Attributes, name, None), property) == (divisor is not None)
+
+
+def test_attributes_unknown_flag():
+    writer = BitWriter(Attributes.MAGIC)
+    writer.write(0, 9)
+    writer.write(30, 10)
+    writer.write(100, 9)
+    writer.write(0x1FF, 9)
+    with pytest.raises(UnknownAttributeError) as error:
+        Attributes(BytesIO(writer.to_bytes()))
+    assert (error.value.flag, error.value.position) == (100, 19)
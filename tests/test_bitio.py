@@ -0,0 +1,73 @@
+# standard imports
+from io import BytesIO
+
+# module imports
+from pyd2s.BitIO import BitIO, BitWriter
+
+
+def test_bitio_read_reversed():
+    bitio = BitIO(BytesIO(b"\xb3\x5c\x07"), rread=True, rvalues=True)
+    assert bitio.read(3, "bits") == 0b011
+    assert bitio.read(9, "bits") == 0b110010110
+    assert bitio.read(1, "byte") == b"\x75"
+    assert bitio.remaining == 4
+    assert bitio.handle.tell() == 3
+
+
+def test_bitio_read_ordered():
+    bitio = BitIO(BytesIO(b"\xb3\x5c"), rread=False, rvalues=False)
+    assert bitio.read(3, "bits") == 0b101
+    assert bitio.read(1, "byte") == b"\x9a"
+    assert bitio.read_bits(5) == 0b11100
+    assert bitio.to_bytes() == b"\xb3\x5c"
+
+
+def test_bitio_write():
+    for rread, rvalues in [(True, True), (False, False), (True, False), (False, True)]:
+        bitio = BitIO(rread=rread, rvalues=rvalues)
+        bitio.write(0x1B, 5, "bits")
+        bitio.write(0xABCD, 1, "short")
+        bitio.write(0x3, 3, "bits")
+        reader = BitIO(BytesIO(bitio.to_bytes()), rread=rread, rvalues=rvalues)
+        assert reader.read(5, "bits") == 0x1B
+        assert reader.read(1, "short") == 0xABCD
+        assert reader.read(3, "bits") == 0x3
+
+
+def test_bitwriter():
+    writer = BitWriter(b"JM")
+    writer.write(0x1B, 5)
+    writer.write(0xABCD, 16)
+    writer.write(0xFF, 3)
+    assert writer.to_binstring() == "11011" + "1011001111010101" + "111"
+    reader = BitIO(BytesIO(writer.to_bytes()[2:]), rread=True, rvalues=True)
+    assert writer.to_bytes()[:2] == b"JM"
+    assert reader.read(5, "bits") == 0x1B
+    assert reader.read(16, "bits") == 0xABCD
+    assert reader.read(3, "bits") == 0x7
+
+
+def test_bitio_end_byte():
+    # the bytes that the original string based reader gave: bits skipped by 'end_byte' are written back as zeros,
+    # and reading or writing continues at the next byte
+    expected = {
+        (True, True): (b"\x5c", 3, b"\x03\x5c\x03\xa5", b"\x13"),
+        (False, False): (b"\x5c", 0, b"\xa0\x5c\x00\xa5", b"\xb0"),
+        (True, False): (b"\x3a", 3, b"\x03\x5c\x03\xa5", b"\x13"),
+        (False, True): (b"\x3a", 0, b"\xa0\x5c\x00\xa5", b"\xb0"),
+    }
+    for (rread, rvalues), (byte, bits, written, skipped) in expected.items():
+        bitio = BitIO(BytesIO(b"\xb3\x5c\x07\xff"), rread=rread, rvalues=rvalues)
+        bitio.read(3, "bits")
+        bitio.end_byte()
+        assert bitio.read(1, "byte") == byte
+        assert bitio.read(2, "bits") == bits
+        bitio.end_byte()
+        bitio.write(0xA5, 1, "byte")
+        assert bitio.to_bytes() == written
+
+        bitio = BitIO(BytesIO(b"\xb3\x5c\x07\xff"), rread=rread, rvalues=rvalues)
+        bitio.read(5, "bits")
+        bitio.end_byte()
+        bitio.end_byte()
+        assert bitio.to_bytes() == skipped
@@ -0,0 +1,70 @@
+# standard imports
+import os
+from io import BytesIO
+
+# module imports
+from pyd2s.Cache import Cache
+from pyd2s.Items import Item, Items
+from pyd2s.Storage import Storage
+
+
+def write_storage(path, codes):
+    binary = b"JM" + len(codes).to_bytes(2, "little")
+    for code in codes:
+        item = Item()
+        item.set_code(code)
+        item.simple = True
+        binary += item.to_bytes()
+    with open(path, "wb") as f:
+        f.write(binary)
+    return binary
+
+
+def test_cache(tmp_path):
+    path = str(tmp_path / "storage.d2i")
+    binary = write_storage(path, ["r01", "r02"])
+
+    with Cache(str(tmp_path / "cache.sqlite3")) as cache:
+        first = cache.load_items(path)
+        second = cache.load_items(path)
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert second is not first and second.to_bytes() == binary and not second.is_dirty
+
+        # a changed file is parsed again, while a copy of a file is found by its contents
+        binary = write_storage(path, ["r03", "r04", "r05"])
+        assert cache.load_items(path).to_bytes() == binary
+        assert (cache.misses, cache.hits) == (2, 1)
+        copy = str(tmp_path / "copy.d2i")
+        with open(copy, "wb") as f:
+            f.write(binary)
+        assert cache.load_items(copy).to_bytes() == binary
+        assert (cache.misses, cache.hits) == (2, 2)
+
+        storage = Storage(path)
+        storage.read(cache=cache)
+        assert [item.code for item in storage] == ["r03", "r04", "r05"] and not storage.is_dirty
+
+    # entries are kept between sessions
+    with Cache(str(tmp_path / "cache.sqlite3")) as cache:
+        assert cache.load_items(path).to_bytes() == binary
+        assert cache.hits == 1
+
+
+def test_cache_eviction(tmp_path):
+    paths = [str(tmp_path / f"{index}.d2i") for index in range(3)]
+    for index, path in enumerate(paths):
+        write_storage(path, [f"r0{index + 1}"] * 2)
+
+    with Cache(str(tmp_path / "cache.sqlite3")) as cache:
+        cache.load_items(paths[0])
+        cache.load_items(paths[1])
+        cache.max_size = cache.size
+        cache.load_items(paths[0])
+
+        # the least recently used entry is removed once the limit is passed
+        cache.load_items(paths[2])
+        assert cache.size <= cache.max_size
+        cache.load_items(paths[0])
+        assert (cache.misses, cache.hits) == (3, 2)
+        cache.load_items(paths[1])
+        assert (cache.misses, cache.hits) == (4, 2)
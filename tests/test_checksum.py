@@ -1,10 +1,19 @@
 import os
 import sys
+from random import Random
 
 import pytest
 
 # installed imports
-from pyd2s.Game import Game, create_checksum_bytes, patch_checksum
+from pyd2s.Game import (
+    ChecksumError,
+    Game,
+    checksum,
+    checksum_step,
+    create_checksum_bytes,
+    patch_checksum,
+    verify_checksum,
+)
 from pyd2s.utilities import get_characters, get_character_save_file
 
 
@@ -23,3 +32,33 @@ def test_checksum_patch(characters):
         game = Game()
         game.from_file(save_file)
         assert game.original_binary == patch_checksum(game.original_binary)
+
+
+def test_checksum_vectorized():
+    random = Random(0)
+    samples = [bytes(5000), b"\xff" * 5000, bytes(random.choice([0, 1, 254, 255]) for _ in range(9000))]
+    samples.extend(bytes(random.randrange(256) for _ in range(random.randrange(9000))) for _ in range(20))
+    for data in samples:
+        assert checksum(data) == checksum_step(data)
+
+
+def test_checksum_vectorized_carry_at_chunk_end():
+    # a carry in the last bytes of a chunk makes the exact steps run past the end of the chunk
+    data = bytes(4040) + b"\xff" * 160
+    for value in (0, 0x80000000, 0xFFFFFFFE, 0xFFFF0000):
+        assert checksum(data, value) == checksum_step(data, value)
+
+    random = Random(2)
+    for _ in range(50):
+        data = bytes(4096 - random.randrange(1, 64)) + bytes(random.randrange(256) for _ in range(200))
+        value = random.getrandbits(32)
+        assert checksum(data, value) == checksum_step(data, value)
+
+
+def test_checksum_verify():
+    data = patch_checksum(b"\x55\xaa\x55\xaa" + bytes(range(256)) * 4)
+    assert verify_checksum(data)
+    corrupt = data[:100] + b"\x00" + data[101:]
+    assert not verify_checksum(corrupt)
+    with pytest.raises(ChecksumError):
+        Game().from_bytes(corrupt, verify=True)
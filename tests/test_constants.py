@@ -0,0 +1,54 @@
+# standard imports
+import os
+import subprocess
+import sys
+
+# installed imports
+import pytest
+
+# module imports
+from pyd2s import constants
+from pyd2s.constants import (
+    TYPE_ARMOR,
+    TYPE_NONE,
+    TYPE_TOME,
+    get_code,
+    get_item_catalog,
+    get_item_type,
+    get_type_id,
+    get_type_string,
+)
+
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def test_item_catalog():
+    catalog = get_item_catalog()
+    assert catalog["cap"].type_id == TYPE_ARMOR
+    assert catalog["cap"].category == "armor"
+    assert catalog["tbk"].type_id == TYPE_TOME
+    assert catalog["tbk"].has_quantity
+    assert catalog["gsv"].is_gem and not catalog["gsv"].is_rune
+    assert catalog["r01"].is_rune and not catalog["r01"].is_gem
+
+
+def test_item_catalog_lookups():
+    assert get_code("Cap") == "cap"
+    assert get_type_string("cap") == "Cap"
+    assert get_type_id("zzz") == TYPE_NONE
+    assert get_type_string("zzz") == "Unknown Code [zzz]"
+    assert get_item_type("zzz").category is None
+
+
+def test_lazy_tables():
+    # importing the game module does not load the large tables, numpy, colored, or the profiler
+    prefixes = ("pyd2s.tables", "numpy", "colored", "cProfile", "pstats")
+    code = f"import sys, pyd2s.Game; print(sorted(m for m in sys.modules if m.startswith({prefixes!r})))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=parent_dir, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+    assert constants.MAGICAL_PROPERTIES[0][2] == "+{0} to Strength"
+    assert "MAGICAL_PROPERTIES" in vars(constants)
+    with pytest.raises(AttributeError):
+        constants.NOT_A_TABLE
@@ -2,8 +2,11 @@
 import os
 import sys
 
+# installed imports
+import pytest
+
 # module imports
-from pyd2s.Game import Game
+from pyd2s.Game import CHARACTER_HEADER, HEADER, HEADER_OFFSETS, Game, patch_checksum, verify_checksum
 from pyd2s.utilities import get_character_save_file
 
 
@@ -14,3 +17,86 @@ def test_game_restore(characters):
         game = Game()
         game.from_file(save_file)
         assert game.original_binary == game.to_bytes()
+
+        # every section written again from its values, instead of from the bytes it was read from
+        for item in list(game.items) + list(game.corpse) + list(game.merc_items):
+            item.dirty = True
+        game.attributes.original_values = {}
+        game.original_values = None
+        assert game.original_binary == game.to_bytes()
+
+
+def test_game_peek_header():
+    fields = [b"\x55\xaa\x55\xaa", 96, HEADER.size, 0, 0, b"Amazon\x00x", b"\x20", b"\x03", 0, 87, 1234567890]
+    fields += [b"\x00" * 64, 6, 0, 0, 0, b"\x00" * 32, b"\x00\x00\x80", 77, 0, 0xDEADBEEF, 3, 1, 123456]
+    fields += [b"\x01" * 298, b"\x02" * 81, b"\x03" * 51]
+    data = HEADER.pack(*fields)
+
+    header = Game.peek_header(data)
+    assert "magic" not in header
+    assert header["file_version"] == 96 and header["file_size"] == HEADER.size
+    assert header["char_name"] == b"Amazon"
+    assert header["char_status"] == b"\x20" and header["char_progression"] == b"\x03"
+    assert header["char_class"] == 0 and header["char_level"] == 87 and header["last_played"] == 1234567890
+    assert header["lmb_skill"] == 6 and header["difficulty"] == b"\x00\x00\x80" and header["map_id"] == 77
+    assert header["merc_id"] == 0xDEADBEEF and header["merc_type"] == 1 and header["merc_exp"] == 123456
+    assert header["quests"] == b"\x01" * 298 and header["npc_intros"] == b"\x03" * 51
+
+    # only the character information is decoded from the beginning of a file
+    short = Game.peek_header(data[: CHARACTER_HEADER.size])
+    assert short["char_name"] == b"Amazon" and short["char_level"] == 87 and "quests" not in short
+
+    with pytest.raises(AssertionError):
+        Game.peek_header(b"\x00" * HEADER.size)
+
+
+def test_game_dirty(characters):
+    for name in characters:
+        save_file = get_character_save_file(name)
+        game = Game()
+        game.from_file(save_file)
+        assert not game.is_dirty
+        game.reset_akara()
+        assert game.is_header_dirty == (game.quests != game.original_values["quests"])
+        assert not game.items.is_dirty
+        if game.items:
+            game.items[0].dirty = True
+            assert game.items.is_dirty and game.is_dirty
+        assert game.to_bytes()[HEADER.size :] == game.original_binary[HEADER.size :]
+
+
+def test_game_header_offsets():
+    assert HEADER_OFFSETS["file_checksum"] == (12, 4)
+    assert HEADER_OFFSETS["char_level"] == (43, 1)
+    assert HEADER_OFFSETS["merc_exp"] == (187, 4)
+    assert HEADER_OFFSETS["quests"] == (335, 298)
+    assert HEADER_OFFSETS["npc_intros"] == (714, 51)
+
+
+def test_game_open_mmap(tmp_path):
+    fields = [b"\x55\xaa\x55\xaa", 96, HEADER.size + 64, 0, 0, b"Sorc", b"\x20", b"\x00", 1, 42, 1234567890]
+    fields += [b"\x00" * 64, 0, 0, 0, 0, b"\x00" * 32, b"\x00" * 3, 0, 0, 0, 0, 0, 0]
+    fields += [b"\x01" * 298, b"\x02" * 81, b"\x03" * 51]
+    path = tmp_path / "Sorc.d2s"
+    path.write_bytes(patch_checksum(HEADER.pack(*fields) + bytes(range(64))))
+
+    with Game.open_mmap(path) as game:
+        assert game.char_name == b"Sorc" and game.char_level == 42
+        game.char_level = 43
+        game.merc_exp = 1000
+        view = game.view("quests")
+        view[92] = 0x2
+        view.release()
+
+    data = path.read_bytes()
+    assert verify_checksum(data)
+    header = Game.peek_header(data)
+    assert header["char_level"] == 43 and header["merc_exp"] == 1000 and header["quests"][92] == 0x2
+    assert data[HEADER.size :] == bytes(range(64))
+
+    # changes are undone when an error is raised before they are flushed
+    with pytest.raises(KeyError):
+        with Game.open_mmap(path) as game:
+            game.char_level = 1
+            raise KeyError("char_level")
+    assert path.read_bytes() == data
@@ -0,0 +1,75 @@
+# standard imports
+from io import BytesIO
+
+# installed imports
+import numpy
+
+# module imports
+from pyd2s.constants import ITEM_SOCKETED, QUALITY_NORMAL
+from pyd2s.Items import Item, Items
+from pyd2s.ItemTable import ItemTable, PROPERTIES_MAGICAL, code_id
+from pyd2s.MagicalProperties import MagicalProperties, MagicalProperty
+
+
+def create_items():
+    rune = Item()
+    rune.set_code("r01")
+    rune.simple = True
+    rune.parent = ITEM_SOCKETED
+
+    cap = Item()
+    cap.set_code("cap")
+    cap.id, cap.quality, cap.level = 1234, QUALITY_NORMAL, 12
+    cap.defense, cap.durability_max, cap.durability_current = 3, 12, 10
+    cap.socketed, cap.sockets, cap.sockets_filled = True, [rune, None], 1
+    cap.magical_props = MagicalProperties()
+    prop = MagicalProperty(0)
+    prop.values = [5]
+    cap.magical_props.append(prop)
+
+    gem = Item()
+    gem.set_code("gcv")
+    gem.simple = True
+    gem.x, gem.y = 3, 2
+
+    binary = b"JM\x02\x00" + cap.to_bytes() + gem.to_bytes()
+    return binary, Items(BytesIO(binary))
+
+
+def test_item_table():
+    binary, items = create_items()
+    table = items.to_table()
+    assert len(table) == 3
+    assert table.codes() == ["cap", "r01", "gcv"]
+    assert list(table.socket) == [-1, 0, -1]
+    assert list(table.sockets) == [2, 0, 0]
+    assert list(table.defense) == [3, -1, -1]
+    assert list(table.x) == [0, 0, 3]
+    assert list(table.has_code("r01", "gcv")) == [False, True, True]
+    assert list(table.has_property(0)) == [True, False, False]
+    assert list(table.property_item) == [0] and list(table.property_list) == [PROPERTIES_MAGICAL]
+    assert table.property_values[0, 0] == 5
+
+    # an unchanged table creates the same items back
+    assert Items.from_table(table).to_bytes() == binary
+    assert not any(item.is_dirty for item in Items.from_table(table))
+
+
+def test_item_table_changes():
+    _, items = create_items()
+    table = ItemTable(items)
+
+    # vectorized changes to the columns are applied to the items created from them
+    table.x[table.has_code("gcv")] += 1
+    table.code[table.code == code_id("r01")] = code_id("r02")
+    table.property_values[table.property_flag == 0, 0] = 9
+    changed = Items.from_table(table)
+    assert changed[1].x == 4 and changed.is_dirty
+    assert changed[0].sockets[0].code == "r02"
+    assert changed[0].magical_props[0].values == [9]
+
+    # and written to their bytes
+    written = Items(BytesIO(changed.to_bytes()))
+    assert numpy.array_equal(written.to_table().x, table.x)
+    assert written[0].sockets[0].code == "r02"
+    assert written[0].magical_props[0].values == [9]
@@ -1,9 +1,20 @@
 # standard imports
 import os
+import pickle
 import sys
+from copy import deepcopy
+from io import BytesIO
+
+# installed imports
+import pytest
 
 # module imports
+from pyd2s.BitIO import BitIO, BitWriter
 from pyd2s.Game import Game
+from pyd2s.Items import Item, Items, RecreationError, Verification, VERIFY_OFF, VERIFY_SAMPLED, VERIFY_STRICT
+from pyd2s.constants import QUALITY_NORMAL
+from pyd2s.MagicalProperties import MagicalProperties, MagicalProperty, UnknownPropertyError
+from pyd2s.synthetic import synthetic_game_bytes
 from pyd2s.utilities import get_character_save_file
 
 
@@ -14,10 +25,146 @@ def test_items(characters):
         game = Game()
         game.from_file(save_file)
         for item in game.items:
-            assert item.original_binary == item.to_bytes()
+            assert item.original_binary == item.encode()
     #
     # name = 'Laenii'
     # save_file = get_character_save_file(name)
     # game = Game()
     # game.from_file(save_file)
     # assert game.original_binary == game.to_string()
+
+
+def test_items_lazy(characters):
+    for name in characters:
+        save_file = get_character_save_file(name)
+        game = Game()
+        game.from_file(save_file, lazy=True)
+        assert game.original_binary == game.to_bytes()
+        for item in game.items:
+            assert not item.is_dirty
+            assert item.original_binary == item.encode()
+            assert not item.is_dirty
+
+
+def test_items_verification():
+    item = Item()
+    item.set_code("r01")
+    item.simple = True
+    binary = item.to_bytes()
+
+    # the unknown bit after 'ethereal' is always written as set, so clear it in the original
+    corrupt = binary[:4] + bytes([binary[4] ^ 0x80]) + binary[5:]
+
+    verification = Verification(VERIFY_SAMPLED, sample=2)
+    for _ in range(3):
+        Item(BytesIO(binary), verification=verification)
+    assert verification.counters == {"items": 3, "checked": 2, "passed": 2, "failed": 0}
+
+    verification = Verification(VERIFY_OFF)
+    Item(BytesIO(corrupt), verification=verification)
+    assert verification.counters["checked"] == 0
+
+    verification = Verification(VERIFY_SAMPLED)
+    Item(BytesIO(corrupt), verification=verification)
+    assert verification.counters["failed"] == 1
+
+    with pytest.raises(RecreationError):
+        Item(BytesIO(corrupt), verification=Verification(VERIFY_STRICT))
+
+
+def test_items_dirty():
+    item = Item()
+    item.set_code("r01")
+    item.simple = True
+    binary = item.to_bytes()
+
+    # the unknown bit after 'ethereal' is written as set, so an item read with it clear is kept as it was
+    corrupt = binary[:4] + bytes([binary[4] ^ 0x80]) + binary[5:]
+    original = b"JM\x02\x00" + corrupt + binary
+    items = Items(BytesIO(original), verification=Verification(VERIFY_OFF))
+    assert not items.is_dirty
+    assert items.to_bytes() == original
+
+    items[1].x = 1
+    assert items[1].is_dirty and items.is_dirty and not items[0].is_dirty
+    assert items.to_bytes()[: 4 + len(corrupt)] == original[: 4 + len(corrupt)]
+    assert Item(BytesIO(items.to_bytes()[4 + len(corrupt) :])).x == 1
+
+    items.pop()
+    items.append(Item(BytesIO(binary)))
+    assert items.is_dirty and not items[1].is_dirty
+
+
+def test_items_slots():
+    item = Item()
+    item.set_code("cap")
+    item.id, item.quality = 1234, QUALITY_NORMAL
+    item.defense, item.durability_max, item.durability_current = 3, 12, 12
+    item.magical_props = MagicalProperties(BitIO(BytesIO(b"\xff\xff")))
+    prop = MagicalProperty(0)
+    prop.values = [5]
+    item.magical_props.append(prop)
+    assert not hasattr(item, "__dict__") and not hasattr(prop, "__dict__")
+    assert prop.lengths is MagicalProperty(0).lengths
+
+    # copies keep the values set and stay unchanged until they are modified
+    copy = pickle.loads(pickle.dumps(Item(BytesIO(item.to_bytes()))))
+    assert not copy.is_dirty and copy.magical_props[0].values == [5]
+    assert copy.to_bytes() == item.to_bytes()
+
+
+def test_magical_properties_read():
+    # flag 54 has three values without a bias, flag 0 a single value with a bias of 32
+    properties = MagicalProperties()
+    properties.extend([MagicalProperty(54, [3, 300, 100]), MagicalProperty(0, [-12])])
+    writer = BitWriter()
+    properties.to_bitwriter(writer)
+    read = MagicalProperties(BitIO(BytesIO(writer.to_bytes()), rread=True, rvalues=True))
+    assert [(prop.flag, prop.values) for prop in read] == [(54, [3, 300, 100]), (0, [-12])]
+
+    # an unknown flag is reported with where it was read
+    writer = BitWriter()
+    MagicalProperty(0, [-12]).to_bitwriter(writer)
+    writer.write(500, 9)
+    with pytest.raises(UnknownPropertyError) as error:
+        MagicalProperties(BitIO(BytesIO(writer.to_bytes()), rread=True, rvalues=True))
+    assert (error.value.flag, error.value.position) == (500, 17)
+
+
+def test_items_dirty_in_place():
+    game = Game()
+    game.from_bytes(synthetic_game_bytes(seed=4, items=64))
+    items = [item for item in game.items if not item.simple]
+    assert not game.is_dirty
+
+    # each change is made in place, without setting an attribute of the item
+    changes = [
+        lambda item: item.magical_props and item.magical_props[0].max(),
+        lambda item: item.magical_props and item.magical_props[0].values.__setitem__(0, 0),
+        lambda item: item.magical_props is not None and item.magical_props.append(MagicalProperty(0, [-12])),
+        lambda item: item.sockets and item.sockets.__setitem__(0, None),
+        lambda item: item.magical_name_prefixes and item.magical_name_prefixes.__setitem__(0, 1),
+        lambda item: item.set_props and item.set_props[0].pop(),
+        lambda item: item.runeword_props and item.runeword_props.clear(),
+    ]
+    for change in changes:
+        game = Game()
+        game.from_bytes(synthetic_game_bytes(seed=4, items=64))
+        changed = 0
+        for item in game.items:
+            if item.simple:
+                continue
+            before = item.encode()
+            change(item)
+            if item.encode() != before:
+                changed += 1
+                assert item.is_dirty and item.to_bytes() == item.encode()
+        assert changed and game.is_dirty
+
+    # items copied or read back from a pickle are only changed if they were, and setting a property marks it
+    game = Game()
+    game.from_bytes(synthetic_game_bytes(seed=4, items=64))
+    assert not pickle.loads(pickle.dumps(game.items)).is_dirty and not deepcopy(game.items).is_dirty
+    item = next(item for item in game.items if item.magical_props)
+    item.magical_props[0].flag = item.magical_props[0].flag
+    assert item.is_dirty and pickle.loads(pickle.dumps(item)).is_dirty
@@ -0,0 +1,52 @@
+# standard imports
+import io
+
+# module imports
+from pyd2s.Game import Game
+from pyd2s.Metrics import Histogram, Metrics, metrics, profiling
+from pyd2s.decorators import Timed
+from pyd2s.synthetic import synthetic_game_bytes
+
+
+def test_histogram():
+    histogram = Histogram()
+    for value in (1, 2, 3, 100):
+        histogram.add(value)
+    assert (histogram.count, histogram.total, histogram.minimum, histogram.maximum) == (4, 106, 1, 100)
+    assert histogram.quantile(0.5) == 4
+    assert histogram.quantile(1) == 100
+
+
+def test_timed():
+    registry = Metrics()
+
+    @Timed("stage", registry)
+    def function(value):
+        return value * 2
+
+    # nothing is recorded while the registry is disabled
+    assert function(2) == 4
+    assert not registry.histograms
+
+    registry.enable()
+    assert function(3) == 6
+    assert registry.histograms["stage"].count == 1
+
+
+def test_profiling():
+    data = synthetic_game_bytes(seed=1, items=20)
+    metrics.reset()
+    stream = io.StringIO()
+    with profiling(stream=stream):
+        game = Game()
+        game.from_bytes(data)
+        game.to_bytes()
+    assert not metrics.enabled
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["items_parsed"] >= 20
+    assert snapshot["counters"]["bits_read"] > 0
+    for stage in ("parse.game", "parse.header", "parse.attributes", "parse.items", "encode.game", "checksum"):
+        assert snapshot["histograms"][stage]["count"] >= 1
+    assert "parse.items" in stream.getvalue()
+    metrics.reset()
@@ -0,0 +1,45 @@
+# standard imports
+import os
+
+# module imports
+from pyd2s.Game import CHARACTER_HEADER, HEADER, read_header
+from pyd2s.Roster import Roster
+
+
+def write_header(path, name, level):
+    fields = [b"\x55\xaa\x55\xaa", 96, HEADER.size, 0, 0, name, b"\x20", b"\x00", 1, level, 1234567890]
+    fields += [b"\x00" * 64, 0, 0, 0, 0, b"\x00" * 32, b"\x00" * 3, 0, 0, 0, 0, 0, 0]
+    with open(path, "wb") as f:
+        f.write(CHARACTER_HEADER.pack(*fields) + b"\x00" * (HEADER.size - CHARACTER_HEADER.size))
+
+
+def test_read_header(tmp_path):
+    path = tmp_path / "Sorc.d2s"
+    write_header(path, b"Sorc", 42)
+    header = read_header(path)
+    assert header["char_name"] == b"Sorc"
+    assert header["char_level"] == 42
+    assert header["last_played"] == 1234567890
+    assert "quests" not in header
+
+
+def test_roster_refresh(tmp_path):
+    write_header(tmp_path / "Sorc.d2s", b"Sorc", 42)
+    write_header(tmp_path / "Bar.d2s", b"Bar", 7)
+    (tmp_path / "Bar.key").write_bytes(b"")
+    (tmp_path / "Short.d2s").write_bytes(b"\x55\xaa\x55\xaa")
+
+    roster = Roster(tmp_path).refresh()
+    assert sorted(roster) == ["Bar", "Sorc"]
+    assert roster["Bar"]["char_level"] == 7
+    assert "Short" in roster.errors
+
+    # only changed files are read again
+    roster["Sorc"]["cached"] = True
+    write_header(tmp_path / "Bar.d2s", b"Bar", 8)
+    os.utime(tmp_path / "Bar.d2s", ns=(0, 1))
+    os.remove(tmp_path / "Short.d2s")
+    roster.refresh()
+    assert roster["Sorc"]["cached"]
+    assert roster["Bar"]["char_level"] == 8
+    assert not roster.errors
@@ -0,0 +1,52 @@
+# standard imports
+import json
+import os
+import subprocess
+import sys
+
+# module imports
+from pyd2s.Game import Game
+from pyd2s.constants import CLASS_STRINGS
+from pyd2s.scan import list_saves, scan_saves
+from pyd2s.synthetic import write_saves
+
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+
+def test_scan(tmp_path):
+    paths = write_saves(tmp_path, count=4, items=12, merc_items=3, seed=5)
+    assert list_saves(tmp_path) == sorted(paths)
+
+    for workers in (1, 2):
+        summaries = sorted(scan_saves(tmp_path, workers=workers), key=lambda summary: summary["file"])
+        assert [summary["file"] for summary in summaries] == sorted(paths)
+        for summary in summaries:
+            game = Game()
+            game.from_file(summary["file"])
+            assert summary["size"] == os.path.getsize(summary["file"])
+            assert summary["name"] == game.char_name.decode("latin-1")
+            assert summary["class"] == CLASS_STRINGS[game.char_class]
+            assert summary["level"] == game.char_level
+            assert summary["attributes"] == game.attributes.views()
+            assert summary["items"] == game.items.count == 12
+            assert summary["corpse_items"] == game.corpse.count
+            assert summary["merc_items"] == game.merc_items.count == 3
+
+    # the command writes a JSON line per file, and its throughput to stderr
+    command = [sys.executable, "-m", "pyd2s.scan", str(tmp_path), "--workers", "1"]
+    result = subprocess.run(command, cwd=parent_dir, capture_output=True, text=True, check=True)
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert sorted(line["file"] for line in lines) == sorted(paths)
+    assert result.stderr.strip().splitlines()[-1].startswith("Scanned 4 files (0 errors")
+
+
+def test_scan_errors(tmp_path):
+    (tmp_path / "broken.d2s").write_bytes(b"\x55\xaa\x55\xaa")
+    (tmp_path / "broken.key").write_bytes(b"")
+    assert list_saves(tmp_path) == [str(tmp_path / "broken.d2s")]
+    for workers in (1, 2):
+        summaries = list(scan_saves(tmp_path, workers=workers))
+        assert len(summaries) == 1
+        assert summaries[0]["file"] == str(tmp_path / "broken.d2s")
+        assert "error" in summaries[0]
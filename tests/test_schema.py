@@ -0,0 +1,51 @@
+# standard imports
+from io import BytesIO
+
+# module imports
+from pyd2s.BitIO import BitIO
+from pyd2s.Items import Item, Verification, VERIFY_STRICT
+from pyd2s.MagicalProperties import MagicalProperties
+from pyd2s.constants import QUALITY_RARE, QUALITY_STRINGS
+from pyd2s.schema import ItemKey, details_decoder, encoder, header_decoder
+
+
+def test_schema_compiles():
+    header_decoder()
+    encoder(ItemKey(True, None, False, False))
+    for quality in QUALITY_STRINGS:
+        for runeword in (False, True):
+            for socketed in (False, True):
+                key = ItemKey(False, quality, runeword, socketed)
+                encoder(key)
+                details_decoder(key)
+                details_decoder(key, lazy=True)
+
+
+def test_schema_symmetric():
+    item = Item()
+    item.set_code("rin")
+    item.identified = True
+    item.x, item.y = 3, 2
+    item.id, item.level, item.quality = 0x12345678, 50, QUALITY_RARE
+    item.name_id_first, item.name_id_last = 3, 4
+    item.magical_name_prefixes, item.magical_name_suffixes = [2, 0, 3], [0, 4, 0]
+    item.personalize("Tal")
+    item.magical_props = MagicalProperties(BitIO(BytesIO(b"\xff\x01"), rread=True, rvalues=True))
+
+    copy = Item(BytesIO(item.to_bytes()), verification=Verification(VERIFY_STRICT))
+    for attribute in (
+        "identified",
+        "x",
+        "y",
+        "code",
+        "id",
+        "level",
+        "quality",
+        "name_id_first",
+        "name_id_last",
+        "magical_name_prefixes",
+        "magical_name_suffixes",
+        "personalized_name",
+    ):
+        assert getattr(copy, attribute) == getattr(item, attribute)
+    assert copy.name.startswith("Tal's ")
@@ -0,0 +1,151 @@
+# module imports
+from pyd2s.constants import ITEM_SOCKETED, QUALITY_NORMAL, STORED_CUBE
+from pyd2s.Items import Item
+from pyd2s.MagicalProperties import MagicalProperties
+from pyd2s.Storage import Storage
+from pyd2s.StorageIndex import StorageIndex
+from pyd2s.StorageJournal import StorageJournal
+
+
+def write_storage(path):
+    rune = Item()
+    rune.set_code("r01")
+    rune.simple = True
+    rune.parent = ITEM_SOCKETED
+
+    cap = Item()
+    cap.set_code("cap")
+    cap.id, cap.quality = 1234, QUALITY_NORMAL
+    cap.defense, cap.durability_max, cap.durability_current = 3, 12, 10
+    cap.socketed, cap.sockets, cap.sockets_filled = True, [rune], 1
+    cap.magical_props = MagicalProperties()
+
+    gem = Item()
+    gem.set_code("gcv")
+    gem.simple = True
+    gem.stored = STORED_CUBE
+
+    storage = Storage(path)
+    storage.extend([cap, gem, gem])
+    storage.write()
+    return storage
+
+
+def test_storage_iter_items(tmp_path):
+    storage = write_storage(str(tmp_path / "storage.d2i"))
+    assert [item.code for item in storage.iter_items()] == ["cap", "gcv", "gcv"]
+
+    # items rejected by the predicate are skipped, the others are fully decoded with their sockets
+    headers = []
+    items = list(storage.iter_items(predicate=lambda item: headers.append(item.code) or item.code == "cap"))
+    assert headers == ["cap", "gcv", "gcv"]
+    assert len(items) == 1 and items[0].lazy_header is None
+    assert items[0].defense == 3 and items[0].sockets[0].code == "r01"
+    assert not items[0].is_dirty and items[0].to_bytes() == storage[0].to_bytes()
+
+    cubed = storage.iter_items(predicate=lambda item: item.stored == STORED_CUBE, lazy=True)
+    assert [item.code for item in cubed] == ["gcv", "gcv"]
+
+
+def test_storage_index(tmp_path):
+    storage = write_storage(str(tmp_path / "storage.d2i"))
+    cap, gem, rune = storage[0].to_bytes(), storage[1].to_bytes(), storage[0].sockets[0].to_bytes()
+    index = storage.index()
+    assert [(item_range.offset, item_range.length) for item_range in index] == [
+        (4, len(cap)),
+        (4 + len(cap), len(gem)),
+        (4 + len(cap) + len(gem), len(gem)),
+    ]
+    assert index[0].children == ((4 + len(cap) - len(rune), len(rune)),)
+    assert (tmp_path / "storage.d2i.idx").is_file() and Storage(storage.file_path).index() == index
+
+    # single items are decoded, removed, and added without reading the others
+    assert storage.read_item(1).code == "gcv" and storage.read_item(0).sockets[0].code == "r01"
+    storage.remove_items([1])
+    assert [item.code for item in storage.iter_items()] == ["cap", "gcv"]
+    storage.append_items([storage.read_item(0)])
+    assert [item.code for item in storage.iter_items()] == ["cap", "gcv", "cap"]
+    assert storage.read_item(2).sockets[0].code == "r01"
+
+    # the index kept up to date matches one built from the file again
+    assert StorageIndex.load(storage.file_path) == StorageIndex.build(storage.file_path)
+    storage.remove_items([0, 2])
+    with open(storage.file_path, "rb") as f:
+        assert f.read() == b"JM\x01\x00" + gem
+
+
+def test_storage_journal(tmp_path):
+    storage = write_storage(str(tmp_path / "storage.d2i"))
+    with open(storage.file_path, "rb") as f:
+        base = f.read()
+    gem = storage[1]
+
+    # changes are appended to the journal, leaving the storage file as it was
+    storage.log_add([gem, gem])
+    storage.log_remove([0])
+    with open(storage.file_path, "rb") as f:
+        assert f.read() == base
+    assert (tmp_path / "storage.d2i.log").is_file()
+
+    read = Storage(storage.file_path)
+    read.read()
+    assert [item.code for item in read] == ["gcv"] * 4
+
+    # an interrupted append leaves the records before it
+    with open(str(tmp_path / "storage.d2i.log"), "ab") as f:
+        f.write(b"\x01\xff\x00")
+    exported = Storage(str(tmp_path / "exported.d2i"))
+    storage.export(exported.file_path)
+    exported.read()
+    assert exported.to_bytes() == read.to_bytes() and not exported.is_dirty
+
+    # compaction writes the journal into the storage file
+    storage.journal_threshold = 0
+    storage.log_remove([3])
+    storage.compaction.join()
+    assert not (tmp_path / "storage.d2i.log").exists()
+    assert [item.code for item in storage.iter_items()] == ["gcv"] * 3
+    assert storage.read_item(2).code == "gcv"
+
+    # a journal left behind by an interrupted compaction does not follow the new storage file
+    storage.log_remove([0])
+    with open(str(tmp_path / "storage.d2i.log"), "rb") as f:
+        journal = f.read()
+    storage.compact()
+    with open(str(tmp_path / "storage.d2i.log"), "wb") as f:
+        f.write(journal)
+    read = Storage(storage.file_path)
+    read.read()
+    assert len(read) == 2
+
+
+def test_storage_journal_streaming(tmp_path, monkeypatch):
+    storage = write_storage(str(tmp_path / "storage.d2i"))
+    cap, gem = storage[0], storage[1]
+    storage.log_add([cap, gem])
+    storage.log_remove([0, 2])
+    storage.log_remove([2])
+    with open(storage.file_path, "rb") as f:
+        base = f.read()
+    with open(str(tmp_path / "storage.d2i.log"), "rb") as f:
+        journal = f.read()
+
+    # the journal is applied while streaming, without writing the storage file or the journal
+    read = Storage(storage.file_path)
+    read.read()
+    assert [item.code for item in read] == ["gcv", "cap"]
+    assert [item.to_bytes() for item in storage.iter_items()] == [item.to_bytes() for item in read]
+    assert [item.code for item in storage.iter_items(predicate=lambda item: item.code == "cap")] == ["cap"]
+    with open(storage.file_path, "rb") as f:
+        assert f.read() == base
+    with open(str(tmp_path / "storage.d2i.log"), "rb") as f:
+        assert f.read() == journal
+
+    # appending to a journal that has not changed since the last append does not read it again
+    def read_journal(self):
+        raise AssertionError("The journal was read.")
+
+    monkeypatch.setattr(StorageJournal, "read", read_journal)
+    storage.log_add([gem])
+    monkeypatch.undo()
+    assert [item.code for item in storage.iter_items()] == ["gcv", "cap", "gcv"]
@@ -0,0 +1,39 @@
+# module imports
+from pyd2s.constants import QUALITY_SET, QUALITY_STRINGS, SET_LIST_MAP
+from pyd2s.Game import Game, verify_checksum
+from pyd2s.Storage import Storage
+from pyd2s.synthetic import synthetic_game_bytes, synthetic_storage, write_saves
+
+
+def test_synthetic_game_round_trip():
+    data = synthetic_game_bytes(seed=7, items=64, merc_items=4)
+    assert data == synthetic_game_bytes(seed=7, items=64, merc_items=4)
+
+    game = Game()
+    game.from_bytes(data, verify=True)
+    assert game.to_bytes() == data
+    assert {item.quality for item in game.items if not item.simple} == set(QUALITY_STRINGS)
+    assert all(
+        len(item.set_props) == SET_LIST_MAP[item.name_id_last] for item in game.items if item.quality == QUALITY_SET
+    )
+    assert len(game.merc_items) == 4
+
+    # every item written again from its values gives the same bytes
+    for item in list(game.items) + list(game.merc_items):
+        item.dirty = True
+    assert game.to_bytes() == data
+
+
+def test_synthetic_storage(tmp_path):
+    storage = synthetic_storage(str(tmp_path / "storage.d2i"), seed=3, items=50)
+    read = Storage(storage.file_path)
+    read.read()
+    assert len(read) == 50
+    assert read.to_bytes() == (tmp_path / "storage.d2i").read_bytes()
+
+
+def test_write_saves(tmp_path):
+    paths = write_saves(str(tmp_path), count=2, items=10, storage_items=10)
+    assert [path.rsplit("/", 1)[-1] for path in paths] == ["Synthetic0000.d2s", "Synthetic0001.d2s", "storage.d2i"]
+    for path in paths[:2]:
+        assert verify_checksum(open(path, "rb").read())